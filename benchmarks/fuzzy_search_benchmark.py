@@ -0,0 +1,82 @@
+"""
+Fuzzy Search Benchmark
+=====================
+Compares three ways of finding every title within edit distance d of a mistyped query over a
+synthetic catalog: a brute-force scan (levenshtein() against every title, with the length
+filter and early cut-off), a BKTree and an NGramIndex. Queries are catalog titles with one
+or two random edits. Build times are reported separately from query times.
+
+Pure-Python index builds over a million titles take minutes (the BK-tree computes about 20
+distances per title), so the default catalog is 100,000 titles; pass 1000000 to run the full
+size.
+
+Run from the repository root:
+    python -m benchmarks.fuzzy_search_benchmark [titles] [queries]
+"""
+
+import random
+import string
+import sys
+import time
+
+from searching_algorithms.fuzzy_search import BKTree, NGramIndex, levenshtein
+
+WORDS = ["love", "night", "dark", "side", "moon", "blue", "heart", "road", "dream", "fire",
+         "river", "city", "gold", "rain", "wild", "star", "song", "home", "light", "storm"]
+
+
+def _mistype(title, rng, edits):
+    """Applies random insertions, deletions and substitutions."""
+    for _ in range(edits):
+        i = rng.randrange(len(title) + 1)
+        kind = rng.choice("ids")
+        if kind == "i" or i == len(title):
+            title = title[:i] + rng.choice(string.ascii_lowercase) + title[i:]
+        elif kind == "d":
+            title = title[:i] + title[i + 1:]
+        else:
+            title = title[:i] + rng.choice(string.ascii_lowercase) + title[i + 1:]
+    return title
+
+
+def _brute_force(titles, query, max_distance):
+    found = []
+    for title in titles:
+        if abs(len(title) - len(query)) <= max_distance:
+            distance = levenshtein(query, title, max_distance)
+            if distance <= max_distance:
+                found.append((distance, title))
+    found.sort(key=lambda pair: pair[0])
+    return found
+
+
+def run(titles=100_000, queries=20, max_distance=2, seed=0):
+    """Prints build times and mean query times for each method."""
+    rng = random.Random(seed)
+    catalog = [" ".join(rng.choices(WORDS, k=rng.randint(2, 4))) + f" {rng.randrange(1000)}"
+               for _ in range(titles)]
+    lookups = [_mistype(rng.choice(catalog), rng, rng.randint(1, max_distance)) for _ in range(queries)]
+    print(f"{titles} titles, {queries} queries, max distance {max_distance}")
+
+    methods = {"brute force": lambda q: _brute_force(catalog, q, max_distance)}
+    for name, build in (("BK-tree", BKTree), ("n-gram index", NGramIndex)):
+        start = time.perf_counter()
+        index = build(catalog)
+        print(f"{name:>13} build: {time.perf_counter() - start:8.2f}s")
+        methods[name] = lambda q, index=index: index.search(q, max_distance)
+
+    reference = None
+    for name, search in methods.items():
+        start = time.perf_counter()
+        results = [sorted(search(q)) for q in lookups]
+        elapsed = (time.perf_counter() - start) / queries
+        reference = reference or results
+        matches = sum(len(r) for r in results)
+        print(f"{name:>13} query: {elapsed * 1e3:8.2f} ms  ({matches} matches, "
+              f"same as brute force: {results == reference})")
+
+# Run the benchmark
+if __name__ == "__main__":
+    titles = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    queries = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    run(titles, queries)
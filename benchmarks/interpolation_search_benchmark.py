@@ -0,0 +1,80 @@
+"""
+Interpolation Search Benchmark
+=============================
+Compares binary_search_iterative with interpolation_search and
+interpolation_sequential_search on three key distributions:
+
+- uniform: evenly spread integers (IDs, timestamps), where interpolation shines
+- skewed: exponentially distributed values, where unguarded interpolation degrades to O(n)
+- clustered: a few tight clusters far apart, which misleads the first estimates
+
+Each search runs against a pre-validated SortedSequence, so the timings measure the searches
+themselves rather than the O(n) sortedness check. Probes are counted through a key function
+that increments a counter. Fewer probes pay off when a probe is expensive (a costly key
+function, or an array too large for the cache); for a small in-memory list of ints, Binary
+Search's simpler arithmetic per probe can still win on wall-clock time.
+
+Run from the repository root:
+    python -m benchmarks.interpolation_search_benchmark [size] [lookups]
+"""
+
+import random
+import sys
+import time
+
+from searching_algorithms.binary_search import binary_search_iterative
+from searching_algorithms.interpolation_search import (
+    interpolation_search,
+    interpolation_sequential_search,
+)
+from searching_algorithms.sorted_sequence import SortedSequence
+
+SEARCHES = [
+    ("binary", binary_search_iterative),
+    ("interpolation", interpolation_search),
+    ("interp-sequential", interpolation_sequential_search),
+]
+
+
+def make_datasets(size, seed=0):
+    """Builds sorted integer lists with uniform, skewed and clustered distributions."""
+    rng = random.Random(seed)
+    uniform = sorted(rng.randrange(size * 100) for _ in range(size))
+    skewed = sorted(int(rng.expovariate(1.0) ** 4 * 1000) for _ in range(size))
+    centres = [rng.randrange(10 ** 12) for _ in range(8)]
+    clustered = sorted(rng.choice(centres) + rng.randrange(size) for _ in range(size))
+    return {"uniform": uniform, "skewed": skewed, "clustered": clustered}
+
+
+def run(size=1_000_000, lookups=20_000, seed=0):
+    """Prints mean probes and microseconds per lookup for each search and distribution."""
+    rng = random.Random(seed)
+    print(f"{'distribution':<12} {'search':<18} {'probes/lookup':>14} {'µs/lookup':>10}")
+    for name, data in make_datasets(size, seed).items():
+        targets = [rng.choice(data) for _ in range(lookups)]
+        timed = SortedSequence(data, trusted=True)
+
+        for label, search in SEARCHES:
+            probes = 0
+
+            def counting_key(value):
+                nonlocal probes
+                probes += 1
+                return value
+
+            counted = SortedSequence(data, key=counting_key, trusted=True)
+            for t in targets[:1000]:
+                search(counted, t)
+
+            start = time.perf_counter()
+            for t in targets:
+                search(timed, t)
+            elapsed = time.perf_counter() - start
+
+            print(f"{name:<12} {label:<18} {probes / 1000:>14.1f} {elapsed / lookups * 1e6:>10.2f}")
+
+# Run the benchmark
+if __name__ == "__main__":
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    lookups = int(sys.argv[2]) if len(sys.argv) > 2 else 20_000
+    run(size, lookups)
@@ -0,0 +1,109 @@
+"""
+Snapshot Sequence Read Throughput Benchmark
+==========================================
+Measures binary-search throughput for 1, 2, 4 and 8 reader threads while a writer keeps
+inserting batches, for two designs: a SortedSequence guarded by one lock (readers and the
+writer all take it, and the writer holds it for a whole batch of insorts), and a
+SnapshotSequence (readers take a snapshot with no lock, and the writer publishes each batch
+as a new version).
+
+Under the GIL only one thread runs Python code at a time, so neither design scales with
+threads there; the difference is that locked readers also wait out every batch. Run it on a
+free-threaded build (python3.13t) with several cores to see lock-free reads scale.
+
+Run from the repository root:
+    python -m benchmarks.snapshot_benchmark [items] [seconds]
+"""
+
+import os
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from searching_algorithms.binary_search import binary_search_iterative
+from searching_algorithms.snapshot_sequence import SnapshotSequence
+from searching_algorithms.sorted_sequence import SortedSequence
+
+BATCH = 1_000
+
+
+class _LockedSequence:
+    """The baseline: one lock around a SortedSequence for every read and write."""
+    def __init__(self, data):
+        self._lock = threading.Lock()
+        self._sequence = SortedSequence(sorted(data), trusted=True)
+
+    def search(self, target):
+        with self._lock:
+            return binary_search_iterative(self._sequence, target)
+
+    def update(self, items):
+        with self._lock:
+            for item in items:
+                self._sequence.insert(item)
+
+
+class _Snapshots:
+    def __init__(self, data):
+        self._sequence = SnapshotSequence(data)
+
+    def search(self, target):
+        return binary_search_iterative(self._sequence.snapshot(), target)
+
+    def update(self, items):
+        self._sequence.update(items)
+
+
+def _measure(container, threads, seconds, universe):
+    """Returns (reads per second, batches published) over the given time."""
+    stop = threading.Event()
+
+    def writer():
+        rng = random.Random(1)
+        batches = 0
+        while not stop.is_set():
+            container.update(rng.randrange(universe) for _ in range(BATCH))
+            batches += 1
+            time.sleep(0.005)
+        return batches
+
+    def reader(seed):
+        rng = random.Random(seed)
+        reads = 0
+        while not stop.is_set():
+            for _ in range(100):
+                container.search(rng.randrange(universe))
+            reads += 100
+        return reads
+
+    with ThreadPoolExecutor(max_workers=threads + 1) as pool:
+        writing = pool.submit(writer)
+        readers = [pool.submit(reader, seed) for seed in range(threads)]
+        time.sleep(seconds)
+        stop.set()
+        reads = sum(future.result() for future in readers)
+        return reads / seconds, writing.result()
+
+
+def run(items=200_000, seconds=2.0, seed=0):
+    """Prints read throughput per thread count for both designs."""
+    rng = random.Random(seed)
+    universe = items * 10
+    data = [rng.randrange(universe) for _ in range(items)]
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"{items} items, {os.cpu_count()} CPUs, GIL {'enabled' if gil else 'disabled'}, "
+          f"writer inserts {BATCH} per batch")
+
+    for name, build in (("one lock", _LockedSequence), ("snapshots", _Snapshots)):
+        for threads in (1, 2, 4, 8):
+            throughput, batches = _measure(build(data), threads, seconds, universe)
+            print(f"{name:>10}, {threads} readers: {throughput:10.0f} reads/s  "
+                  f"({batches} batches written)")
+
+# Run the benchmark
+if __name__ == "__main__":
+    items = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    seconds = float(sys.argv[2]) if len(sys.argv) > 2 else 2.0
+    run(items, seconds)
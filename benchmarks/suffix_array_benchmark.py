@@ -0,0 +1,56 @@
+"""
+Suffix Array Build Benchmark
+===========================
+Builds the suffix array of a synthetic title corpus with each of the package's general
+sorting engines, and with list.sort as a baseline. Prefix doubling sorts every suffix once
+per round by an integer key, so this exercises the sorts on hundreds of thousands of
+integer keys with many duplicates and long presorted stretches, much like real data. Engines
+that cannot cope with such input (recursion depth) are reported as failed.
+
+Run from the repository root:
+    python -m benchmarks.suffix_array_benchmark [titles]
+"""
+
+import random
+import sys
+import time
+
+from searching_algorithms.suffix_array import SEPARATOR, build_suffix_array
+from sorting_algorithms.merge_sort import merge_sort
+from sorting_algorithms.quicksort import quick_sort
+from sorting_algorithms.timsort import timsort
+
+WORDS = ["the", "kill", "mocking", "bird", "sea", "old", "man", "war", "peace", "night",
+         "of", "and", "a", "great", "gatsby", "pride", "prejudice", "time", "lost", "moby"]
+
+
+def _builtin_sort(arr, key=None):
+    arr.sort(key=key)
+    return arr
+
+
+def run(titles=5_000, seed=0):
+    """Prints the build time of each sorting engine for a corpus of the given size."""
+    rng = random.Random(seed)
+    corpus = SEPARATOR.join(" ".join(rng.choices(WORDS, k=rng.randint(2, 6)))
+                            for _ in range(titles)) + SEPARATOR
+    print(f"{titles} titles, {len(corpus)} characters")
+
+    reference = None
+    for name, sort in (("list.sort", _builtin_sort), ("merge_sort", merge_sort),
+                       ("quick_sort", quick_sort), ("timsort", timsort)):
+        start = time.perf_counter()
+        try:
+            suffixes = build_suffix_array(corpus, sort)
+        except RecursionError:
+            # Quick Sort's partitions degenerate on the presorted, duplicate-heavy keys
+            print(f"{name:>12}: failed (recursion limit reached)")
+            continue
+        elapsed = time.perf_counter() - start
+        reference = reference or suffixes
+        print(f"{name:>12}: {elapsed:7.2f}s  (matches list.sort: {suffixes == reference})")
+
+# Run the benchmark
+if __name__ == "__main__":
+    titles = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000
+    run(titles)
@@ -6,13 +6,23 @@ Learning Objectives:
 - Data Structure Manipulation
 - Error Handling
 - Advanced Python Techniques
+
+Run from the repository root: python -m examples.album_system
 """
 
-from typing import List, Optional, Union
+from typing import Dict, List, Optional, Union
 from dataclasses import dataclass, field
 from enum import Enum, auto
 import uuid
 
+from searching_algorithms.fractional_cascading import FractionalCascade
+from searching_algorithms.fuzzy_search import BKTree
+from searching_algorithms.hash_index import HashIndex
+from searching_algorithms.prefix_search import RadixTree
+from searching_algorithms.result_cache import CacheInfo, ResultCache
+from searching_algorithms.sorted_sequence import SortedSequence
+from sorting_algorithms.merge_sort import merge_sort
+
 class AlbumGenre(Enum):
     """Enumerate possible music genres"""
     POP = auto()
@@ -118,10 +128,18 @@ class AlbumCollection:
     - Add/remove albums
     - Search and filter
     - Sorting and manipulation
+    - Release-year lookups across all genres at once
+    - Cached query results, invalidated by a version counter
     """
     def __init__(self):
         """Initialize an empty album collection"""
         self._albums: List[Album] = []
+        self.version = 0  # Incremented by every add and remove
+        self._results = ResultCache(maxsize=64)
+        self._by_name = HashIndex(key=lambda album: album.album_name)
+        self._year_index = None  # Built on first use by albums_released()
+        self._name_tree: Optional[RadixTree] = None  # Built on first use by complete_album_name()
+        self._similar: Dict[str, BKTree] = {}  # Per field, built on first use by find_similar()
 
     def add_album(self, album: Album) -> None:
         """
@@ -133,9 +151,14 @@ class AlbumCollection:
         Raises:
             ValueError: If album already exists
         """
-        if album in self._albums:
+        if album in self._by_name.get_all(album.album_name):
             raise ValueError(f"Album {album.album_name} already exists")
         self._albums.append(album)
+        self._by_name.add(album)
+        self._year_index = None
+        self._name_tree = None
+        self._similar = {}
+        self.version += 1
 
     def remove_album(self, album_name: str) -> Optional[Album]:
         """
@@ -147,11 +170,16 @@ class AlbumCollection:
         Returns:
             Optional[Album]: Removed album or None
         """
-        for album in self._albums:
-            if album.album_name == album_name:
-                self._albums.remove(album)
-                return album
-        return None
+        album = self._by_name.get(album_name)
+        if album is None:
+            return None
+        self._albums.remove(album)
+        self._by_name.remove(album)
+        self._year_index = None
+        self._name_tree = None
+        self._similar = {}
+        self.version += 1
+        return album
 
     def find_album(self, album_name: str) -> Optional[Album]:
         """
@@ -163,7 +191,48 @@ class AlbumCollection:
         Returns:
             Optional[Album]: Found album or None
         """
-        return next((album for album in self._albums if album.album_name == album_name), None)
+        return self._by_name.get(album_name)
+
+    def complete_album_name(self, prefix: str, limit: int = 10) -> List[Album]:
+        """
+        Find albums whose name starts with a prefix (case-insensitive)
+        
+        Args:
+            prefix (str): Beginning of the album name
+            limit (int): Maximum number of albums to return
+        
+        Returns:
+            List[Album]: Matching albums in name order
+        """
+        if self._name_tree is None:
+            self._name_tree = RadixTree(self._albums, key=lambda album: album.album_name.casefold())
+        return self._name_tree.items(prefix.casefold(), k=limit)
+
+    def find_similar(self, text: str, max_distance: int = 2, field: str = "name") -> List[Album]:
+        """
+        Find albums whose name (or artist) is within a few typos of the given text
+        
+        Args:
+            text (str): The possibly misspelled name or artist
+            max_distance (int): Largest number of inserted, deleted or changed characters
+            field (str): "name" to match album names, "artist" to match artists
+        
+        Returns:
+            List[Album]: Matching albums, closest first
+        
+        Raises:
+            ValueError: If field is not "name" or "artist"
+        """
+        if field not in ("name", "artist"):
+            raise ValueError("field must be 'name' or 'artist'")
+
+        def search() -> List[Album]:
+            if field not in self._similar:
+                attribute = "album_name" if field == "name" else "album_artist"
+                self._similar[field] = BKTree(self._albums, key=lambda album: getattr(album, attribute).casefold())
+            return [album for _, album in self._similar[field].search(text.casefold(), max_distance)]
+
+        return list(self._results.get(self.version, ("similar", field, text.casefold(), max_distance), search))
 
     def sort_by_songs(self, reverse: bool = False) -> List[Album]:
         """
@@ -175,7 +244,10 @@ class AlbumCollection:
         Returns:
             List[Album]: Sorted list of albums
         """
-        return sorted(self._albums, key=lambda x: x.number_of_songs, reverse=reverse)
+        return list(self._results.get(
+            self.version, ("sort_by_songs", reverse),
+            lambda: sorted(self._albums, key=lambda x: x.number_of_songs, reverse=reverse)
+        ))
 
     def filter_by_genre(self, genre: AlbumGenre) -> List[Album]:
         """
@@ -187,7 +259,65 @@ class AlbumCollection:
         Returns:
             List[Album]: Albums of specified genre
         """
-        return [album for album in self._albums if album.genre == genre]
+        return list(self._results.get(
+            self.version, ("filter_by_genre", genre),
+            lambda: [album for album in self._albums if album.genre == genre]
+        ))
+
+    def _genre_year_index(self):
+        """
+        Build (or reuse) one release-year-sorted album list per genre, linked by
+        fractional cascading so a year is located in every list with one binary search
+        
+        Returns:
+            tuple: (genres, per-genre sorted album lists, FractionalCascade)
+        """
+        if self._year_index is None:
+            genres = list(AlbumGenre)
+            by_genre: Dict[AlbumGenre, List[Album]] = {genre: [] for genre in genres}
+            for album in self._albums:
+                if album.release_year is not None:
+                    by_genre[album.genre].append(album)
+
+            release_year = lambda album: album.release_year
+            lists = [merge_sort(by_genre[genre], key=release_year) for genre in genres]
+            cascade = FractionalCascade(
+                [SortedSequence(albums, key=release_year, trusted=True) for albums in lists]
+            )
+            self._year_index = (genres, lists, cascade)
+        return self._year_index
+
+    def albums_released(self, start_year: int, end_year: Optional[int] = None) -> Dict[AlbumGenre, List[Album]]:
+        """
+        Find the albums released in a year (or range of years), grouped by genre
+        
+        Args:
+            start_year (int): First release year to include
+            end_year (Optional[int]): Last release year to include (defaults to start_year)
+        
+        Returns:
+            Dict[AlbumGenre, List[Album]]: Matching albums in release order, for each genre
+            that has any
+        """
+        if end_year is None:
+            end_year = start_year
+        genres, lists, cascade = self._genre_year_index()
+        starts = cascade.search(start_year, side="left")
+        stops = cascade.search(end_year, side="right")
+        return {
+            genre: albums[start:stop]
+            for genre, albums, start, stop in zip(genres, lists, starts, stops)
+            if stop > start
+        }
+
+    def cache_info(self) -> CacheInfo:
+        """
+        Report how often cached query results were reused
+        
+        Returns:
+            CacheInfo: Hits, misses, evictions, expirations, invalidations and size
+        """
+        return self._results.info()
 
     def __len__(self) -> int:
         """
@@ -252,6 +382,22 @@ def main():
         if found_album:
             print(f"\nFound Album: {found_album}")
 
+        # Albums released in the 1970s, per genre
+        print("\nReleased 1970-1979:")
+        for genre, released in albums.albums_released(1970, 1979).items():
+            print(f"{genre.name}: {[album.album_name for album in released]}")
+
+        # Typo-tolerant artist search
+        print(f"\nAlbums by 'Pink Flyod': {[album.album_name for album in albums.find_similar('Pink Flyod', field='artist')]}")
+
+        # Autocomplete on album names
+        print(f"\nNames starting with 'da': {[album.album_name for album in albums.complete_album_name('da')]}")
+
+        # Repeated queries are served from the result cache until the collection changes
+        for _ in range(3):
+            albums.filter_by_genre(AlbumGenre.ROCK)
+        print(f"\nQuery cache: {albums.cache_info()}")
+
     except ValueError as e:
         print(f"Error: {e}")
     except Exception as e:
@@ -1,6 +1,13 @@
+# Run from the repository root: python -m examples.coffeeordersystem
+
 # Import the Enum class to create more structured enumeration types
 from enum import Enum
 
+# Hash index from this repository, for finding orders by ID without scanning the list
+from searching_algorithms.hash_index import HashIndex
+# Result cache, so repeated reports are not recomputed until an order changes
+from searching_algorithms.result_cache import ResultCache
+
 # ENUMERATIONS: These define a set of named constants with specific meanings
 # Instead of using strings directly, we use Enums for better type safety and readability
 class OrderStatus(Enum):
@@ -133,9 +140,9 @@ class CafeView:
             # Get valid quantity
             quantity = self.get_valid_input("Enter quantity: ", int, 1)
 
-            # Add the selected item to the order
+            # Add the selected item to the order (through the controller, so it sees the change)
             product = self.controller.products[product_idx - 1]
-            order.add_item(product, quantity)
+            self.controller.add_item_to_order(order.order_id, product_idx, quantity)
             print(f"Added {quantity} x {product.name} to your order.")
 
             # Ask if user wants to add more items
@@ -171,7 +178,10 @@ class OrderController:
     def __init__(self):
         # Initialize the system with empty orders and predefined products
         self.orders = []                  # List to store all orders
+        self.orders_by_id = HashIndex(key=lambda order: order.order_id, unique=True)  # Order ID -> order
         self.next_order_id = 1            # Counter for generating unique order IDs
+        self.version = 0                  # Incremented whenever an order is created or changed
+        self.results = ResultCache(maxsize=32)  # Cached reports, keyed by version
         self.products = [                 # Predefined menu of products
             Product("Espresso", 3.0),
             Product("Latte", 4.5),
@@ -181,14 +191,16 @@ class OrderController:
 
     def get_order(self, order_id):
         # Find and return an order by its ID
-        # Uses next() with a generator expression for efficient searching
-        return next((order for order in self.orders if order.order_id == order_id), None)
+        # A hash lookup takes the same time however many orders there are
+        return self.orders_by_id.get(order_id)
 
     def create_order(self):
         # Create a new order with a unique ID
         order = Order(self.next_order_id)
         self.orders.append(order)
+        self.orders_by_id.add(order)
         self.next_order_id += 1
+        self.version += 1
         return order
 
     def add_item_to_order(self, order_id, product_idx, quantity):
@@ -202,8 +214,18 @@ class OrderController:
         
         product = self.products[product_idx - 1]
         order.add_item(product, quantity)
+        self.version += 1
         return True, f"Added {quantity} x {product.name} to Order {order_id}."
 
+    def orders_by_total(self):
+        # Return the orders from the largest total to the smallest
+        # The sorted list is reused until the next order is created or changed
+        ranked = self.results.get(
+            self.version, "orders_by_total",
+            lambda: sorted(self.orders, key=lambda order: order.total_amount, reverse=True)
+        )
+        return list(ranked)  # A copy, so callers cannot change the cached list
+
 # MAIN FUNCTION: Entry point of the application
 def main():
     # Set up the system components
@@ -217,9 +239,10 @@ def main():
         print("1. New Order")
         print("2. Add Item to Existing Order")
         print("3. View All Orders")
-        print("4. Exit")
+        print("4. View Orders by Total")
+        print("5. Exit")
 
-        choice = input("Please select an option (1-4): ")
+        choice = input("Please select an option (1-5): ")
 
         # Handle different user choices
         if choice == "1":
@@ -241,6 +264,8 @@ def main():
         elif choice == "3":
             view.display_orders(controller.orders)
         elif choice == "4":
+            view.display_orders(controller.orders_by_total())
+        elif choice == "5":
             print("Thank you for using the Coffee Order System. Goodbye!")
             break
         else:
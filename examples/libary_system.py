@@ -13,11 +13,19 @@
 - Type Hinting
 - Error Handling
 - Complex System Interactions
+
+Run from the repository root: python -m examples.libary_system
 """
 
 from datetime import datetime
 from typing import List, Optional
 
+from searching_algorithms.hash_index import HashIndex
+from searching_algorithms.inverted_index import InvertedIndex
+from searching_algorithms.prefix_search import RadixTree
+from searching_algorithms.result_cache import CacheInfo, ResultCache
+from searching_algorithms.suffix_array import SuffixArrayIndex
+
 # 1. MODELS: Core Data Structures
 # --------------------------------
 
@@ -140,19 +148,123 @@ class Library:
         self.name = name
         self.location = location
         self.books: List[Book] = []
+        self._books_by_isbn = HashIndex(key=lambda book: book.isbn)
+        self._title_tree: Optional[RadixTree] = None   # Built on first prefix search
+        self._author_tree: Optional[RadixTree] = None
+        self._title_suffixes: Optional[SuffixArrayIndex] = None  # Built on first fragment search
+        self.version = 0  # Incremented by every change to the collection
+        self._results = ResultCache(maxsize=128)
 
     def add_book(self, book: Book) -> None:
         """Add a book to the library collection."""
         self.books.append(book)
+        self._books_by_isbn.add(book)
+        self._title_tree = self._author_tree = self._title_suffixes = None
+        self.version += 1
 
-    def remove_book(self, isbn: str) -> None:
+    def remove_book(self, isbn: str) -> List[Book]:
         """
         Remove a book from the library by ISBN.
         
         Args:
             isbn (str): ISBN of the book to remove
+        
+        Returns:
+            List[Book]: The books removed (every copy with this ISBN)
+        """
+        removed = self._books_by_isbn.pop(isbn)
+        if removed:
+            self.books = [book for book in self.books if book.isbn != isbn]
+            self._title_tree = self._author_tree = self._title_suffixes = None
+            self.version += 1
+        return removed
+
+    def update_book(self, book: Book, new_title: Optional[str] = None, new_author: Optional[str] = None) -> None:
+        """
+        Change a book's title and/or author, keeping the search indexes current.
+        
+        Args:
+            book (Book): The book to update
+            new_title (Optional[str]): New title, if any
+            new_author (Optional[str]): New author, if any
+        """
+        if new_title:
+            book.title = new_title
+            self._title_tree = self._title_suffixes = None
+            self.version += 1
+        if new_author:
+            book.author = new_author
+            self._author_tree = None
+            self.version += 1
+
+    def find_book(self, isbn: str) -> Optional[Book]:
+        """
+        Find a book by ISBN without scanning the collection.
+        
+        Args:
+            isbn (str): ISBN of the book to find
+        
+        Returns:
+            Optional[Book]: The first book added with this ISBN, or None
+        """
+        return self._books_by_isbn.get(isbn)
+
+    def books_by_title_prefix(self, prefix: str, limit: int = 10) -> List[Book]:
+        """
+        Find books whose title starts with a prefix (case-insensitive).
+        
+        Args:
+            prefix (str): Beginning of the title
+            limit (int): Maximum number of books to return
+        
+        Returns:
+            List[Book]: Matching books in title order
+        """
+        def search() -> List[Book]:
+            if self._title_tree is None:
+                self._title_tree = RadixTree(self.books, key=lambda book: book.title.casefold())
+            return self._title_tree.items(prefix.casefold(), k=limit)
+
+        return list(self._results.get(self.version, ("title prefix", prefix.casefold(), limit), search))
+
+    def books_by_author_prefix(self, prefix: str, limit: int = 10) -> List[Book]:
+        """
+        Find books whose author's name starts with a prefix (case-insensitive).
+        
+        Args:
+            prefix (str): Beginning of the author's name
+            limit (int): Maximum number of books to return
+        
+        Returns:
+            List[Book]: Matching books in author order
         """
-        self.books = [book for book in self.books if book.isbn != isbn]
+        def search() -> List[Book]:
+            if self._author_tree is None:
+                self._author_tree = RadixTree(self.books, key=lambda book: book.author.casefold())
+            return self._author_tree.items(prefix.casefold(), k=limit)
+
+        return list(self._results.get(self.version, ("author prefix", prefix.casefold(), limit), search))
+
+    def books_by_title_fragment(self, fragment: str) -> List[Book]:
+        """
+        Find books whose title contains a piece of text anywhere (case-insensitive).
+        
+        Args:
+            fragment (str): Text to look for, e.g. "ockingbi"
+        
+        Returns:
+            List[Book]: Matching books in library order
+        """
+        def search() -> List[Book]:
+            if self._title_suffixes is None:
+                self._title_suffixes = SuffixArrayIndex(self.books, key=lambda book: book.title.casefold())
+            return self._title_suffixes.search(fragment.casefold())
+
+        return list(self._results.get(self.version, ("title fragment", fragment.casefold()), search))
+
+    def cache_info(self) -> CacheInfo:
+        """Report how often cached search results were reused."""
+        return self._results.info()
 
     def list_books(self) -> List[Book]:
         """
@@ -225,6 +337,8 @@ class LibraryController:
         self.library = library
         self.librarian = librarian
         self.members: List[Member] = []
+        self._book_text = InvertedIndex(library.books, key=lambda book: f"{book.title} {book.author}")
+        self._members_by_id = HashIndex(key=lambda member: member.member_id)
         self.borrowing_records: List[BorrowingRecord] = []
 
     # CREATE Operations
@@ -232,12 +346,14 @@ class LibraryController:
         """Create a new library member."""
         member = Member(name, member_id)
         self.members.append(member)
+        self._members_by_id.add(member)
         print(f"Member '{name}' with ID {member_id} created.")
 
     def create_book(self, title: str, author: str, isbn: str) -> None:
         """Add a new book to the library."""
         book = Book(title, author, isbn)
         self.library.add_book(book)
+        self._book_text.add(book)
         print(f"Book '{title}' added to the library.")
 
     def create_borrowing_record(self, member: Member, book: Book) -> None:
@@ -270,6 +386,49 @@ class LibraryController:
         else:
             print("No registered members.")
 
+    def find_member(self, member_id: int) -> Optional[Member]:
+        """Find a member by ID without scanning the member list."""
+        return self._members_by_id.get(member_id)
+
+    def autocomplete_books(self, prefix: str, limit: int = 10) -> None:
+        """Display books whose title or author starts with a prefix."""
+        by_title = self.library.books_by_title_prefix(prefix, limit)
+        by_author = self.library.books_by_author_prefix(prefix, limit)
+        if by_title or by_author:
+            for heading, books in (("Titles", by_title), ("Authors", by_author)):
+                if books:
+                    print(f"{heading} starting with '{prefix}':")
+                    for book in books:
+                        print(f"- {book}")
+        else:
+            print(f"No titles or authors start with '{prefix}'.")
+
+    def search_books(self, query: str, match_all: bool = True) -> None:
+        """
+        Display books whose title or author contains the words of a query.
+        
+        Args:
+            query (str): Words to look for (case-insensitive)
+            match_all (bool): Require every word (True) or any of them (False)
+        """
+        books = self._book_text.search(query, mode="and" if match_all else "or")
+        if books:
+            print(f"Books matching '{query}':")
+            for book in books:
+                print(f"- {book}")
+        else:
+            print(f"No books match '{query}'.")
+
+    def search_title_fragment(self, fragment: str) -> None:
+        """Display books whose title contains a piece of text."""
+        books = self.library.books_by_title_fragment(fragment)
+        if books:
+            print(f"Titles containing '{fragment}':")
+            for book in books:
+                print(f"- {book}")
+        else:
+            print(f"No titles contain '{fragment}'.")
+
     def read_borrowing_records(self) -> None:
         """Display all borrowing records."""
         if self.borrowing_records:
@@ -282,44 +441,44 @@ class LibraryController:
     # UPDATE Operations
     def update_member_info(self, member_id: int, new_name: Optional[str] = None) -> None:
         """Update member information."""
-        for member in self.members:
-            if member.member_id == member_id:
-                if new_name:
-                    member.name = new_name
-                    print(f"Member '{member_id}' updated with new name '{new_name}'.")
-                return
-        print(f"Member with ID {member_id} not found.")
+        member = self.find_member(member_id)
+        if member is None:
+            print(f"Member with ID {member_id} not found.")
+            return
+        if new_name:
+            member.name = new_name
+            print(f"Member '{member_id}' updated with new name '{new_name}'.")
 
     def update_book_info(self, isbn: str, new_title: Optional[str] = None, new_author: Optional[str] = None) -> None:
         """Update book information."""
-        for book in self.library.books:
-            if book.isbn == isbn:
-                if new_title:
-                    book.title = new_title
-                if new_author:
-                    book.author = new_author
-                print(f"Book '{isbn}' updated. New title: '{book.title}', New author: '{book.author}'.")
-                return
-        print(f"Book with ISBN {isbn} not found.")
+        book = self.library.find_book(isbn)
+        if book is None:
+            print(f"Book with ISBN {isbn} not found.")
+            return
+        self.library.update_book(book, new_title, new_author)
+        self._book_text.update(book)
+        print(f"Book '{isbn}' updated. New title: '{book.title}', New author: '{book.author}'.")
 
     # DELETE Operations
     def delete_member(self, member_id: int) -> None:
         """Remove a member from the system."""
-        for member in self.members:
-            if member.member_id == member_id:
-                self.members.remove(member)
-                print(f"Member '{member.name}' with ID {member_id} deleted.")
-                return
-        print(f"Member with ID {member_id} not found.")
+        member = self.find_member(member_id)
+        if member is None:
+            print(f"Member with ID {member_id} not found.")
+            return
+        self.members.remove(member)
+        self._members_by_id.remove(member)
+        print(f"Member '{member.name}' with ID {member_id} deleted.")
 
     def delete_book(self, isbn: str) -> None:
         """Remove a book from the library."""
-        for book in self.library.books:
-            if book.isbn == isbn:
-                self.library.remove_book(isbn)
-                print(f"Book with ISBN {isbn} deleted.")
-                return
-        print(f"Book with ISBN {isbn} not found.")
+        if self.library.find_book(isbn) is None:
+            print(f"Book with ISBN {isbn} not found.")
+            return
+        for book in self.library.remove_book(isbn):
+            if book in self._book_text:
+                self._book_text.remove(book)
+        print(f"Book with ISBN {isbn} deleted.")
 
 
 # 3. USER INTERFACE
@@ -338,6 +497,9 @@ def print_menu() -> None:
     print("8. Update Book")
     print("9. Delete Member")
     print("10. Delete Book")
+    print("11. Search Books by Title/Author Prefix")
+    print("12. Search Books by Keywords")
+    print("13. Search Books by Title Fragment")
     print("0. Exit")
 
 
@@ -354,7 +516,7 @@ def main() -> None:
     # Main program loop
     while True:
         print_menu()
-        choice = input("Select an option (0-10): ")
+        choice = input("Select an option (0-13): ")
 
         try:
             if choice == "1":
@@ -375,8 +537,8 @@ def main() -> None:
                 isbn = input("Enter book ISBN: ")
                 
                 # Find member and book
-                member = next((m for m in controller.members if m.member_id == member_id), None)
-                book = next((b for b in library.books if b.isbn == isbn), None)
+                member = controller.find_member(member_id)
+                book = library.find_book(isbn)
                 
                 if member and book:
                     controller.create_borrowing_record(member, book)
@@ -411,6 +573,19 @@ def main() -> None:
                 isbn = input("Enter book ISBN to delete: ")
                 controller.delete_book(isbn)
 
+            elif choice == "11":
+                prefix = input("Enter the beginning of a title or author: ")
+                controller.autocomplete_books(prefix)
+
+            elif choice == "12":
+                query = input("Enter keywords: ")
+                match_all = input("Match all keywords? (y/n): ").strip().lower() != "n"
+                controller.search_books(query, match_all)
+
+            elif choice == "13":
+                fragment = input("Enter part of a title: ")
+                controller.search_title_fragment(fragment)
+
             elif choice == "0":
                 print("Exiting Library Management System. Goodbye!")
                 break
@@ -0,0 +1,155 @@
+"""
+Batch Binary Search (Many Targets, One Sorted List)
+==================================================
+This module looks up many targets against the same sorted list in one call. Calling
+binary_search_iterative in a loop pays, for every target, a Python function call, a key()
+call per probe and (for a plain list) a full O(n) scan to confirm the list is sorted.
+search_many() validates once and then answers all targets together:
+
+- Numeric data without a key: numpy.searchsorted answers every target in C (a list is
+  converted first, if the batch is large enough to repay the conversion and the data and
+  targets are all ints or all floats, so nothing is rounded)
+- Anything else: the targets are sorted, then walked alongside the list in one pass. Each
+  target starts where the previous one ended and gallops (checks 1, 2, 4, 8, ... positions
+  ahead) before bisecting, so nearby targets cost O(1) probes and far ones O(log gap).
+
+- Time Complexity: O(n) validation (skipped for a validated SortedSequence), then
+  O(m log m) to sort the targets and O(m log(n/m)) probes for the co-walk
+- Space Complexity: O(m) for the target order and results
+
+Results are insertion points, like bisect: with side="left", index i is the first position
+whose value is not less than the target, so the target is present iff i < len(arr) and
+arr[i] equals it. They are returned in the original target order.
+
+NumPy is optional; without it every batch takes the co-walk.
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; fall back to the galloping co-walk
+    np = None
+
+from searching_algorithms.sorted_sequence import SortedSequence, compact_keys, ensure_sorted
+
+# Converting a list for NumPy costs O(n) in C, about as much as the co-walk spends on one
+# target per few dozen elements, so a list is converted only if it is at most this many
+# times longer than the batch of targets
+NUMPY_LIST_RATIO = 32
+
+
+def _typed_array(values):
+    """
+    Returns values as a 1D NumPy array of int64 or float64, or None unless they are all ints
+    that fit in 64 bits or all floats (NumPy would round mixed values to float64).
+    """
+    typed = compact_keys(values)
+    if not isinstance(typed, array):
+        return None
+    return np.frombuffer(typed, dtype=typed.typecode)
+
+
+def _co_walk(data, targets, key, side):
+    """Finds insertion points for all targets with one galloping pass over data."""
+    n = len(data)
+    bisect_fn = bisect_left if side == "left" else bisect_right
+    results = [0] * len(targets)
+    order = sorted(range(len(targets)), key=targets.__getitem__)
+
+    pos = 0
+    for t_index in order:
+        target = targets[t_index]
+        # Gallop from the previous answer: everything before lo precedes the target,
+        # and the value at hi (if any) does not
+        lo = hi = pos
+        step = 1
+        while hi < n:
+            value = key(data[hi]) if key else data[hi]
+            if not (value < target if side == "left" else not target < value):
+                break
+            lo = hi + 1
+            hi = pos + step
+            step *= 2
+        pos = bisect_fn(data, target, lo, min(hi, n), key=key)
+        results[t_index] = pos
+    return results
+
+
+def search_many(arr, targets, key=None, side="left"):
+    """
+    Finds the insertion point of every target in a sorted list in one call.
+
+    Args:
+        arr (list, SortedSequence or numpy.ndarray): The sorted data to search through.
+        targets (iterable): The values to look up (need not be sorted).
+        key (callable, optional): A function to extract a comparison key from each element.
+                                 Defaults to None (direct comparison).
+        side (str, optional): "left" for the position before equal values (lower bound),
+                              "right" for the position after them (upper bound).
+                              Defaults to "left".
+
+    Returns:
+        list or numpy.ndarray: One insertion point per target, in the original target order
+                               (an array if arr is a NumPy array, otherwise a list).
+
+    Raises:
+        TypeError: If elements are not comparable with the targets or key function is invalid.
+        ValueError: If the data is not sorted or side is invalid.
+    """
+    if side not in ("left", "right"):
+        raise ValueError("side must be 'left' or 'right'")
+    if key is not None and not callable(key):
+        raise TypeError("key must be a callable function")
+
+    if np is not None and isinstance(arr, np.ndarray) and key is None:
+        if arr.ndim != 1:
+            raise ValueError("search_many expects a 1D array")
+        if arr.size > 1 and not (arr[:-1] <= arr[1:]).all():
+            raise ValueError("Input list must be sorted in ascending order")
+        return np.searchsorted(arr, np.asarray(targets), side=side)
+
+    data, key = ensure_sorted(arr, key)
+    targets = list(targets)
+    if not targets:
+        return []
+
+    if key is None and len(data) <= len(targets) * NUMPY_LIST_RATIO:
+        # Lists of all ints or all floats are converted once and answered by NumPy in C;
+        # anything mixed takes the co-walk, which compares the values exactly
+        data_array = _typed_array(data) if np is not None else None
+        target_array = _typed_array(targets) if data_array is not None else None
+        if target_array is not None and target_array.dtype == data_array.dtype:
+            return np.searchsorted(data_array, target_array, side=side).tolist()
+
+    try:
+        return _co_walk(data, targets, key, side)
+    except TypeError as e:
+        raise TypeError(f"Elements are not comparable with target: {e}")
+
+# Example usage and testing
+if __name__ == "__main__":
+    # Test cases to demonstrate batch search behavior
+    test_cases = [
+        ([1, 3, 3, 3, 5, 7], [3, 0, 8, 5], None, "left"),                      # Numeric, lower bounds
+        ([1, 3, 3, 3, 5, 7], [3, 0, 8, 5], None, "right"),                     # Numeric, upper bounds
+        (["apple", "fig", "kiwi", "pear"], ["kiwi", "banana", "zucchini"], None, "left"),  # Strings
+        ([{"isbn": "123"}, {"isbn": "456"}, {"isbn": "789"}], ["456", "000"],
+         lambda x: x["isbn"], "left"),                                        # Custom key
+        ([], [1, 2], None, "left"),                                           # Empty list
+        ([3, 1, 2], [1], None, "left"),                                       # Not sorted
+    ]
+
+    # Run and display results for each test case
+    for arr, targets, key_func, side in test_cases:
+        try:
+            positions = search_many(arr, targets, key=key_func, side=side)
+            print(f"Input: {arr}, Targets: {targets}, Side: {side} -> Positions: {positions}")
+        except (TypeError, ValueError) as e:
+            print(f"Error for input {arr}: {e}")
+
+    # Validate once, then answer a large batch
+    catalog = SortedSequence(list(range(0, 2_000_000, 2)))
+    positions = search_many(catalog, [10, 11, 1_999_998, -5])
+    print(f"SortedSequence batch: {positions}")
@@ -12,14 +12,185 @@ the iterative version being stack-safe for large datasets.
 
 The implementation supports a 'key' parameter to allow searching based on object attributes,
 similar to Python's sorting functions, enabling flexible searches in real-world applications.
+
+lower_bound, upper_bound and equal_range locate the edges of a run of equal values with one
+binary search each, so duplicates never cost more than O(log n), and count() is their
+difference. search_range and iter_range answer "everything between lo and hi" the same way,
+with two binary searches and no scan.
+
+Checking that a plain list is sorted costs O(n) per call. Wrap the list in a SortedSequence
+(see sorted_sequence.py) to validate it once and search it repeatedly in O(log n).
 """
 
+from bisect import bisect_left, bisect_right
+
+from searching_algorithms.sorted_sequence import SortedSequence, ensure_sorted
+
+def lower_bound(arr, target, key=None):
+    """
+    Finds the first position whose value is not less than the target.
+
+    Args:
+        arr (list or SortedSequence): The sorted list to search through.
+        target: The value to search for.
+        key (callable, optional): A function to extract a comparison key from each element.
+                                 Defaults to None (direct comparison).
+
+    Returns:
+        int: The insertion point before any equal values (len(arr) if all values are smaller).
+
+    Raises:
+        TypeError: If elements are not comparable with the target or key function is invalid.
+        ValueError: If the list is not sorted (skipped for a validated SortedSequence).
+    """
+    if key is not None and not callable(key):
+        raise TypeError("key must be a callable function")
+    arr, key = ensure_sorted(arr, key)
+    try:
+        return bisect_left(arr, target, key=key)
+    except TypeError as e:
+        raise TypeError(f"Elements are not comparable with target: {e}")
+
+def upper_bound(arr, target, key=None):
+    """
+    Finds the first position whose value is greater than the target.
+
+    Args:
+        arr (list or SortedSequence): The sorted list to search through.
+        target: The value to search for.
+        key (callable, optional): A function to extract a comparison key from each element.
+                                 Defaults to None (direct comparison).
+
+    Returns:
+        int: The insertion point after any equal values (0 if all values are larger).
+
+    Raises:
+        TypeError: If elements are not comparable with the target or key function is invalid.
+        ValueError: If the list is not sorted (skipped for a validated SortedSequence).
+    """
+    if key is not None and not callable(key):
+        raise TypeError("key must be a callable function")
+    arr, key = ensure_sorted(arr, key)
+    try:
+        return bisect_right(arr, target, key=key)
+    except TypeError as e:
+        raise TypeError(f"Elements are not comparable with target: {e}")
+
+def equal_range(arr, target, key=None):
+    """
+    Finds the indices of every value equal to the target with two binary searches.
+
+    Args:
+        arr (list or SortedSequence): The sorted list to search through.
+        target: The value to search for.
+        key (callable, optional): A function to extract a comparison key from each element.
+                                 Defaults to None (direct comparison).
+
+    Returns:
+        range: The matching indices, range(lower_bound, upper_bound) (empty if not found).
+
+    Raises:
+        TypeError: If elements are not comparable with the target or key function is invalid.
+        ValueError: If the list is not sorted (skipped for a validated SortedSequence).
+    """
+    if key is not None and not callable(key):
+        raise TypeError("key must be a callable function")
+    arr, key = ensure_sorted(arr, key)
+    try:
+        lo = bisect_left(arr, target, key=key)
+        # Equal values can only start at lo, so the second search skips everything before it
+        return range(lo, bisect_right(arr, target, lo, key=key))
+    except TypeError as e:
+        raise TypeError(f"Elements are not comparable with target: {e}")
+
+def count(arr, target, key=None):
+    """
+    Counts the values equal to the target in O(log n), however many duplicates there are.
+
+    Args:
+        arr (list or SortedSequence): The sorted list to search through.
+        target: The value to count.
+        key (callable, optional): A function to extract a comparison key from each element.
+                                 Defaults to None (direct comparison).
+
+    Returns:
+        int: The number of matching values.
+
+    Raises:
+        TypeError: If elements are not comparable with the target or key function is invalid.
+        ValueError: If the list is not sorted (skipped for a validated SortedSequence).
+    """
+    return len(equal_range(arr, target, key=key))
+
+def search_range(arr, lo=None, hi=None, key=None, inclusive=(True, False)):
+    """
+    Finds the indices of every value between lo and hi with two binary searches.
+
+    Args:
+        arr (list or SortedSequence): The sorted list to search through.
+        lo (optional): Lower bound, or None for no lower bound. Defaults to None.
+        hi (optional): Upper bound, or None for no upper bound. Defaults to None.
+        key (callable, optional): A function to extract a comparison key from each element.
+                                 Defaults to None (direct comparison).
+        inclusive (tuple, optional): Whether (lo, hi) themselves are included.
+                                     Defaults to (True, False), i.e. lo <= value < hi.
+
+    Returns:
+        range: The matching indices (empty if none match or lo is above hi); arr[r.start:r.stop]
+               is the matching slice.
+
+    Raises:
+        TypeError: If elements are not comparable with the bounds or key function is invalid.
+        ValueError: If the list is not sorted (skipped for a validated SortedSequence) or
+                    inclusive is not a pair.
+    """
+    if key is not None and not callable(key):
+        raise TypeError("key must be a callable function")
+    if len(inclusive) != 2:
+        raise ValueError("inclusive must be a pair of booleans (lo, hi)")
+    arr, key = ensure_sorted(arr, key)
+
+    include_lo, include_hi = inclusive
+    try:
+        start = 0 if lo is None else (bisect_left if include_lo else bisect_right)(arr, lo, key=key)
+        if hi is None:
+            stop = len(arr)
+        else:
+            # Everything before start is already below the range, so the search begins there
+            stop = (bisect_right if include_hi else bisect_left)(arr, hi, start, key=key)
+    except TypeError as e:
+        raise TypeError(f"Elements are not comparable with target: {e}")
+    return range(start, max(start, stop))
+
+def iter_range(arr, lo=None, hi=None, key=None, inclusive=(True, False)):
+    """
+    Iterates over the values between lo and hi without copying them.
+
+    The bounds are found eagerly (so errors are raised on the call, not on first use); the
+    matching values are then yielded one at a time from the underlying list.
+
+    Args:
+        arr (list or SortedSequence): The sorted list to search through.
+        lo, hi, key, inclusive: As for search_range().
+
+    Returns:
+        iterator: The matching values, in sorted order.
+
+    Raises:
+        TypeError: If elements are not comparable with the bounds or key function is invalid.
+        ValueError: If the list is not sorted (skipped for a validated SortedSequence) or
+                    inclusive is not a pair.
+    """
+    indices = search_range(arr, lo, hi, key=key, inclusive=inclusive)
+    data = arr.data if isinstance(arr, SortedSequence) else arr
+    return (data[i] for i in indices)
+
 def binary_search_iterative(arr, target, key=None):
     """
     Searches for the target in a sorted list using iterative Binary Search.
 
     Args:
-        arr (list): The sorted list to search through.
+        arr (list or SortedSequence): The sorted list to search through.
         target: The value to search for.
         key (callable, optional): A function to extract a comparison key from each element.
                                  Defaults to None (direct comparison).
@@ -29,7 +200,7 @@ def binary_search_iterative(arr, target, key=None):
 
     Raises:
         TypeError: If elements are not comparable with the target or key function is invalid.
-        ValueError: If the list is not sorted (basic validation).
+        ValueError: If the list is not sorted (skipped for a validated SortedSequence).
     """
     if not arr:
         return -1  # Early return for empty lists
@@ -38,38 +209,25 @@ def binary_search_iterative(arr, target, key=None):
     if key is not None and not callable(key):
         raise TypeError("key must be a callable function")
 
-    # Basic validation: Check if list is sorted (for key-based comparison)
-    try:
-        for i in range(1, len(arr)):
-            val_prev = key(arr[i - 1]) if key else arr[i - 1]
-            val_curr = key(arr[i]) if key else arr[i]
-            if val_prev > val_curr:
-                raise ValueError("Input list must be sorted in ascending order")
-    except TypeError as e:
-        raise TypeError(f"Elements are not comparable: {e}")
-
-    left, right = 0, len(arr) - 1
+    # Check sorted order (skipped for an already-validated SortedSequence)
+    arr, key = ensure_sorted(arr, key)
 
-    while left <= right:
-        mid = (left + right) // 2
-        try:
+    # Narrow to the first position not less than the target, so duplicates cost nothing extra
+    left, right = 0, len(arr)
+    try:
+        while left < right:
+            mid = (left + right) // 2
             # Use key function if provided, otherwise compare directly
             mid_value = key(arr[mid]) if key else arr[mid]
-
-            if mid_value == target:
-                # Ensure first occurrence by checking leftward
-                while mid > 0:
-                    prev_value = key(arr[mid - 1]) if key else arr[mid - 1]
-                    if prev_value != target:
-                        break
-                    mid -= 1
-                return mid
-            elif mid_value < target:
+            if mid_value < target:
                 left = mid + 1
             else:
-                right = mid - 1
-        except TypeError as e:
-            raise TypeError(f"Elements are not comparable with target: {e}")
+                right = mid
+
+        if left < len(arr) and (key(arr[left]) if key else arr[left]) == target:
+            return left
+    except TypeError as e:
+        raise TypeError(f"Elements are not comparable with target: {e}")
 
     return -1  # Target not found
 
@@ -78,7 +236,7 @@ def binary_search_recursive(arr, target, key=None):
     Searches for the target in a sorted list using recursive Binary Search.
 
     Args:
-        arr (list): The sorted list to search through.
+        arr (list or SortedSequence): The sorted list to search through.
         target: The value to search for.
         key (callable, optional): A function to extract a comparison key from each element.
                                  Defaults to None (direct comparison).
@@ -88,7 +246,7 @@ def binary_search_recursive(arr, target, key=None):
 
     Raises:
         TypeError: If elements are not comparable with the target or key function is invalid.
-        ValueError: If the list is not sorted (basic validation).
+        ValueError: If the list is not sorted (skipped for a validated SortedSequence).
     """
     if not arr:
         return -1  # Early return for empty lists
@@ -97,41 +255,28 @@ def binary_search_recursive(arr, target, key=None):
     if key is not None and not callable(key):
         raise TypeError("key must be a callable function")
 
-    # Basic validation: Check if list is sorted (for key-based comparison)
-    try:
-        for i in range(1, len(arr)):
-            val_prev = key(arr[i - 1]) if key else arr[i - 1]
-            val_curr = key(arr[i]) if key else arr[i]
-            if val_prev > val_curr:
-                raise ValueError("Input list must be sorted in ascending order")
-    except TypeError as e:
-        raise TypeError(f"Elements are not comparable: {e}")
+    # Check sorted order (skipped for an already-validated SortedSequence)
+    arr, key = ensure_sorted(arr, key)
 
     def search(left, right):
-        """Helper function for recursive Binary Search."""
-        if left > right:
-            return -1
+        """Helper returning the first position in [left, right) not less than the target."""
+        if left >= right:
+            return left
 
         mid = (left + right) // 2
-        try:
-            mid_value = key(arr[mid]) if key else arr[mid]
+        mid_value = key(arr[mid]) if key else arr[mid]
+        if mid_value < target:
+            return search(mid + 1, right)
+        return search(left, mid)
 
-            if mid_value == target:
-                # Ensure first occurrence by checking leftward
-                while mid > 0:
-                    prev_value = key(arr[mid - 1]) if key else arr[mid - 1]
-                    if prev_value != target:
-                        break
-                    mid -= 1
-                return mid
-            elif mid_value < target:
-                return search(mid + 1, right)
-            else:
-                return search(left, mid - 1)
-        except TypeError as e:
-            raise TypeError(f"Elements are not comparable with target: {e}")
+    try:
+        index = search(0, len(arr))
+        if index < len(arr) and (key(arr[index]) if key else arr[index]) == target:
+            return index
+    except TypeError as e:
+        raise TypeError(f"Elements are not comparable with target: {e}")
 
-    return search(0, len(arr) - 1)
+    return -1  # Target not found
 
 # Example usage and testing
 if __name__ == "__main__":
@@ -159,3 +304,21 @@ if __name__ == "__main__":
             print(f"Iterative: {result_iter}, Recursive: {result_rec}")
         except (TypeError, ValueError) as e:
             print(f"Error for input {original}, target {target}: {e}")
+
+    # Validate once, then search repeatedly without rescanning
+    catalog = SortedSequence(list(range(0, 200, 2)))
+    hits = [binary_search_iterative(catalog, t) for t in (10, 11, 198)]
+    print(f"SortedSequence lookups: {hits} (validated={catalog.is_validated})")
+
+    # Bounds over a long run of duplicates
+    runs = SortedSequence([1] * 5 + [2] * 1000 + [3] * 5)
+    print(f"lower_bound: {lower_bound(runs, 2)}, upper_bound: {upper_bound(runs, 2)}, "
+          f"equal_range: {equal_range(runs, 2)}, count: {count(runs, 2)}")
+
+    # Range queries: albums released in the 1990s
+    albums = SortedSequence([{"title": "Thriller", "year": 1982}, {"title": "Nevermind", "year": 1991},
+                             {"title": "OK Computer", "year": 1997}, {"title": "Kid A", "year": 2000}],
+                            key=lambda a: a["year"])
+    print(f"search_range(1990, 2000): {search_range(albums, 1990, 2000)}")
+    print(f"iter_range(1990, 2000, inclusive=(True, True)): "
+          f"{[a['title'] for a in iter_range(albums, 1990, 2000, inclusive=(True, True))]}")
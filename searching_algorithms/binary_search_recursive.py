@@ -10,8 +10,10 @@ implementation is clean and elegant but uses O(log n) stack space due to the cal
 - Requirement: Sorted data
 
 The implementation supports a 'key' parameter for attribute-based searches and a 'return_mode'
-parameter to control whether the leftmost, rightmost, or all occurrences are returned. A
-'verbose' flag enables step-by-step output for educational purposes.
+parameter to control whether the leftmost, rightmost, or all occurrences are returned. Each
+mode finds the edges of the run of equal values by binary search, so duplicates never cost
+more than O(log n); "all" returns them as a lazy range rather than a list. A 'verbose' flag
+enables step-by-step output for educational purposes.
 
 Example:
     # Search for a book by ISBN
@@ -22,36 +24,45 @@ Example:
     # Find all occurrences of a value
     numbers = [1, 2, 2, 2, 3]
     indices = binary_search_recursive(numbers, 2, return_mode="all")
-    # Result: [1, 2, 3]
+    # Result: range(1, 4)
+
+    # Validate once, search many times (no O(n) scan per call)
+    catalog = SortedSequence(books, key=lambda x: x["isbn"])
+    index = binary_search_recursive(catalog, "456")
+    # Result: 1
 """
 
+from searching_algorithms.sorted_sequence import SortedSequence, ensure_sorted
+
 def binary_search_recursive(arr, target, key=None, return_mode="leftmost", verbose=False):
     """
     Searches for the target in a sorted list using recursive Binary Search.
 
     Args:
-        arr (list): The sorted list to search through.
+        arr (list or SortedSequence): The sorted list to search through.
         target: The value to search for.
         key (callable, optional): A function to extract a comparison key from each element.
                                  Defaults to None (direct comparison).
         return_mode (str, optional): Specifies the return behavior:
                                     - "leftmost": Return the first occurrence (default).
                                     - "rightmost": Return the last occurrence.
-                                    - "all": Return a list of all matching indices.
+                                    - "all": Return a range of all matching indices.
         verbose (bool, optional): If True, prints each recursive step for debugging/education.
                                  Defaults to False.
 
     Returns:
-        int or list: Depending on return_mode:
-                     - int: Index of the leftmost or rightmost occurrence, or -1 if not found.
-                     - list: List of all matching indices (for return_mode="all").
+        int or range: Depending on return_mode:
+                      - int: Index of the leftmost or rightmost occurrence, or -1 if not found.
+                      - range: All matching indices, range(lo, hi), empty if not found
+                        (for return_mode="all").
 
     Raises:
         TypeError: If elements are not comparable with the target or key function is invalid.
-        ValueError: If the list is not sorted or return_mode is invalid.
+        ValueError: If the list is not sorted (skipped for a validated SortedSequence) or
+                    return_mode is invalid.
     """
     if not arr:
-        return -1 if return_mode != "all" else []  # Early return for empty lists
+        return -1 if return_mode != "all" else range(0)  # Early return for empty lists
 
     # Validate input types
     if key is not None and not callable(key):
@@ -59,65 +70,42 @@ def binary_search_recursive(arr, target, key=None, return_mode="leftmost", verbo
     if return_mode not in ("leftmost", "rightmost", "all"):
         raise ValueError("return_mode must be 'leftmost', 'rightmost', or 'all'")
 
-    # Validate sorted order (performed once)
-    def is_sorted():
-        try:
-            for i in range(1, len(arr)):
-                val_prev = key(arr[i - 1]) if key else arr[i - 1]
-                val_curr = key(arr[i]) if key else arr[i]
-                if val_prev > val_curr:
-                    return False
-            return True
-        except TypeError as e:
-            raise TypeError(f"Elements are not comparable: {e}")
-
-    if not is_sorted():
-        raise ValueError("Input list must be sorted in ascending order")
-
-    def search(left, right):
-        """Helper function for recursive Binary Search."""
-        if left > right:
-            return -1 if return_mode != "all" else []
+    # Validate sorted order (skipped for an already-validated SortedSequence)
+    arr, key = ensure_sorted(arr, key)
+
+    def search(left, right, strict):
+        """
+        Helper returning the first position in [left, right) whose value is greater than the
+        target (strict) or not less than it (not strict). Each call halves the range, so the
+        depth is O(log n) however many duplicates there are.
+        """
+        if left >= right:
+            return left
 
         mid = (left + right) // 2
-        try:
-            mid_value = key(arr[mid]) if key else arr[mid]
-
-            if verbose:
-                print(f"Step: left={left}, right={right}, mid={mid}, mid_value={mid_value}, target={target}")
-
-            if mid_value == target:
-                if return_mode == "all":
-                    # Collect all occurrences by searching both sides
-                    left_matches = search(left, mid - 1) if mid > left else []
-                    right_matches = search(mid + 1, right) if mid < right else []
-                    matches = left_matches + [mid] + right_matches
-                    return sorted(matches)  # Ensure indices are in order
-                elif return_mode == "leftmost":
-                    # Find the leftmost occurrence
-                    if mid == 0 or (key(arr[mid - 1]) if key else arr[mid - 1]) != target:
-                        return mid
-                    return search(left, mid - 1)
-                else:  # rightmost
-                    # Find the rightmost occurrence
-                    if mid == len(arr) - 1 or (key(arr[mid + 1]) if key else arr[mid + 1]) != target:
-                        return mid
-                    return search(mid + 1, right)
-            elif mid_value < target:
-                return search(mid + 1, right)
-            else:
-                return search(left, mid - 1)
-        except TypeError as e:
-            raise TypeError(f"Elements are not comparable with target: {e}")
+        mid_value = key(arr[mid]) if key else arr[mid]
+
+        if verbose:
+            print(f"Step: left={left}, right={right}, mid={mid}, mid_value={mid_value}, target={target}")
+
+        if mid_value < target or (strict and not target < mid_value):
+            return search(mid + 1, right, strict)
+        return search(left, mid, strict)
 
     try:
-        result = search(0, len(arr) - 1)
-        # Ensure consistent return type for single index
-        if return_mode == "all" and isinstance(result, int):
-            return [result] if result != -1 else []
-        return result
+        lo = search(0, len(arr), strict=False)
+        if return_mode == "leftmost":
+            if lo < len(arr) and (key(arr[lo]) if key else arr[lo]) == target:
+                return lo
+            return -1
+
+        # Equal values can only start at lo, so the second search skips everything before it
+        hi = search(lo, len(arr), strict=True)
+        if return_mode == "all":
+            return range(lo, hi)
+        return hi - 1 if hi > lo else -1  # rightmost
     except TypeError as e:
-        raise TypeError(f"Search failed: {e}")
+        raise TypeError(f"Elements are not comparable with target: {e}")
 
 # Example usage and testing
 if __name__ == "__main__":
@@ -143,3 +131,7 @@ if __name__ == "__main__":
             print(f"Result: {result_str}\n")
         except (TypeError, ValueError) as e:
             print(f"Error for input {original}, target {target}: {e}\n")
+
+    # Validate once, then search repeatedly without rescanning
+    catalog = SortedSequence([1, 2, 2, 2, 3], trusted=True)
+    print(f"SortedSequence search: {binary_search_recursive(catalog, 2, return_mode='all')} ({catalog})")
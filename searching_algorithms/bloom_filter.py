@@ -0,0 +1,273 @@
+"""
+Bloom Filter (Fast Negative Lookups)
+===================================
+This module provides BloomFilter, a compact probabilistic set that answers "is this key
+definitely absent?" without touching the data being searched. Placed in front of a search, it
+turns most misses (an ISBN not in the catalog, an album name that does not exist) into a few
+bit tests instead of an O(n) scan or an O(log n) binary search.
+
+Each key sets k bits in an m-bit array (a bytearray, 8 bits per byte). A key whose k bits are
+not all set was never added. A key whose bits are all set was probably added: the filter
+never gives a false negative, but gives a false positive with probability error_rate when it
+holds `capacity` keys. For n keys and false-positive rate p:
+
+    m = -n ln(p) / (ln 2)^2 bits,    k = (m / n) ln 2 bit positions per key
+
+- add / contains: O(k), independent of the data size
+- Space Complexity: about 9.6 bits per key at 1%, 14.4 bits per key at 0.1%
+
+CountingBloomFilter replaces each bit with a one-byte counter (8x the memory) so that keys can
+also be removed.
+
+The k positions are derived from the key's hash() by double hashing, so keys that compare
+equal (1 and 1.0) land on the same bits, just as they match in a search. Note that str
+hashes differ between Python processes: a filter is only meaningful in the process that
+built it.
+
+Example:
+    seen = BloomFilter.build(["978-0", "978-1"], error_rate=0.01)
+    "978-9" in seen
+    # Result: False (definitely absent)
+"""
+
+import math
+
+_MASK64 = (1 << 64) - 1
+
+
+def _mix(x):
+    """SplitMix64 finaliser: spreads the bits of a 64-bit integer."""
+    x = (x + 0x9E3779B97F4A7C15) & _MASK64
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return x ^ (x >> 31)
+
+
+def optimal_size(capacity, error_rate):
+    """
+    Returns the (bit count, hash count) for a filter of a given capacity and error rate.
+
+    Raises:
+        ValueError: If capacity is not positive or error_rate is not between 0 and 1.
+    """
+    if capacity < 1:
+        raise ValueError("capacity must be positive")
+    if not 0 < error_rate < 1:
+        raise ValueError("error_rate must be between 0 and 1")
+    bits = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+    hashes = max(1, round(bits / capacity * math.log(2)))
+    return bits, hashes
+
+
+class BloomFilter:
+    """
+    A fixed-size set of keys that may report false positives but never false negatives.
+
+    Attributes:
+        capacity (int): The number of keys the filter was sized for.
+        error_rate (float): The false-positive rate at capacity.
+        size (int): Number of bits (m).
+        hash_count (int): Bit positions per key (k).
+    """
+    def __init__(self, capacity, error_rate=0.01):
+        """
+        Create an empty filter.
+
+        Args:
+            capacity (int): Expected number of keys. Adding more raises the false-positive rate.
+            error_rate (float, optional): Target false-positive rate at capacity.
+                                          Defaults to 0.01.
+
+        Raises:
+            ValueError: If capacity is not positive or error_rate is not between 0 and 1.
+        """
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size, self.hash_count = optimal_size(capacity, error_rate)
+        self._store = self._new_store()
+        self._count = 0
+
+    @classmethod
+    def build(cls, items, error_rate=0.01, key=None):
+        """
+        Create a filter sized for, and holding, the keys of some items.
+
+        Args:
+            items (list): The items to add (sized with len(), so not a one-shot iterator).
+            error_rate (float, optional): Target false-positive rate. Defaults to 0.01.
+            key (callable, optional): A function to extract the key from each item.
+                                     Defaults to None (add the items themselves).
+
+        Returns:
+            BloomFilter: The filled filter.
+
+        Raises:
+            TypeError: If key is not callable or a key is not hashable.
+        """
+        if key is not None and not callable(key):
+            raise TypeError("key must be a callable function")
+        bloom = cls(max(1, len(items)), error_rate)
+        bloom.update((key(x) for x in items) if key else items)
+        return bloom
+
+    def _new_store(self):
+        return bytearray((self.size + 7) // 8)
+
+    def _positions(self, item):
+        """Returns the k bit positions of a key."""
+        try:
+            h = hash(item) & _MASK64
+        except TypeError as e:
+            raise TypeError(f"Key is not hashable: {e}")
+        h1 = _mix(h)
+        h2 = _mix(h1) | 1  # Odd, so the k positions differ
+        return [(h1 + i * h2) % self.size for i in range(self.hash_count)]
+
+    def add(self, item):
+        """Adds a key to the filter."""
+        store = self._store
+        for p in self._positions(item):
+            store[p >> 3] |= 1 << (p & 7)
+        self._count += 1
+
+    def update(self, items):
+        """Adds every key in an iterable."""
+        for item in items:
+            self.add(item)
+
+    def __contains__(self, item):
+        """False if the key was definitely never added; True if it probably was."""
+        store = self._store
+        for p in self._positions(item):
+            if not store[p >> 3] & (1 << (p & 7)):
+                return False
+        return True
+
+    def __len__(self):
+        """Number of keys added (counting repeats)."""
+        return self._count
+
+    @property
+    def nbytes(self):
+        """Memory used by the bit (or counter) store, in bytes."""
+        return len(self._store)
+
+    def current_error_rate(self):
+        """Estimated false-positive rate for the keys added so far."""
+        return (1 - math.exp(-self.hash_count * self._count / self.size)) ** self.hash_count
+
+    def __repr__(self):
+        return (f"{type(self).__name__}({self._count}/{self.capacity} keys, {self.size} bits, "
+                f"{self.hash_count} hashes)")
+
+
+class CountingBloomFilter(BloomFilter):
+    """
+    A Bloom filter with a one-byte counter per position, so keys can be removed.
+
+    Counters saturate at 255 and then stay there (a saturated position can no longer be
+    cleared, which can only cause false positives, never false negatives).
+    """
+    def _new_store(self):
+        return bytearray(self.size)
+
+    def add(self, item):
+        """Adds a key to the filter."""
+        store = self._store
+        for p in self._positions(item):
+            if store[p] < 255:
+                store[p] += 1
+        self._count += 1
+
+    def remove(self, item):
+        """
+        Removes a key that was added earlier.
+
+        Raises:
+            KeyError: If the key is definitely not in the filter. (Removing a key that was
+                      never added but tests as a false positive corrupts the filter.)
+        """
+        positions = self._positions(item)
+        store = self._store
+        if not all(store[p] for p in positions):
+            raise KeyError(item)
+        for p in positions:
+            if store[p] < 255:
+                store[p] -= 1
+        self._count -= 1
+
+    def __contains__(self, item):
+        """False if the key is definitely not in the filter; True if it probably is."""
+        store = self._store
+        for p in self._positions(item):
+            if not store[p]:
+                return False
+        return True
+
+
+def guarded_search(search, bloom, miss=-1):
+    """
+    Wraps a search function so that keys the filter rules out return at once.
+
+    Args:
+        search (callable): A search with the signature search(arr, target, ...), such as
+                           linear_search or binary_search_iterative.
+        bloom (BloomFilter): A filter holding the key of every element in the searched data
+                             (the key() values if the search is called with a key).
+        miss (optional): The value to return for a definite miss. Defaults to -1, what the
+                         searches in this package return for a missing target.
+
+    Returns:
+        callable: A function with the same signature as search.
+    """
+    def guarded(arr, target, *args, **kwargs):
+        if target not in bloom:
+            return miss
+        return search(arr, target, *args, **kwargs)
+
+    guarded.__name__ = f"guarded_{getattr(search, '__name__', 'search')}"
+    guarded.__doc__ = search.__doc__
+    return guarded
+
+# Example usage and testing
+if __name__ == "__main__":
+    import random
+    import time
+
+    from searching_algorithms.linear_search import linear_search
+
+    # Filter over 100,000 ISBN-like strings
+    random.seed(42)
+    catalog = [f"978-{random.randrange(10 ** 9):09d}" for _ in range(100_000)]
+    bloom = BloomFilter.build(catalog, error_rate=0.01)
+    print(f"Filter: {bloom}, {bloom.nbytes / 1024:.0f} KiB")
+
+    # No false negatives; false positives near the configured rate
+    assert all(isbn in bloom for isbn in catalog[:1000])
+    absent = [f"979-{i:09d}" for i in range(100_000)]
+    false_positives = sum(isbn in bloom for isbn in absent)
+    print(f"False-positive rate: {false_positives / len(absent):.4f} "
+          f"(estimated {bloom.current_error_rate():.4f})")
+
+    # A guard in front of linear search: misses skip the scan
+    find = guarded_search(linear_search, bloom)
+    misses = absent[:200]
+    start = time.perf_counter()
+    unguarded = [linear_search(catalog, isbn) for isbn in misses]
+    plain = time.perf_counter() - start
+    start = time.perf_counter()
+    guarded = [find(catalog, isbn) for isbn in misses]
+    fast = time.perf_counter() - start
+    print(f"200 misses: linear_search {plain * 1e3:.1f} ms, guarded {fast * 1e3:.2f} ms, "
+          f"same results: {unguarded == guarded}")
+    print(f"Hit through the guard: {find(catalog, catalog[500])}")
+
+    # Counting variant supports removal
+    shelf = CountingBloomFilter(capacity=100, error_rate=0.01)
+    shelf.update(["Dune", "Emma"])
+    shelf.remove("Dune")
+    print(f"After removing 'Dune': 'Dune' in shelf = {'Dune' in shelf}, 'Emma' in shelf = {'Emma' in shelf}")
+    try:
+        shelf.remove("Ulysses")
+    except KeyError as e:
+        print(f"Error: cannot remove {e}")
@@ -0,0 +1,239 @@
+"""
+Exponential Search Algorithm (Galloping Search)
+==============================================
+This module implements Exponential Search, a searching algorithm for sorted sources whose
+length is unknown or expensive to find. It probes positions 0, 1, 3, 7, 15, ... (doubling the
+step each time) until it reaches a value not less than the target or runs off the end, then
+runs Binary Search between the last two probes. Only positions up to about 2i are ever read,
+where i is the target's position, so targets near the front are found almost immediately.
+
+- Time Complexity: O(log i) probes, where i is the position of the target
+- Space Complexity: O(1) (plus whatever the source caches)
+- Requirement: Sorted data; random access by index that raises IndexError past the end
+
+Sources do not need a len(): reading past the end just has to raise IndexError, which the
+search treats as "greater than every target". Three adapters are provided:
+
+- PagedSource: fetches fixed-size pages on demand (e.g. from a paged API or database cursor)
+  and caches them, so a search touches O(log i) pages
+- IteratorSource: buffers a generator lazily; it reads at most about 2i items, since an
+  iterator cannot skip ahead
+- RecordFileSource: reads fixed-width records from a sorted binary file via seek()
+
+Sortedness cannot be validated without reading the whole source, so it is the caller's
+responsibility; a plain list (or SortedSequence) also works as a source.
+
+Example:
+    # A sorted log served one page of 1000 timestamps at a time
+    log = PagedSource(lambda page: fetch_timestamps(page), page_size=1000)
+    index = exponential_search(log, 1_700_000_123)
+"""
+
+import os
+
+from searching_algorithms.sorted_sequence import SortedSequence
+
+
+class PagedSource:
+    """
+    Random access over a sequence served in fixed-size pages, fetched lazily and cached.
+
+    Attributes:
+        pages_fetched (int): Number of pages fetched so far.
+    """
+    def __init__(self, fetch_page, page_size):
+        """
+        Args:
+            fetch_page (callable): Function (page_number) -> list of up to page_size items;
+                                   a short or empty page marks the end of the source.
+            page_size (int): Number of items per full page.
+
+        Raises:
+            TypeError: If fetch_page is not callable.
+            ValueError: If page_size is not positive.
+        """
+        if not callable(fetch_page):
+            raise TypeError("fetch_page must be a callable function")
+        if page_size < 1:
+            raise ValueError("page_size must be positive")
+        self._fetch_page = fetch_page
+        self.page_size = page_size
+        self._pages = {}
+        self.pages_fetched = 0
+
+    def __getitem__(self, index):
+        if index < 0:
+            raise IndexError("PagedSource does not support negative indices")
+        page_number, offset = divmod(index, self.page_size)
+        page = self._pages.get(page_number)
+        if page is None:
+            page = self._fetch_page(page_number)
+            self._pages[page_number] = page
+            self.pages_fetched += 1
+        if offset >= len(page):
+            raise IndexError("index past the end of the source")
+        return page[offset]
+
+
+class IteratorSource:
+    """Random access over an iterator, buffering items as far as the highest index read."""
+    def __init__(self, iterable):
+        self._iterator = iter(iterable)
+        self._buffer = []
+
+    def __getitem__(self, index):
+        if index < 0:
+            raise IndexError("IteratorSource does not support negative indices")
+        while len(self._buffer) <= index:
+            try:
+                self._buffer.append(next(self._iterator))
+            except StopIteration:
+                raise IndexError("index past the end of the source")
+        return self._buffer[index]
+
+    @property
+    def items_read(self):
+        """Number of items consumed from the iterator so far."""
+        return len(self._buffer)
+
+
+def _decode_text(record):
+    """Default record decoder: UTF-8 text without trailing padding or newline."""
+    return record.decode("utf-8").rstrip()
+
+
+class RecordFileSource:
+    """
+    Random access over fixed-width records in a binary file, read with seek().
+
+    Attributes:
+        reads (int): Number of records read so far.
+    """
+    def __init__(self, file, record_size, decode=_decode_text):
+        """
+        Args:
+            file (file object): A file opened in binary mode ('rb').
+            record_size (int): Size of each record in bytes (including any newline).
+            decode (callable, optional): Function (bytes) -> value for one record.
+                                         Defaults to UTF-8 text with trailing whitespace removed.
+
+        Raises:
+            ValueError: If record_size is not positive.
+        """
+        if record_size < 1:
+            raise ValueError("record_size must be positive")
+        self._file = file
+        self.record_size = record_size
+        self._decode = decode
+        self.reads = 0
+
+    def __getitem__(self, index):
+        if index < 0:
+            raise IndexError("RecordFileSource does not support negative indices")
+        self._file.seek(index * self.record_size, os.SEEK_SET)
+        record = self._file.read(self.record_size)
+        if len(record) < self.record_size:
+            raise IndexError("index past the end of the file")
+        self.reads += 1
+        return self._decode(record)
+
+
+def exponential_search(source, target, key=None):
+    """
+    Searches for the target in a sorted source of unknown length using Exponential Search.
+
+    Args:
+        source: A sorted, indexable source that raises IndexError past its end (a list,
+                SortedSequence, PagedSource, IteratorSource or RecordFileSource).
+        target: The value to search for.
+        key (callable, optional): A function to extract a comparison key from each element.
+                                 Defaults to None (direct comparison).
+
+    Returns:
+        int: The index of the first occurrence of the target, or -1 if not found.
+
+    Raises:
+        TypeError: If elements are not comparable with the target or key function is invalid.
+    """
+    # Validate input types
+    if key is not None and not callable(key):
+        raise TypeError("key must be a callable function")
+    if isinstance(source, SortedSequence):
+        key = key or source.key
+        source = source.data
+
+    def value_at(index):
+        item = source[index]  # Raises IndexError past the end
+        return key(item) if key else item
+
+    try:
+        # Gallop: positions 0, 1, 3, 7, ... until a value is not less than the target.
+        # Everything up to lo is less than the target; hi is not (or is past the end).
+        lo, hi, step = -1, 0, 1
+        while True:
+            try:
+                if not value_at(hi) < target:
+                    break
+            except IndexError:
+                break
+            lo = hi
+            hi += step
+            step *= 2
+
+        # Bisect (lo, hi] for the first position not less than the target
+        while hi - lo > 1:
+            mid = (lo + hi) // 2
+            try:
+                mid_value = value_at(mid)
+            except IndexError:
+                hi = mid  # The end lies before mid
+                continue
+            if mid_value < target:
+                lo = mid
+            else:
+                hi = mid
+
+        try:
+            return hi if value_at(hi) == target else -1
+        except IndexError:
+            return -1  # Larger than every value
+    except TypeError as e:
+        raise TypeError(f"Elements are not comparable with target: {e}")
+
+# Example usage and testing
+if __name__ == "__main__":
+    import tempfile
+
+    # Test cases to demonstrate Exponential Search behavior on plain lists
+    test_cases = [
+        ([11, 12, 22, 25, 34, 64, 90], 25, None),           # Target present
+        ([1, 2, 3, 4, 5], 6, None),                         # Target absent (past the end)
+        ([1, 2, 2, 2, 3], 2, None),                         # Multiple occurrences
+        ([], 1, None),                                      # Empty list
+        ([{"val": 1}, {"val": 2}, {"val": 3}], 2, lambda x: x["val"]),  # Custom key
+    ]
+
+    # Run and display results for each test case
+    for arr, target, key_func in test_cases:
+        try:
+            index = exponential_search(arr, target, key=key_func)
+            print(f"Input: {arr}, Target: {target} -> {index}")
+        except TypeError as e:
+            print(f"Error for input {arr}, target {target}: {e}")
+
+    # A "huge" paged log of even timestamps: a target near the front touches few pages
+    total = 10_000_000
+    log = PagedSource(lambda page: [2 * i for i in range(page * 1000, min((page + 1) * 1000, total))],
+                      page_size=1000)
+    print(f"Paged: index {exponential_search(log, 123_456)}, pages fetched: {log.pages_fetched}")
+
+    # A generator only has to be read a little past the target
+    stream = IteratorSource(x * 3 for x in range(10 ** 9))
+    print(f"Iterator: index {exponential_search(stream, 300)}, items read: {stream.items_read}")
+
+    # Fixed-width sorted records on disk
+    with tempfile.TemporaryFile() as f:
+        for word in ["apple", "banana", "cherry", "kiwi", "mango", "pear"]:
+            f.write(word.ljust(7).encode() + b"\n")
+        records = RecordFileSource(f, record_size=8)
+        print(f"File: index {exponential_search(records, 'kiwi')}, records read: {records.reads}")
@@ -0,0 +1,200 @@
+"""
+Eytzinger Index (Cache-Friendly Binary Search Layout)
+====================================================
+This module provides EytzingerIndex, a search index that stores sorted keys in breadth-first
+("Eytzinger") order: the root at position 1, and the children of position k at 2k and 2k + 1,
+like a binary heap. Binary Search over a sorted array touches positions n/2, n/4 or 3n/4, ...
+which are far apart, so on a large array nearly every probe past the first few is a cache
+miss. In the Eytzinger layout the first levels of the tree sit together at the front of the
+array and stay cached, and each step moves to a predictable nearby position.
+
+- Build: O(n) (the position of every key is computed directly, without building a tree)
+- Search: O(log n), one comparison per level with no early exit, so the loop has a single
+  data-dependent step (k = 2k + (key < target)) instead of a three-way branch
+- Space Complexity: O(n) for the key array plus a rank array mapping positions back to
+  sorted indices
+
+Keys are held in an array.array when they are all ints or all floats (compact, and shared with
+NumPy without copying), otherwise in a list. search_many() looks up a whole batch of targets
+at once: with NumPy, every target advances one tree level per step, so the memory accesses of
+a level are issued together instead of one dependent chain per target.
+
+search() returns the same results as binary_search_iterative: the index (in sorted order) of
+the first occurrence of the target, or -1.
+"""
+
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; batched lookups fall back to a loop
+    np = None
+
+from searching_algorithms.sorted_sequence import SortedSequence, compact_keys, ensure_sorted
+
+
+def _eytzinger_position(j, levels, last_level):
+    """
+    Returns the Eytzinger position (1-based) of the key with sorted index j.
+
+    In a perfect tree with `levels` levels, the in-order position p (1-based) sits at depth
+    levels - 1 - tz(p), where tz counts trailing zero bits. The last level here holds only
+    `last_level` leaves, so in-order positions after the 2 * last_level-th skip the missing
+    leaves (every other slot in the perfect tree).
+    """
+    p = j + 1
+    if p > 2 * last_level:
+        p = 2 * p - 2 * last_level
+    low_bit = p & -p
+    return (p // (2 * low_bit)) + (1 << (levels - 1)) // low_bit
+
+
+class EytzingerIndex:
+    """
+    Sorted keys stored in breadth-first order for cache-friendly binary search.
+
+    Attributes:
+        size (int): Number of keys indexed.
+    """
+    def __init__(self, keys, trusted=False):
+        """
+        Build the index from sorted keys.
+
+        Args:
+            keys (list or SortedSequence): The sorted keys to index (copied into the layout).
+            trusted (bool, optional): If True, skip the sortedness check. Defaults to False.
+
+        Raises:
+            TypeError: If keys are not comparable.
+            ValueError: If the keys are not sorted (unless trusted).
+        """
+        if isinstance(keys, SortedSequence):
+            if not trusted:
+                keys.ensure_validated()  # Scans only if changed since it was last validated
+            keys = [keys.key(x) for x in keys.data] if keys.key else keys.data
+        elif not trusted:
+            keys, _ = ensure_sorted(keys)
+
+        n = self.size = len(keys)
+        levels = n.bit_length()
+        last_level = n - ((1 << (levels - 1)) - 1) if n else 0
+        typed_keys = compact_keys(keys)
+
+        if np is not None and isinstance(typed_keys, array):
+            # Same layout, computed and scattered with whole-array operations
+            p = np.arange(1, n + 1, dtype=np.int64)
+            p = np.where(p > 2 * last_level, 2 * p - 2 * last_level, p)
+            low_bit = p & -p
+            positions = p // (2 * low_bit) + (1 << (levels - 1)) // low_bit
+            tree = np.empty(n + 1, dtype=typed_keys.typecode)
+            tree[positions] = np.frombuffer(typed_keys, dtype=typed_keys.typecode)
+            tree[0] = tree[1]
+            rank = np.zeros(n + 1, dtype=np.int64)
+            rank[positions] = np.arange(n, dtype=np.int64)
+            self._tree = array(typed_keys.typecode, tree.tobytes())
+            self._rank = array("q", rank.tobytes())
+            return
+
+        # Position 0 is unused, so the children of k are simply 2k and 2k + 1
+        tree = [keys[0] if n else None] * (n + 1)
+        rank = [0] * (n + 1)
+        for j in range(n):
+            k = _eytzinger_position(j, levels, last_level)
+            tree[k] = keys[j]
+            rank[k] = j
+        self._tree = compact_keys(tree) if n else tree
+        self._rank = array("q", rank)
+
+    def _descend(self, target):
+        """Returns the Eytzinger position of the first key not less than target, or 0."""
+        tree, n = self._tree, self.size
+        k = 1
+        try:
+            while k <= n:
+                k = 2 * k + (tree[k] < target)
+        except TypeError as e:
+            raise TypeError(f"Elements are not comparable with target: {e}")
+        # The answer is the last node where the descent went left: strip the trailing 1 bits
+        # (right turns) and the 0 bit before them
+        return k // (((~k) & (k + 1)) * 2)
+
+    def lower_bound(self, target):
+        """
+        Finds the first sorted index whose key is not less than the target.
+
+        Returns:
+            int: The insertion point before any equal keys (size if all keys are smaller).
+        """
+        k = self._descend(target)
+        return self._rank[k] if k else self.size
+
+    def search(self, target):
+        """
+        Searches for the target.
+
+        Returns:
+            int: The sorted index of the first occurrence of the target, or -1 if not found.
+        """
+        k = self._descend(target)
+        if k and self._tree[k] == target:
+            return self._rank[k]
+        return -1
+
+    def search_many(self, targets):
+        """
+        Searches for a batch of targets, one tree level at a time when NumPy is available.
+
+        Args:
+            targets (iterable): The values to look up.
+
+        Returns:
+            list: For each target, the sorted index of its first occurrence, or -1.
+        """
+        targets = list(targets)
+        if np is None or not isinstance(self._tree, array) or not targets:
+            return [self.search(t) for t in targets]
+
+        # Vectorise only when the targets fit the tree's typecode exactly; NumPy would round
+        # mixed ints and floats (or ints against a float tree) to float64, merging distinct keys
+        typed_targets = compact_keys(targets)
+        if not isinstance(typed_targets, array) or typed_targets.typecode != self._tree.typecode:
+            return [self.search(t) for t in targets]
+
+        target_array = np.frombuffer(typed_targets, dtype=typed_targets.typecode)
+        tree = np.frombuffer(self._tree, dtype=self._tree.typecode)
+        rank = np.frombuffer(self._rank, dtype=np.int64)
+        n = self.size
+        k = np.ones(len(targets), dtype=np.int64)
+        for _ in range(n.bit_length()):
+            active = k <= n
+            # Nodes that already fell off the tree stay put; the others gather their key
+            k = np.where(active, 2 * k + (tree[np.minimum(k, n)] < target_array), k)
+        k //= ((~k) & (k + 1)) * 2
+
+        found = (k > 0) & (tree[k] == target_array)
+        return np.where(found, rank[k], -1).tolist()
+
+    def __len__(self):
+        return self.size
+
+    def __repr__(self):
+        return f"EytzingerIndex({self.size} keys)"
+
+# Example usage and testing
+if __name__ == "__main__":
+    keys = [1, 3, 3, 5, 8, 13, 21, 34, 55, 89]
+    index = EytzingerIndex(keys)
+    print(f"Sorted keys: {keys}")
+    print(f"Eytzinger layout: {list(index._tree)[1:]}")
+
+    for target in (3, 21, 4, 0, 100):
+        print(f"search({target}) -> {index.search(target)}, lower_bound({target}) -> {index.lower_bound(target)}")
+    print(f"search_many([89, 2, 1, 13]) -> {index.search_many([89, 2, 1, 13])}")
+
+    words = EytzingerIndex(["apple", "fig", "kiwi", "pear"])
+    print(f"Strings: search('kiwi') -> {words.search('kiwi')}")
+
+    try:
+        EytzingerIndex([3, 1, 2])
+    except ValueError as e:
+        print(f"Error: {e}")
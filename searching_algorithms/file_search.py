@@ -0,0 +1,211 @@
+"""
+Binary Search over Sorted Text Files
+===================================
+This module runs Binary Search directly on a sorted, newline-delimited file (an ISBN -> record
+dump, a sorted log) that is too large to load. The file is memory-mapped, and the search
+bisects on byte offsets: each probe jumps to the middle of the remaining byte range, moves
+back to the start of the line it landed in, parses that line's key and compares it with the
+target. Only the pages around the probed lines are ever read from disk.
+
+- Time Complexity: O(log n) probes for a file of n bytes, each reading one line
+- Space Complexity: O(1) (the operating system caches the touched pages)
+- Requirement: Lines sorted in ascending order of key_parser(line). This is not checked,
+  since checking would read the whole file; use check_sorted_file() once after writing it.
+
+search_sorted_file() follows the contract of binary_search_iterative, with byte offsets in
+place of indices: it returns the offset of the first line whose key equals the target, or
+-1. iter_file_range() streams the lines whose keys fall between two bounds, reading forward
+from the first one found.
+
+Lines are decoded before parsing, and a trailing "\r" is dropped, so files written on
+Windows work too.
+
+Example:
+    # isbns.tsv holds "isbn<TAB>title" lines sorted by ISBN
+    isbn = lambda line: line.split("\t", 1)[0]
+    offset = search_sorted_file("isbns.tsv", "978-0451524935", key_parser=isbn)
+    next(iter_file_range("isbns.tsv", "978-0451524935", "978-0451524935", key_parser=isbn,
+                         inclusive=(True, True)))
+    # Result: "978-0451524935\t1984"
+"""
+
+import mmap
+from contextlib import contextmanager
+
+
+@contextmanager
+def _mapped(path):
+    """Maps a file read-only (None for an empty file, which cannot be mapped)."""
+    with open(path, "rb") as file:
+        if file.seek(0, 2) == 0:
+            yield None
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield mapped
+
+
+def _line_at(mapped, start, encoding):
+    """Returns (decoded line, offset of the next line) for the line starting at start."""
+    end = mapped.find(b"\n", start)
+    if end < 0:
+        end = len(mapped)
+    line = mapped[start:end]
+    if line.endswith(b"\r"):
+        line = line[:-1]
+    return line.decode(encoding), end + 1
+
+
+def _bound(mapped, target, key_parser, encoding, side="left"):
+    """
+    Returns the offset of the first line whose key is not less than (side="left") or is
+    greater than (side="right") the target, or the file size if there is none.
+    """
+    lo, hi = 0, len(mapped)  # lo and hi are always line starts (or the file size)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        newline = mapped.rfind(b"\n", lo, mid)
+        start = lo if newline < 0 else newline + 1  # Start of the line containing mid
+        line, next_start = _line_at(mapped, start, encoding)
+        key = key_parser(line) if key_parser else line
+        if key < target if side == "left" else not target < key:
+            lo = min(next_start, len(mapped))
+        else:
+            hi = start
+    return lo
+
+
+def search_sorted_file(path, target, key_parser=None, encoding="utf-8"):
+    """
+    Finds a line by key in a sorted text file using Binary Search on byte offsets.
+
+    Args:
+        path (str): The sorted, newline-delimited file.
+        target: The key to search for.
+        key_parser (callable, optional): A function extracting the key from a line (a str
+                                        without its line ending). Defaults to None (the
+                                        whole line is the key).
+        encoding (str, optional): Text encoding of the file. Defaults to "utf-8".
+
+    Returns:
+        int: The byte offset of the first line whose key equals the target, or -1.
+
+    Raises:
+        TypeError: If key_parser is not callable or keys are not comparable with the target.
+    """
+    if key_parser is not None and not callable(key_parser):
+        raise TypeError("key_parser must be a callable function")
+    with _mapped(path) as mapped:
+        if mapped is None:
+            return -1  # Early return for empty files
+        try:
+            offset = _bound(mapped, target, key_parser, encoding)
+            if offset == len(mapped):
+                return -1
+            line, _ = _line_at(mapped, offset, encoding)
+            key = key_parser(line) if key_parser else line
+        except TypeError as e:
+            raise TypeError(f"Elements are not comparable with target: {e}")
+        return offset if key == target else -1
+
+
+def iter_file_range(path, lo=None, hi=None, key_parser=None, inclusive=(True, False), encoding="utf-8"):
+    """
+    Streams the lines of a sorted text file whose keys lie between lo and hi.
+
+    The start is found by Binary Search, then lines are read forward until a key passes hi,
+    so only the matching part of the file (and O(log n) probed lines) is read. The file stays
+    open until the generator finishes or is closed.
+
+    Args:
+        path (str): The sorted, newline-delimited file.
+        lo (optional): Lower bound, or None for no lower bound. Defaults to None.
+        hi (optional): Upper bound, or None for no upper bound. Defaults to None.
+        key_parser (callable, optional): As for search_sorted_file().
+        inclusive (tuple, optional): Whether (lo, hi) themselves are included.
+                                     Defaults to (True, False), i.e. lo <= key < hi.
+        encoding (str, optional): Text encoding of the file. Defaults to "utf-8".
+
+    Returns:
+        generator: The matching lines (without line endings), in file order.
+
+    Raises:
+        TypeError: If key_parser is not callable or keys are not comparable with the bounds.
+        ValueError: If inclusive is not a pair.
+    """
+    if key_parser is not None and not callable(key_parser):
+        raise TypeError("key_parser must be a callable function")
+    if len(inclusive) != 2:
+        raise ValueError("inclusive must be a pair of booleans (lo, hi)")
+    include_lo, include_hi = inclusive
+
+    def generate():
+        with _mapped(path) as mapped:
+            if mapped is None:
+                return
+            try:
+                offset = 0 if lo is None else _bound(mapped, lo, key_parser, encoding,
+                                                     "left" if include_lo else "right")
+                while offset < len(mapped):
+                    line, offset = _line_at(mapped, offset, encoding)
+                    if hi is not None:
+                        key = key_parser(line) if key_parser else line
+                        if hi < key or (key == hi and not include_hi):
+                            return
+                    yield line
+            except TypeError as e:
+                raise TypeError(f"Elements are not comparable with target: {e}")
+
+    return generate()
+
+
+def check_sorted_file(path, key_parser=None, encoding="utf-8"):
+    """
+    Reads a file once and checks that its lines are sorted by key.
+
+    Raises:
+        ValueError: If a line's key is smaller than the previous line's.
+        TypeError: If keys are not comparable.
+    """
+    previous = None
+    for number, line in enumerate(iter_file_range(path, key_parser=key_parser, encoding=encoding), 1):
+        key = key_parser(line) if key_parser else line
+        try:
+            if previous is not None and key < previous:
+                raise ValueError(f"File must be sorted in ascending order (line {number})")
+        except TypeError as e:
+            raise TypeError(f"Elements are not comparable: {e}")
+        previous = key
+
+# Example usage and testing
+if __name__ == "__main__":
+    import os
+    import random
+    import tempfile
+    import time
+
+    # A sorted ISBN -> title dump of about 1,000,000 lines (27 MB)
+    random.seed(42)
+    isbns = sorted({f"978-{random.randrange(10 ** 10):010d}" for _ in range(1_000_000)})
+    with tempfile.NamedTemporaryFile("w", suffix=".tsv", delete=False, newline="\n") as f:
+        for i, isbn in enumerate(isbns):
+            f.write(f"{isbn}\tTitle {i}\n")
+        path = f.name
+
+    isbn_of = lambda line: line.split("\t", 1)[0]
+    try:
+        check_sorted_file(path, key_parser=isbn_of)
+        print(f"File: {os.path.getsize(path) / 2 ** 20:.1f} MB, {len(isbns)} lines, sorted")
+
+        probes = random.sample(isbns, 1000) + ["978-0000000000", "978-9999999999x"]
+        start = time.perf_counter()
+        offsets = [search_sorted_file(path, isbn, key_parser=isbn_of) for isbn in probes]
+        elapsed = (time.perf_counter() - start) / len(probes)
+        print(f"{len(probes)} lookups: {elapsed * 1e6:.0f} µs each, "
+              f"misses: {sum(offset == -1 for offset in offsets)}")
+
+        first = isbns[500_000]
+        print(f"search_sorted_file({first!r}) -> offset {search_sorted_file(path, first, key_parser=isbn_of)}")
+        lines = list(iter_file_range(path, isbns[500_000], isbns[500_003], key_parser=isbn_of))
+        print(f"Range [{isbns[500_000]}, {isbns[500_003]}): {lines}")
+    finally:
+        os.unlink(path)
@@ -0,0 +1,162 @@
+"""
+Fractional Cascading (One Search Across Many Sorted Lists)
+=========================================================
+This module provides FractionalCascade, a structure for finding the position of the same
+target in each of k sorted lists. Searching every list separately costs k binary searches,
+O(k log n). Fractional cascading pays that once: after a single binary search in the first
+list, the target's position in each following list is found in O(1).
+
+Each list L_i is augmented into a list M_i: all of L_i merged with every other element of
+M_{i+1} (so M_{k-1} = L_{k-1}). Every position of M_i stores two prefix counts: how many
+elements of L_i come before it, and how many promoted elements of M_{i+1} come before it.
+Once the target's position in M_i is known, the first count is its position in L_i. The
+second says that the promoted elements M_{i+1}[1], [3], ..., [2c - 1] are below the target and
+M_{i+1}[2c + 1] is not, so its position in M_{i+1} is 2c or 2c + 1: one comparison decides.
+
+- Build: O(N) for N elements in total (the augmented lists hold at most 2N elements)
+- Query: O(log n + k) instead of O(k log n)
+- Space Complexity: O(N)
+
+Positions are insertion points, like bisect: with side="left", position p in list i is the
+first index whose key is not less than the target.
+
+Example:
+    cascade = FractionalCascade([[1990, 1995, 2001], [1985, 1999], [2001, 2005]])
+    cascade.search(1999)
+    # Result: [2, 1, 0]
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+
+from searching_algorithms.sorted_sequence import SortedSequence, ensure_sorted
+
+
+class FractionalCascade:
+    """
+    Sorted lists linked so that one binary search locates a target in all of them.
+
+    Attributes:
+        key (callable or None): The function that extracts each element's key.
+    """
+    def __init__(self, lists, key=None):
+        """
+        Build the cascade, calling key() once per element.
+
+        Args:
+            lists (list): The sorted lists (plain lists or SortedSequence objects) to link.
+            key (callable, optional): A function to extract a comparison key from each element.
+                                     Defaults to None (direct comparison).
+
+        Raises:
+            TypeError: If key is not callable or elements are not comparable.
+            ValueError: If any list is not sorted (skipped for a validated SortedSequence).
+        """
+        if key is not None and not callable(key):
+            raise TypeError("key must be a callable function")
+        self.key = key
+
+        key_lists = []
+        for items in lists:
+            data, list_key = ensure_sorted(items, key)
+            key_lists.append([list_key(x) for x in data] if list_key else list(data))
+
+        # Build from the last list upwards: _merged[i] is M_i, and for every position p of
+        # M_i (0..len), _own[i][p] counts L_i elements and _promoted[i][p] counts promoted
+        # elements of M_{i+1} in M_i[:p]
+        self._merged, self._own, self._promoted = [], [], []
+        below = []
+        try:
+            for own_keys in reversed(key_lists):
+                promoted = below[1::2]
+                merged, own_counts, promoted_counts = [], array("q", [0]), array("q", [0])
+                i = j = 0
+                while i < len(own_keys) or j < len(promoted):
+                    if j == len(promoted) or (i < len(own_keys) and not promoted[j] < own_keys[i]):
+                        merged.append(own_keys[i])
+                        i += 1
+                    else:
+                        merged.append(promoted[j])
+                        j += 1
+                    own_counts.append(i)
+                    promoted_counts.append(j)
+                self._merged.append(merged)
+                self._own.append(own_counts)
+                self._promoted.append(promoted_counts)
+                below = merged
+        except TypeError as e:
+            raise TypeError(f"Keys are not comparable: {e}")
+
+        self._merged.reverse()
+        self._own.reverse()
+        self._promoted.reverse()
+
+    def search(self, target, side="left"):
+        """
+        Finds the target's insertion point in every list.
+
+        Args:
+            target: The key to look up.
+            side (str, optional): "left" for the position before equal keys (lower bound),
+                                  "right" for the position after them (upper bound).
+                                  Defaults to "left".
+
+        Returns:
+            list: One insertion point per list, in the order the lists were given.
+
+        Raises:
+            TypeError: If keys are not comparable with the target.
+            ValueError: If side is invalid.
+        """
+        if side not in ("left", "right"):
+            raise ValueError("side must be 'left' or 'right'")
+        if not self._merged:
+            return []
+
+        try:
+            merged = self._merged[0]
+            p = (bisect_left if side == "left" else bisect_right)(merged, target)
+            positions = []
+            for i in range(len(self._merged)):
+                positions.append(self._own[i][p])
+                if i + 1 == len(self._merged):
+                    break
+                # M_{i+1}[2c - 1] is before the target and M_{i+1}[2c + 1] is not
+                below = self._merged[i + 1]
+                p = 2 * self._promoted[i][p]
+                if p < len(below) and (below[p] < target if side == "left" else not target < below[p]):
+                    p += 1
+        except TypeError as e:
+            raise TypeError(f"Keys are not comparable with target: {e}")
+        return positions
+
+    def __len__(self):
+        """Number of lists in the cascade."""
+        return len(self._merged)
+
+# Example usage and testing
+if __name__ == "__main__":
+    # Release years of the albums in each genre, already sorted
+    genres = {
+        "rock": [1969, 1973, 1975, 1979, 1991, 1997],
+        "pop": [1982, 1987, 1991, 2011],
+        "jazz": [1959, 1959, 1964],
+        "electronic": [1977, 1997, 2001, 2013],
+    }
+    cascade = FractionalCascade(list(genres.values()))
+
+    for year in (1991, 1959, 2020, 1900):
+        left = cascade.search(year)
+        right = cascade.search(year, side="right")
+        matches = {name: hi - lo for name, lo, hi in zip(genres, left, right) if hi > lo}
+        print(f"Year {year}: lower bounds {left}, albums per genre {matches}")
+
+    # Records with a key, one list already validated
+    catalog = [SortedSequence([{"isbn": "123"}, {"isbn": "456"}], key=lambda b: b["isbn"]),
+               [{"isbn": "234"}, {"isbn": "789"}]]
+    print(f"ISBN 456: {FractionalCascade(catalog, key=lambda b: b['isbn']).search('456')}")
+
+    try:
+        FractionalCascade([[1, 2], [3, 1]])
+    except ValueError as e:
+        print(f"Error: {e}")
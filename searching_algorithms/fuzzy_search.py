@@ -0,0 +1,306 @@
+"""
+Fuzzy Search (Typo-Tolerant Lookups)
+===================================
+This module finds the strings within a given edit distance of a query, so that a mistyped
+album name or artist ("Pink Flyod") still finds its record. Comparing the query with every
+record costs n edit distance computations; the two indexes here rule most records out first.
+
+levenshtein() computes the edit distance (insertions, deletions, substitutions) with the
+bit-parallel algorithm of Myers and Hyyrö: one column of the dynamic programming table is
+held in the bits of two integers and updated with a handful of integer operations per
+character, O(|b|) operations for strings that fit in a machine word (and still fast beyond,
+since Python integers grow as needed). With max_distance it stops as soon as the distance
+is known to exceed it.
+
+BKTree (Burkhard-Keller tree): each node holds a string, and its children are keyed by their
+distance from it. Because edit distance is a metric, a query at distance q from a node can
+only have matches within d in the children keyed q - d .. q + d; other subtrees are skipped.
+- Build: O(n log n) distance computations on average
+- Query: visits a fraction of the nodes that shrinks as d gets smaller
+
+NGramIndex: every string is padded and split into its n-grams ("pink" -> "##p", "#pi", "pin",
+"ink", "nk#", "k##"). One edit changes at most n of them, so a string within distance d of
+the query shares at least g - d * n of the query's g distinct n-grams. Counting shared
+n-grams over the posting lists and filtering by length gives the candidates, which are then
+verified with levenshtein().
+- Query: O(total length of the query's posting lists) plus one distance per candidate
+
+Both return (distance, record) pairs sorted by distance. For d = 0 use a HashIndex.
+
+Example:
+    names = BKTree(["pink floyd", "pink", "the floyd"])
+    names.search("pink flyod", 2)
+    # Result: [(2, "pink floyd")]
+"""
+
+from array import array
+from collections import Counter
+
+
+def levenshtein(a, b, max_distance=None):
+    """
+    Computes the edit distance between two strings.
+
+    Args:
+        a (str): The first string.
+        b (str): The second string.
+        max_distance (int, optional): If given, stop early once the distance is known to be
+                                      larger. Defaults to None (always compute it exactly).
+
+    Returns:
+        int: The edit distance, or max_distance + 1 if it is larger than max_distance.
+    """
+    if len(a) > len(b):
+        a, b = b, a  # The shorter string is the bit vector
+    m, n = len(a), len(b)
+    limit = n if max_distance is None else max_distance
+    if n - m > limit:
+        return limit + 1
+    if m == 0:
+        return n
+
+    # peq[c] has bit i set where a[i] == c
+    peq = {}
+    for i, c in enumerate(a):
+        peq[c] = peq.get(c, 0) | (1 << i)
+
+    mask = (1 << m) - 1
+    last = 1 << (m - 1)
+    pv, mv = mask, 0  # Vertical deltas of the current column: +1 bits and -1 bits
+    score = m
+    for j, c in enumerate(b):
+        eq = peq.get(c, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | (~(xh | pv) & mask)
+        mh = pv & xh
+        if ph & last:
+            score += 1
+        elif mh & last:
+            score -= 1
+        # Each remaining character lowers the score by at most one
+        if score - (n - j - 1) > limit:
+            return limit + 1
+        ph = ((ph << 1) | 1) & mask
+        mh = (mh << 1) & mask
+        pv = mh | (~(xv | ph) & mask)
+        mv = ph & xv
+    return score if score <= limit else limit + 1
+
+
+def _check_distance(max_distance):
+    if max_distance < 0:
+        raise ValueError("max_distance must not be negative")
+
+
+class BKTree:
+    """
+    A metric tree over strings for "everything within distance d" queries.
+
+    Attributes:
+        key (callable or None): The function that extracts each record's string.
+    """
+    def __init__(self, records=(), key=None):
+        """
+        Build the tree.
+
+        Args:
+            records (iterable, optional): The records (or strings) to index. Defaults to none.
+            key (callable, optional): A function to extract a string from each record, e.g.
+                                     lambda album: album.album_name.casefold().
+                                     Defaults to None (the records are the strings).
+
+        Raises:
+            TypeError: If key is not callable.
+        """
+        if key is not None and not callable(key):
+            raise TypeError("key must be a callable function")
+        self.key = key
+        # Node i holds the string _keys[i], the records with that string and its children
+        # as {distance: node}
+        self._keys, self._records, self._children = [], [], []
+        self._size = 0
+        for record in records:
+            self.add(record)
+
+    def add(self, record):
+        """Adds a record to the tree."""
+        text = self.key(record) if self.key else record
+        self._size += 1
+        if not self._keys:
+            self._new_node(text, record)
+            return
+        node = 0
+        while True:
+            distance = levenshtein(text, self._keys[node])
+            if distance == 0:
+                self._records[node].append(record)
+                return
+            child = self._children[node].get(distance)
+            if child is None:
+                self._children[node][distance] = self._new_node(text, record)
+                return
+            node = child
+
+    def _new_node(self, text, record):
+        self._keys.append(text)
+        self._records.append([record])
+        self._children.append({})
+        return len(self._keys) - 1
+
+    def search(self, text, max_distance):
+        """
+        Finds the records within an edit distance of a string.
+
+        Args:
+            text (str): The (possibly mistyped) string to look for.
+            max_distance (int): The largest edit distance to accept.
+
+        Returns:
+            list: (distance, record) pairs, nearest first.
+
+        Raises:
+            ValueError: If max_distance is negative.
+        """
+        _check_distance(max_distance)
+        found = []
+        stack = [0] if self._keys else []
+        while stack:
+            node = stack.pop()
+            distance = levenshtein(text, self._keys[node])
+            if distance <= max_distance:
+                found.extend((distance, record) for record in self._records[node])
+            # Only children at distance - d .. distance + d can hold matches
+            for child_distance, child in self._children[node].items():
+                if distance - max_distance <= child_distance <= distance + max_distance:
+                    stack.append(child)
+        found.sort(key=lambda pair: pair[0])
+        return found
+
+    def __len__(self):
+        """Number of records in the tree."""
+        return self._size
+
+
+class NGramIndex:
+    """
+    An n-gram candidate index with edit-distance verification.
+
+    Attributes:
+        key (callable or None): The function that extracts each record's string.
+        n (int): The n-gram length.
+    """
+    def __init__(self, records=(), key=None, n=3):
+        """
+        Build the index.
+
+        Args:
+            records (iterable, optional): The records (or strings) to index. Defaults to none.
+            key (callable, optional): A function to extract a string from each record.
+                                     Defaults to None (the records are the strings).
+            n (int, optional): The n-gram length. Defaults to 3.
+
+        Raises:
+            TypeError: If key is not callable.
+            ValueError: If n is not positive.
+        """
+        if key is not None and not callable(key):
+            raise TypeError("key must be a callable function")
+        if n < 1:
+            raise ValueError("n must be positive")
+        self.key = key
+        self.n = n
+        self._keys, self._records = [], []   # Distinct strings and their records
+        self._ids = {}                       # string -> its position in _keys
+        self._postings = {}                  # n-gram -> array('I') of string ids
+        self._by_length = {}                 # length -> list of string ids
+        self._size = 0
+        for record in records:
+            self.add(record)
+
+    def _grams(self, text):
+        pad = "\x02" * (self.n - 1)
+        padded = pad + text + pad
+        return {padded[i:i + self.n] for i in range(len(padded) - self.n + 1)}
+
+    def add(self, record):
+        """Adds a record to the index."""
+        text = self.key(record) if self.key else record
+        self._size += 1
+        string_id = self._ids.get(text)
+        if string_id is not None:
+            self._records[string_id].append(record)
+            return
+        string_id = len(self._keys)
+        self._ids[text] = string_id
+        self._keys.append(text)
+        self._records.append([record])
+        self._by_length.setdefault(len(text), []).append(string_id)
+        for gram in self._grams(text):
+            postings = self._postings.get(gram)
+            if postings is None:
+                self._postings[gram] = array("I", [string_id])
+            else:
+                postings.append(string_id)
+
+    def search(self, text, max_distance):
+        """
+        Finds the records within an edit distance of a string.
+
+        Args:
+            text (str): The (possibly mistyped) string to look for.
+            max_distance (int): The largest edit distance to accept.
+
+        Returns:
+            list: (distance, record) pairs, nearest first.
+
+        Raises:
+            ValueError: If max_distance is negative.
+        """
+        _check_distance(max_distance)
+        grams = self._grams(text)
+        needed = len(grams) - max_distance * self.n
+
+        if needed > 0:
+            shared = Counter()
+            for gram in grams:
+                shared.update(self._postings.get(gram, ()))
+            candidates = [string_id for string_id, count in shared.items() if count >= needed]
+        else:
+            # Too short to filter on n-grams: every string of a possible length is a candidate
+            candidates = [string_id
+                          for length in range(len(text) - max_distance, len(text) + max_distance + 1)
+                          for string_id in self._by_length.get(length, ())]
+
+        found = []
+        for string_id in candidates:
+            candidate = self._keys[string_id]
+            if abs(len(candidate) - len(text)) > max_distance:
+                continue
+            distance = levenshtein(text, candidate, max_distance)
+            if distance <= max_distance:
+                found.extend((distance, record) for record in self._records[string_id])
+        found.sort(key=lambda pair: pair[0])
+        return found
+
+    def __len__(self):
+        """Number of records in the index."""
+        return self._size
+
+# Example usage and testing
+if __name__ == "__main__":
+    artists = ["pink floyd", "the beatles", "the beach boys", "led zeppelin", "queen",
+               "pink", "the who", "the doors", "black sabbath", "deep purple"]
+
+    print(f"levenshtein('kitten', 'sitting') = {levenshtein('kitten', 'sitting')}")
+    print(f"levenshtein('kitten', 'sitting', max_distance=1) = {levenshtein('kitten', 'sitting', 1)}")
+
+    tree = BKTree(artists)
+    grams = NGramIndex(artists)
+    for query, d in (("pink flyod", 2), ("the beetles", 2), ("quen", 1), ("the", 4)):
+        print(f"'{query}' within {d}: BK-tree {tree.search(query, d)}, n-grams {grams.search(query, d)}")
+
+    try:
+        tree.search("queen", -1)
+    except ValueError as e:
+        print(f"Error: {e}")
@@ -0,0 +1,174 @@
+"""
+Hash Index (Equality Lookups)
+============================
+This module provides HashIndex, a dictionary-backed index for finding records by an exact key
+(an order ID, a member ID, an ISBN). Linear Search answers such lookups in O(n) by comparing
+every record; a hash index computes the key's hash and goes straight to the matching bucket.
+
+- Build: O(n), one key() call per record
+- get / get_all / contains: O(1) average
+- add: O(1) average; remove: O(1) average plus the size of the record's bucket
+- Requirement: Hashable keys (they must not change while the record is indexed)
+
+With unique=True each key maps to a single record and adding a second record with the same
+key raises ValueError. Otherwise each key maps to a bucket (a list) of records in the order
+they were added, so get() returns the earliest and get_all() returns them all.
+
+The index holds references to the records, not copies. Collections keep it next to their own
+list and update both on every add and remove.
+
+Example:
+    orders = HashIndex(key=lambda o: o["order_id"], unique=True)
+    orders.add({"order_id": 7, "total": 4.5})
+    orders.get(7)
+    # Result: {"order_id": 7, "total": 4.5}
+"""
+
+
+class HashIndex:
+    """
+    A dictionary from key to record (unique) or to a bucket of records.
+
+    Attributes:
+        key (callable): The function that extracts each record's key.
+        unique (bool): Whether each key may index at most one record.
+    """
+    def __init__(self, records=(), key=None, unique=False):
+        """
+        Build the index from existing records.
+
+        Args:
+            records (iterable, optional): Records to index in bulk. Defaults to none.
+            key (callable): A function to extract a hashable key from each record.
+            unique (bool, optional): If True, reject a second record with the same key.
+                                     Defaults to False.
+
+        Raises:
+            TypeError: If key is not callable or a key is not hashable.
+            ValueError: If unique and two records share a key.
+        """
+        if not callable(key):
+            raise TypeError("key must be a callable function")
+        self.key = key
+        self.unique = unique
+        self._table = {}
+        self._size = 0
+        for record in records:
+            self.add(record)
+
+    def add(self, record):
+        """
+        Index one record.
+
+        Raises:
+            TypeError: If the record's key is not hashable.
+            ValueError: If unique and a record with the same key is already indexed.
+        """
+        k = self.key(record)
+        try:
+            if self.unique:
+                if k in self._table:
+                    raise ValueError(f"Duplicate key {k!r} in unique index")
+                self._table[k] = record
+            else:
+                bucket = self._table.get(k)
+                if bucket is None:
+                    self._table[k] = [record]
+                else:
+                    bucket.append(record)
+        except TypeError as e:
+            raise TypeError(f"Key is not hashable: {e}")
+        self._size += 1
+
+    def remove(self, record):
+        """
+        Remove one indexed record (matched by identity, then equality).
+
+        Raises:
+            KeyError: If the record is not in the index.
+        """
+        k = self.key(record)
+        if self.unique:
+            if k in self._table and (self._table[k] is record or self._table[k] == record):
+                del self._table[k]
+                self._size -= 1
+                return
+            raise KeyError(k)
+
+        bucket = self._table.get(k, [])
+        for i, candidate in enumerate(bucket):
+            if candidate is record:
+                break
+        else:
+            try:
+                i = bucket.index(record)
+            except ValueError:
+                raise KeyError(k)
+        del bucket[i]
+        if not bucket:
+            del self._table[k]
+        self._size -= 1
+
+    def pop(self, k):
+        """
+        Remove every record with a key.
+
+        Returns:
+            list: The removed records (empty if none had the key).
+        """
+        removed = self._table.pop(k, None)
+        if removed is None:
+            return []
+        removed = [removed] if self.unique else removed
+        self._size -= len(removed)
+        return removed
+
+    def get(self, k, default=None):
+        """Returns the record (or the earliest-added record) with a key, or default."""
+        found = self._table.get(k)
+        if found is None:
+            return default
+        return found if self.unique else found[0]
+
+    def get_all(self, k):
+        """Returns every record with a key, in the order they were added."""
+        found = self._table.get(k)
+        if found is None:
+            return []
+        return [found] if self.unique else list(found)
+
+    def __contains__(self, k):
+        return k in self._table
+
+    def __len__(self):
+        """Number of records indexed."""
+        return self._size
+
+    def __repr__(self):
+        kind = "unique" if self.unique else "multi-value"
+        return f"HashIndex({self._size} records, {len(self._table)} keys, {kind})"
+
+# Example usage and testing
+if __name__ == "__main__":
+    books = [
+        {"isbn": "978-0", "title": "Dune", "copy": 1},
+        {"isbn": "978-1", "title": "Emma", "copy": 1},
+        {"isbn": "978-0", "title": "Dune", "copy": 2},
+    ]
+
+    by_isbn = HashIndex(books, key=lambda b: b["isbn"])
+    print(f"Index: {by_isbn}")
+    print(f"get('978-0'): {by_isbn.get('978-0')}")
+    print(f"get_all('978-0'): {by_isbn.get_all('978-0')}")
+    print(f"'978-9' in index: {'978-9' in by_isbn}")
+
+    by_isbn.remove(books[0])
+    print(f"After removing copy 1: {by_isbn.get_all('978-0')}")
+    print(f"pop('978-1'): {by_isbn.pop('978-1')}, now {by_isbn}")
+
+    members = HashIndex(key=lambda m: m["member_id"], unique=True)
+    members.add({"member_id": 1, "name": "Ada"})
+    try:
+        members.add({"member_id": 1, "name": "Grace"})
+    except ValueError as e:
+        print(f"Error: {e}")
@@ -0,0 +1,221 @@
+"""
+Interpolation Search Algorithm
+=============================
+This module implements Interpolation Search, a refinement of Binary Search for numeric keys.
+Instead of always probing the middle, it estimates where the target should be from the values
+at the ends of the current interval, the way one opens a phone book near "S" for "Smith". On
+uniformly distributed keys (IDs, timestamps) each probe shrinks the interval from n to about
+√n elements, so a search takes O(log log n) probes; on a large array every probe saved is a
+cache miss saved.
+
+- Time Complexity: O(log log n) probes on uniform data, O(log n) worst case (guarded)
+- Space Complexity: O(1)
+- Requirement: Sorted data with numeric keys
+
+Plain interpolation degrades to O(n) probes on skewed data (e.g. exponentially growing keys),
+where the estimate keeps landing next to the same end. The guard here tracks progress: whenever
+an interpolation probe fails to at least halve the interval, the next probe is a plain
+bisection, so no search takes more than about twice Binary Search's probes.
+
+Interpolation-Sequential Search (Knuth) makes a single interpolation probe and then scans
+from there, which suits data so uniform that the first estimate lands within a few slots.
+After SEQUENTIAL_STEPS single steps it gallops (2, 4, 8, ... slots at a time) and finishes by
+Binary Search, so a poor estimate costs O(log d) probes for a distance d rather than O(d).
+
+Both functions return the index of the first occurrence, matching binary_search_iterative, and
+fall back to Binary Search outright for non-numeric keys.
+"""
+
+from bisect import bisect_left
+from math import isfinite
+from numbers import Real
+
+from searching_algorithms.sorted_sequence import SortedSequence, ensure_sorted
+
+SEQUENTIAL_STEPS = 8  # Single steps taken from the estimate before galloping
+
+
+def _first_match(arr, index, target, key):
+    """Returns index if arr[index] holds the target, else -1."""
+    if index < len(arr) and (key(arr[index]) if key else arr[index]) == target:
+        return index
+    return -1
+
+
+def _interpolate(target, low_value, high_value, size):
+    """
+    Estimates the target's offset from low_value across size slots, or returns None when the
+    end values are infinite (or too large for a float) and no estimate can be made.
+    """
+    try:
+        span = high_value - low_value
+        offset = (target - low_value) * size / span
+        if not (isfinite(span) and isfinite(offset)):
+            return None
+    except OverflowError:
+        return None
+    return int(offset)
+
+
+def interpolation_search(arr, target, key=None):
+    """
+    Searches for the target in a sorted list of numeric keys using guarded Interpolation Search.
+
+    Args:
+        arr (list or SortedSequence): The sorted list to search through.
+        target: The value to search for.
+        key (callable, optional): A function to extract a numeric key from each element.
+                                 Defaults to None (direct comparison).
+
+    Returns:
+        int: The index of the first occurrence of the target, or -1 if not found.
+
+    Raises:
+        TypeError: If elements are not comparable with the target or key function is invalid.
+        ValueError: If the list is not sorted (skipped for a validated SortedSequence).
+    """
+    if not arr:
+        return -1  # Early return for empty lists
+
+    # Validate input types
+    if key is not None and not callable(key):
+        raise TypeError("key must be a callable function")
+
+    # Check sorted order (skipped for an already-validated SortedSequence)
+    arr, key = ensure_sorted(arr, key)
+
+    try:
+        lo, hi = 0, len(arr) - 1
+        low_value = key(arr[lo]) if key else arr[lo]
+        if not (isinstance(low_value, Real) and isinstance(target, Real)):
+            return _first_match(arr, bisect_left(arr, target, key=key), target, key)
+        if not low_value < target:
+            return lo if low_value == target else -1
+        high_value = key(arr[hi]) if key else arr[hi]
+        if high_value < target:
+            return -1  # Above every key
+
+        # Invariant: value(lo) < target <= value(hi), so the first occurrence is in (lo, hi]
+        bisect_next = False
+        while hi - lo > 1:
+            size = hi - lo
+            offset = None if bisect_next else _interpolate(target, low_value, high_value, size)
+            if offset is None:
+                probe = (lo + hi) // 2
+            else:
+                # Estimate the position from the end values, kept strictly inside (lo, hi)
+                probe = min(max(lo + offset, lo + 1), hi - 1)
+
+            value = key(arr[probe]) if key else arr[probe]
+            if value < target:
+                lo, low_value = probe, value
+            else:
+                hi, high_value = probe, value
+
+            # Fall back to bisection for one probe if this one did not halve the interval
+            bisect_next = not bisect_next and (hi - lo) * 2 > size
+    except TypeError as e:
+        raise TypeError(f"Elements are not comparable with target: {e}")
+
+    return hi if high_value == target else -1
+
+def interpolation_sequential_search(arr, target, key=None):
+    """
+    Searches for the target with one interpolation probe followed by a sequential scan.
+
+    Args:
+        arr (list or SortedSequence): The sorted list to search through.
+        target: The value to search for.
+        key (callable, optional): A function to extract a numeric key from each element.
+                                 Defaults to None (direct comparison).
+
+    Returns:
+        int: The index of the first occurrence of the target, or -1 if not found.
+
+    Raises:
+        TypeError: If elements are not comparable with the target or key function is invalid.
+        ValueError: If the list is not sorted (skipped for a validated SortedSequence).
+    """
+    if not arr:
+        return -1  # Early return for empty lists
+
+    # Validate input types
+    if key is not None and not callable(key):
+        raise TypeError("key must be a callable function")
+
+    # Check sorted order (skipped for an already-validated SortedSequence)
+    arr, key = ensure_sorted(arr, key)
+
+    n = len(arr)
+
+    try:
+        low_value = key(arr[0]) if key else arr[0]
+        high_value = key(arr[-1]) if key else arr[-1]
+        if not (isinstance(low_value, Real) and isinstance(target, Real)):
+            return _first_match(arr, bisect_left(arr, target, key=key), target, key)
+        if not low_value < target:
+            return 0 if low_value == target else -1
+        if high_value < target:
+            return -1  # Above every key
+
+        probe = _interpolate(target, low_value, high_value, n - 1)
+        if probe is None:
+            probe = n // 2  # Infinite end values: start from the middle instead
+        probe = min(max(probe, 1), n - 1)
+        value = key(arr[probe]) if key else arr[probe]
+
+        if value < target:
+            # Walk right: the first occurrence is in (probe, n)
+            lo, hi, step = probe, n, 1
+            while lo + step < n:
+                if not (key(arr[lo + step]) if key else arr[lo + step]) < target:
+                    hi = lo + step
+                    break
+                lo += step
+                if lo - probe >= SEQUENTIAL_STEPS:
+                    step *= 2  # The estimate was poor: gallop instead of stepping
+            index = bisect_left(arr, target, lo + 1, hi, key=key)
+        else:
+            # Walk left: the first occurrence is in (0, probe]
+            lo, hi, step = 0, probe, 1
+            while hi - step > 0:
+                if (key(arr[hi - step]) if key else arr[hi - step]) < target:
+                    lo = hi - step
+                    break
+                hi -= step
+                if probe - hi >= SEQUENTIAL_STEPS:
+                    step *= 2
+            index = bisect_left(arr, target, lo + 1, hi, key=key)
+    except TypeError as e:
+        raise TypeError(f"Elements are not comparable with target: {e}")
+
+    return _first_match(arr, index, target, key)
+
+# Example usage and testing
+if __name__ == "__main__":
+    # Test cases to demonstrate Interpolation Search behavior
+    test_cases = [
+        (list(range(0, 1000, 10)), 370, None),                      # Uniform, target present
+        (list(range(0, 1000, 10)), 375, None),                      # Uniform, target absent
+        ([2 ** i for i in range(60)], 2 ** 40, None),               # Skewed (guard kicks in)
+        ([1, 2, 2, 2, 3], 2, None),                                 # Multiple occurrences
+        ([], 1, None),                                              # Empty list
+        ([{"ts": 1.5}, {"ts": 2.5}, {"ts": 9.0}], 2.5, lambda x: x["ts"]),  # Custom key
+        (["apple", "fig", "kiwi"], "fig", None),                    # Non-numeric (binary fallback)
+        ([float("-inf"), 1, 2, float("inf")], 2, None),             # Infinite ends (bisection)
+    ]
+
+    # Run and display results for each test case
+    for arr, target, key_func in test_cases:
+        try:
+            index_interp = interpolation_search(arr, target, key=key_func)
+            index_seq = interpolation_sequential_search(arr, target, key=key_func)
+            shown = arr if len(arr) <= 10 else f"[{arr[0]}, ..., {arr[-1]}] ({len(arr)} items)"
+            print(f"Input: {shown}, Target: {target} -> Interpolation: {index_interp}, "
+                  f"Interpolation-Sequential: {index_seq}")
+        except (TypeError, ValueError) as e:
+            print(f"Error for input {arr}, target {target}: {e}")
+
+    # Validate once, then search repeatedly without rescanning
+    timestamps = SortedSequence(list(range(1_600_000_000, 1_600_100_000, 7)))
+    print(f"SortedSequence lookup: {interpolation_search(timestamps, 1_600_050_001)}")
@@ -0,0 +1,253 @@
+"""
+Inverted Index (Full-Text Search)
+================================
+This module provides InvertedIndex, which finds the records containing given words without
+scanning them. Each record's text is split into tokens (lower-cased words), and every token
+maps to a posting list: the sorted ids of the records that contain it. A query looks up one
+posting list per word and combines them:
+
+- AND: the intersection, computed from the shortest list outwards. Each id of the shorter
+  list is located in the longer one by galloping (exponential search from the previous
+  position, then a bisect), so the cost depends on the shorter list, not the longer. Lists
+  of similar length (within GALLOP_RATIO) are intersected as sets instead, which runs in C.
+- OR: the union of the lists.
+
+- Add / remove / update: O(t) posting changes for a record of t tokens
+- AND query: O(s log(l / s)) per pair of lists of sizes s <= l
+- Space Complexity: 4 bytes per (token, record) pair, in array('I') posting lists
+
+Record ids increase as records are added, so new postings are appended and each list stays
+sorted. Ids are stored whole rather than delta-encoded: galloping needs to jump to any
+position of a list, and a fixed four bytes per id is already compact.
+
+Example:
+    index = InvertedIndex(["Dune by Frank Herbert", "Emma by Jane Austen"])
+    index.search("frank dune")
+    # Result: ["Dune by Frank Herbert"]
+"""
+
+import re
+from array import array
+from bisect import bisect_left
+
+_WORD = re.compile(r"\w+")
+GALLOP_RATIO = 16  # Gallop only when one list is this much longer; otherwise intersect sets in C
+
+
+def tokenize(text):
+    """Splits text into lower-cased words (case-insensitive, punctuation ignored)."""
+    return _WORD.findall(text.casefold())
+
+
+def _intersect(small, large):
+    """Returns the ids in both sorted sequences, galloping through the larger one."""
+    if len(large) < GALLOP_RATIO * len(small):
+        return sorted(set(small).intersection(large))
+    found = []
+    n = len(large)
+    pos = 0
+    for doc_id in small:
+        # Gallop from the previous position until large[hi] >= doc_id, then bisect
+        lo = hi = pos
+        step = 1
+        while hi < n and large[hi] < doc_id:
+            lo = hi + 1
+            hi = pos + step
+            step *= 2
+        pos = bisect_left(large, doc_id, lo, min(hi, n))
+        if pos == n:
+            break
+        if large[pos] == doc_id:
+            found.append(doc_id)
+    return found
+
+
+class InvertedIndex:
+    """
+    A word -> records index supporting AND/OR queries.
+
+    Attributes:
+        key (callable or None): The function that extracts each record's text.
+        tokenize (callable): The function that splits text into tokens.
+    """
+    def __init__(self, records=(), key=None, tokenize=tokenize):
+        """
+        Build the index.
+
+        Args:
+            records (iterable, optional): Records to index. Defaults to none.
+            key (callable, optional): A function to extract the text of each record, e.g.
+                                     lambda book: f"{book.title} {book.author}".
+                                     Defaults to None (the records are the text).
+            tokenize (callable, optional): A function splitting text into tokens.
+                                          Defaults to lower-cased words.
+
+        Raises:
+            TypeError: If key or tokenize is not callable.
+        """
+        if key is not None and not callable(key):
+            raise TypeError("key must be a callable function")
+        if not callable(tokenize):
+            raise TypeError("tokenize must be a callable function")
+        self.key = key
+        self.tokenize = tokenize
+        self._postings = {}   # token -> array('I') of record ids, ascending
+        self._records = {}    # record id -> record
+        self._ids = {}        # id(record) -> record id
+        self._tokens = {}     # record id -> the record's distinct tokens
+        self._next_id = 0
+        for record in records:
+            self.add(record)
+
+    def _terms(self, record):
+        return set(self.tokenize(self.key(record) if self.key else record))
+
+    def add(self, record):
+        """
+        Index a record.
+
+        Raises:
+            ValueError: If the record (the same object) is already indexed.
+        """
+        if id(record) in self._ids:
+            raise ValueError("Record is already indexed")
+        doc_id = self._next_id
+        self._next_id += 1
+        self._ids[id(record)] = doc_id
+        self._records[doc_id] = record
+        self._tokens[doc_id] = self._terms(record)
+        self._post(doc_id, self._tokens[doc_id])
+
+    def _post(self, doc_id, terms):
+        """Adds a record id to the posting lists of some tokens."""
+        for term in terms:
+            postings = self._postings.get(term)
+            if postings is None:
+                self._postings[term] = array("I", [doc_id])
+            elif postings[-1] < doc_id:
+                postings.append(doc_id)
+            else:
+                postings.insert(bisect_left(postings, doc_id), doc_id)  # Re-indexed record
+
+    def _unpost(self, doc_id, terms):
+        """Removes a record id from the posting lists of some tokens."""
+        for term in terms:
+            postings = self._postings[term]
+            del postings[bisect_left(postings, doc_id)]
+            if not postings:
+                del self._postings[term]
+
+    def remove(self, record):
+        """
+        Remove a record from the index.
+
+        Raises:
+            KeyError: If the record is not indexed.
+        """
+        doc_id = self._ids.pop(id(record), None)
+        if doc_id is None:
+            raise KeyError("Record is not indexed")
+        self._unpost(doc_id, self._tokens.pop(doc_id))
+        del self._records[doc_id]
+
+    def update(self, record):
+        """
+        Re-index a record whose text has changed (only the changed tokens are touched).
+
+        Raises:
+            KeyError: If the record is not indexed.
+        """
+        doc_id = self._ids.get(id(record))
+        if doc_id is None:
+            raise KeyError("Record is not indexed")
+        old, new = self._tokens[doc_id], self._terms(record)
+        self._unpost(doc_id, old - new)
+        self._post(doc_id, new - old)
+        self._tokens[doc_id] = new
+
+    def search(self, query, mode="and"):
+        """
+        Finds the records matching the words of a query.
+
+        Args:
+            query (str): The words to look for (split with the index's tokenizer).
+            mode (str, optional): "and" for records containing every word, "or" for records
+                                  containing any of them. Defaults to "and".
+
+        Returns:
+            list: The matching records, in the order they were added.
+
+        Raises:
+            ValueError: If mode is invalid.
+        """
+        if mode not in ("and", "or"):
+            raise ValueError("mode must be 'and' or 'or'")
+        terms = set(self.tokenize(query))
+        if not terms:
+            return []
+
+        lists = [self._postings.get(term, ()) for term in terms]
+        if mode == "or":
+            doc_ids = sorted(set().union(*lists))
+        else:
+            lists.sort(key=len)
+            doc_ids = lists[0]
+            for postings in lists[1:]:
+                if not doc_ids:
+                    break
+                doc_ids = _intersect(doc_ids, postings)
+        return [self._records[doc_id] for doc_id in doc_ids]
+
+    def document_frequency(self, token):
+        """Number of records containing a token."""
+        return len(self._postings.get(token, ()))
+
+    def __contains__(self, record):
+        return id(record) in self._ids
+
+    def __len__(self):
+        """Number of records indexed."""
+        return len(self._records)
+
+    def __repr__(self):
+        return f"InvertedIndex({len(self._records)} records, {len(self._postings)} tokens)"
+
+# Example usage and testing
+if __name__ == "__main__":
+    import itertools
+    import random
+    import time
+
+    books = ["Dune by Frank Herbert", "Dune Messiah by Frank Herbert",
+             "Emma by Jane Austen", "Persuasion by Jane Austen", "The Dune Encyclopedia"]
+    index = InvertedIndex(books)
+    print(f"Index: {index}")
+    print(f"AND 'dune herbert': {index.search('dune herbert')}")
+    print(f"OR 'emma persuasion': {index.search('Emma, Persuasion', mode='or')}")
+    print(f"Missing word: {index.search('dune austen')}")
+
+    # Records with a key, updated in place
+    records = [{"title": "Emma", "author": "Jane Austen"}]
+    by_text = InvertedIndex(records, key=lambda r: f"{r['title']} {r['author']}")
+    records[0]["title"] = "Sense and Sensibility"
+    by_text.update(records[0])
+    print(f"After update, 'emma': {by_text.search('emma')}, 'sense': {by_text.search('sense')}")
+
+    # A million synthetic books: a multi-word query takes milliseconds
+    random.seed(42)
+    vocabulary = [f"w{i}" for i in range(50_000)]
+    cumulative = list(itertools.accumulate(1 / (rank + 1) for rank in range(len(vocabulary))))  # Zipf-like
+    start = time.perf_counter()
+    big = InvertedIndex(" ".join(random.choices(vocabulary, cum_weights=cumulative, k=6)) for _ in range(1_000_000))
+    print(f"Built {big} in {time.perf_counter() - start:.1f}s")
+    for query in ("w0 w1", "w0 w1 w2", "w3 w500", "w0 w49999"):
+        start = time.perf_counter()
+        found = big.search(query)
+        elapsed = time.perf_counter() - start
+        sizes = [big.document_frequency(word) for word in query.split()]
+        print(f"'{query}' (postings {sizes}): {len(found)} records in {elapsed * 1e3:.2f} ms")
+
+    try:
+        index.search("dune", mode="not")
+    except ValueError as e:
+        print(f"Error: {e}")
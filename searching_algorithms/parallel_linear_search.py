@@ -0,0 +1,275 @@
+"""
+Parallel Linear Search Algorithm
+===============================
+This module implements a parallel, chunked Linear Search for large unsorted data. The data is
+split into many more chunks than there are worker processes, the chunks are scanned in
+parallel, and the lowest matching index wins. Numeric data (an array.array, a NumPy array, or
+a list of all-int or all-float values) is placed in a multiprocessing.shared_memory block that
+every worker attaches to by name, so the values are never pickled; other lists are sent to
+the workers chunk by chunk.
+
+Early cancellation: the parent keeps the lowest hit found so far in a one-slot shared block.
+Workers check it between blocks of CHECK_INTERVAL elements and give up as soon as a hit
+earlier than their position is known; chunks not yet started are cancelled. The search
+returns once a hit is found and every chunk before it has finished without one.
+
+- Time Complexity: O(n / p) per worker for p workers (O(i / p) for a match at index i)
+- Space Complexity: O(n) for the shared block (numeric data)
+- Requirement: None (no need for sorted data)
+
+Fast paths skip the processes entirely when there is nothing to parallelise in Python:
+searching for a target without a key uses list.index (a C loop) on lists and arrays, and
+numpy.flatnonzero on NumPy arrays, block by block so it can stop at the first hit. Inputs
+below SEQUENTIAL_CUTOFF elements, and key or predicate functions that cannot be pickled (such
+as lambdas), are searched in-process.
+"""
+
+import os
+import pickle
+from array import array
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from multiprocessing import shared_memory
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None
+
+SEQUENTIAL_CUTOFF = 100_000  # Below this many elements, process start-up costs more than it saves
+CHUNKS_PER_WORKER = 8        # More chunks than workers lets early hits cancel the rest
+CHECK_INTERVAL = 16_384      # Elements scanned between checks of the shared best-hit slot
+
+_NO_TARGET = object()  # Distinguishes "no target given" from searching for None
+
+
+def _attach(name, typecode, length):
+    """Attaches to a shared block and returns it with a typed view of its first `length` items."""
+    shm = shared_memory.SharedMemory(name=name)
+    itemsize = array(typecode).itemsize
+    view = shm.buf[:length * itemsize].cast(typecode)
+    return shm, view
+
+
+def _scan(items, offset, target, key, predicate, best=None):
+    """
+    Returns offset + i for the first matching items[i], or -1.
+
+    Stops early (returning -1) once best[0] shows a hit before the current position.
+    """
+    for block_start in range(0, len(items), CHECK_INTERVAL):
+        if best is not None and best[0] < offset + block_start:
+            return -1  # An earlier chunk already has a match
+        for i in range(block_start, min(block_start + CHECK_INTERVAL, len(items))):
+            value = key(items[i]) if key else items[i]
+            if predicate(value) if predicate else value == target:
+                return offset + i
+    return -1
+
+
+def _scan_chunk(chunk, offset, target, key, predicate, best_name):
+    """Worker: scans a pickled chunk of a list."""
+    best_shm, best = _attach(best_name, "q", 1)
+    try:
+        return _scan(chunk, offset, target, key, predicate, best)
+    finally:
+        best.release()
+        best_shm.close()
+
+
+def _scan_shared(name, typecode, length, start, stop, target, key, predicate, best_name):
+    """Worker: scans data[start:stop] of a shared numeric block."""
+    shm, view = _attach(name, typecode, length)
+    best_shm, best = _attach(best_name, "q", 1)
+    try:
+        chunk = view[start:stop]
+        try:
+            return _scan(chunk, start, target, key, predicate, best)
+        finally:
+            chunk.release()
+    finally:
+        view.release()
+        best.release()
+        shm.close()
+        best_shm.close()
+
+
+def _picklable(function):
+    """True if function can be sent to a worker process."""
+    try:
+        pickle.dumps(function)
+        return True
+    except (pickle.PicklingError, AttributeError, TypeError):
+        return False
+
+
+def _numeric_buffer(arr):
+    """Returns arr as an array.array if it holds plain numbers of one type, else None."""
+    if isinstance(arr, array):
+        return arr if arr.typecode != "u" else None
+    if np is not None and isinstance(arr, np.ndarray):
+        if arr.ndim == 1 and arr.dtype.char in "bBhHiIlLqQfd":
+            return array(arr.dtype.char, arr.tobytes())
+        return None
+    if all(type(x) is int for x in arr):
+        try:
+            return array("q", arr)
+        except OverflowError:
+            return None  # Integers too wide for a 64-bit buffer
+    if all(type(x) is float for x in arr):
+        return array("d", arr)
+    return None
+
+
+def parallel_linear_search(arr, target=_NO_TARGET, key=None, predicate=None, workers=None):
+    """
+    Finds the first element equal to the target (or satisfying a predicate) using worker
+    processes over chunks of the data.
+
+    Args:
+        arr (list, array.array or numpy.ndarray): The data to search through (need not be sorted).
+        target (optional): The value to search for. Required unless a predicate is given.
+        key (callable, optional): A function to extract a comparison key from each element.
+                                 Defaults to None (direct comparison).
+        predicate (callable, optional): A function (key value) -> bool to use instead of
+                                       equality with a target. Defaults to None.
+        workers (int, optional): Number of worker processes. Defaults to os.cpu_count().
+
+    Returns:
+        int: The index of the first match, or -1 if nothing matches.
+
+    Raises:
+        TypeError: If key or predicate is not callable, or elements are not comparable.
+        ValueError: If neither or both of target and predicate are given, or workers is
+                    not a positive integer.
+    """
+    if key is not None and not callable(key):
+        raise TypeError("key must be a callable function")
+    if predicate is not None and not callable(predicate):
+        raise TypeError("predicate must be a callable function")
+    if (predicate is None) == (target is _NO_TARGET):
+        raise ValueError("Give either a target or a predicate")
+    if workers is None:
+        workers = os.cpu_count() or 1
+    elif workers < 1:
+        raise ValueError("workers must be a positive integer")
+
+    n = len(arr)
+    if n == 0:
+        return -1  # Early return for empty lists
+
+    # Fast paths: plain equality runs in C already
+    if key is None and predicate is None:
+        if np is not None and isinstance(arr, np.ndarray):
+            for block_start in range(0, n, CHECK_INTERVAL * 64):
+                hits = np.flatnonzero(arr[block_start:block_start + CHECK_INTERVAL * 64] == target)
+                if hits.size:
+                    return block_start + int(hits[0])
+            return -1
+        if isinstance(arr, (list, array)):
+            try:
+                return arr.index(target)
+            except ValueError:
+                return -1
+            except TypeError as e:
+                raise TypeError(f"Elements are not comparable with target: {e}")
+
+    if (workers == 1 or n < SEQUENTIAL_CUTOFF
+            or not all(_picklable(f) for f in (key, predicate) if f is not None)):
+        try:
+            return _scan(arr, 0, target, key, predicate)
+        except TypeError as e:
+            raise TypeError(f"Elements are not comparable with target: {e}")
+
+    chunk_count = workers * CHUNKS_PER_WORKER
+    bounds = [n * c // chunk_count for c in range(chunk_count + 1)]
+    buffer = _numeric_buffer(arr)
+
+    best_shm = shared_memory.SharedMemory(create=True, size=8)
+    best = best_shm.buf[:8].cast("q")
+    best[0] = n  # No hit yet
+    shm = None
+    try:
+        if buffer is not None:
+            nbytes = len(buffer) * buffer.itemsize
+            shm = shared_memory.SharedMemory(create=True, size=max(1, nbytes))
+            shm.buf[:nbytes] = buffer.tobytes()
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            # Submit chunks in order, so the pool starts with the front of the data
+            futures = []
+            for c in range(chunk_count):
+                start, stop = bounds[c], bounds[c + 1]
+                if shm is not None:
+                    futures.append(pool.submit(_scan_shared, shm.name, buffer.typecode, len(buffer),
+                                               start, stop, target, key, predicate, best_shm.name))
+                else:
+                    futures.append(pool.submit(_scan_chunk, arr[start:stop], start, target, key,
+                                               predicate, best_shm.name))
+
+            chunk_of = {future: c for c, future in enumerate(futures)}
+            results = [None] * chunk_count
+            pending = set(futures)
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    if future.cancelled():
+                        continue
+                    c = chunk_of[future]
+                    results[c] = future.result()
+                    if results[c] != -1 and results[c] < best[0]:
+                        best[0] = results[c]  # Tell later chunks to stop
+                        for later in futures[c + 1:]:
+                            later.cancel()
+
+                # The answer is final once every chunk before the best hit has reported
+                if best[0] < n:
+                    hit_chunk = next(c for c in range(chunk_count) if results[c] == best[0])
+                    if all(results[c] is not None for c in range(hit_chunk)):
+                        break
+            pool.shutdown(cancel_futures=True)
+
+        return best[0] if best[0] < n else -1
+    except TypeError as e:
+        raise TypeError(f"Elements are not comparable with target: {e}")
+    finally:
+        best.release()
+        best_shm.close()
+        best_shm.unlink()
+        if shm is not None:
+            shm.close()
+            shm.unlink()
+
+
+def _is_negative(value):
+    """Example predicate (module-level so it can be pickled to workers)."""
+    return value < 0
+
+# Example usage and testing
+if __name__ == "__main__":
+    import random
+    import time
+
+    # Test cases to demonstrate Parallel Linear Search behavior
+    random.seed(42)
+    big = [random.randint(0, 10 ** 6) for _ in range(2_000_000)]
+    big[1_500_000] = -7
+    test_cases = [
+        ([64, 34, 25, 12, 22, 11, 90], 25, None, None),        # Small list, fast path
+        ([5, 4, 3, 2, 1], 6, None, None),                      # Target absent
+        ([], 1, None, None),                                   # Empty list
+        ([{"val": 3}, {"val": 1}], 1, lambda x: x["val"], None),  # Lambda key, in-process
+        (big, _NO_TARGET, None, _is_negative),                 # Parallel predicate search
+        (big, _NO_TARGET, abs, _is_negative),                  # Parallel, nothing matches
+    ]
+
+    # Run and display results for each test case
+    for arr, target, key_func, pred in test_cases:
+        shown = arr if len(arr) <= 10 else f"<{len(arr)} numbers>"
+        try:
+            start = time.perf_counter()
+            index = parallel_linear_search(arr, target, key=key_func, predicate=pred, workers=4)
+            elapsed = time.perf_counter() - start
+            print(f"Input: {shown}, Target: {'-' if target is _NO_TARGET else target}, "
+                  f"Predicate: {pred} -> {index} ({elapsed:.3f}s)")
+        except (TypeError, ValueError) as e:
+            print(f"Error for input {shown}: {e}")
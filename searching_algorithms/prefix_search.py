@@ -0,0 +1,272 @@
+"""
+Prefix Search (Autocomplete)
+===========================
+This module finds every string that starts with a given prefix, for autocomplete over album
+names, book titles and authors. It offers two ways to do it:
+
+1. prefix_range() / complete(): binary search over an already sorted list of strings.
+   Cutting every string to the prefix's length keeps the list sorted, so the strings with the
+   prefix are the run equal to the prefix under that cut: two bisects find it.
+   - Time Complexity: O(m log n) for a prefix of length m, plus O(k) for k completions
+   - Space Complexity: O(1) beyond the list
+
+2. RadixTree: a compressed trie over the (distinct) keys, stored as flat arrays rather than
+   node objects. A node's children are consecutive node ids, so a child is found by looking
+   up its first character in one string and adding the position to a base id. Every node
+   covers a contiguous span of the sorted keys: finding the prefix's node walks at most m
+   characters, and its completions are then a slice of the sorted keys.
+   - Build: O(n log n) for n records
+   - Query: O(m + k) for k completions, independent of n
+   - Space Complexity: O(n) nodes (at most 2 per distinct key)
+
+The tree is built once from a set of records. Collections that change rebuild it on the next
+query after an add or remove, as AlbumCollection does for its release-year index.
+
+Example:
+    titles = RadixTree(["dune", "dune messiah", "emma"])
+    titles.complete("dun")
+    # Result: ["dune", "dune messiah"]
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+
+from searching_algorithms.sorted_sequence import SortedSequence, ensure_sorted
+
+
+def prefix_range(arr, prefix, key=None):
+    """
+    Finds the run of strings that start with a prefix in a sorted list.
+
+    Args:
+        arr (list): The sorted list of strings (or records) to search through.
+        prefix (str): The prefix to look up.
+        key (callable, optional): A function to extract the string from each element.
+                                 Defaults to None (the elements are strings).
+
+    Returns:
+        range: The indices of the elements starting with the prefix (empty if none do).
+
+    Raises:
+        TypeError: If key is not callable or the elements are not strings.
+        ValueError: If the input list is not sorted (skipped for a validated SortedSequence).
+    """
+    data, key = ensure_sorted(arr, key)
+    m = len(prefix)
+    cut = (lambda x: key(x)[:m]) if key else (lambda x: x[:m])
+    try:
+        lo = bisect_left(data, prefix, key=cut)
+        hi = bisect_right(data, prefix, lo, key=cut)
+    except TypeError as e:
+        raise TypeError(f"Elements are not comparable with target: {e}")
+    return range(lo, hi)
+
+
+def complete(arr, prefix, k=10, key=None):
+    """
+    Returns the first k elements (in sorted order) that start with a prefix.
+
+    Args:
+        arr (list): The sorted list of strings (or records) to search through.
+        prefix (str): The prefix to complete.
+        k (int, optional): Maximum number of completions. Defaults to 10.
+        key (callable, optional): A function to extract the string from each element.
+
+    Returns:
+        list: Up to k elements starting with the prefix.
+
+    Raises:
+        TypeError, ValueError: As for prefix_range().
+    """
+    found = prefix_range(arr, prefix, key)
+    data = arr.data if isinstance(arr, SortedSequence) else arr
+    return list(data[found.start:min(found.stop, found.start + k)])
+
+
+def _common_prefix_length(a, b, start):
+    """Length of the common prefix of a and b, known to agree on their first `start` characters."""
+    end = min(len(a), len(b))
+    i = start
+    while i < end and a[i] == b[i]:
+        i += 1
+    return i
+
+
+class RadixTree:
+    """
+    A compressed trie mapping string keys to records, for prefix queries.
+
+    Attributes:
+        key (callable or None): The function that extracts each record's string key.
+    """
+    def __init__(self, records=(), key=None):
+        """
+        Build the tree.
+
+        Args:
+            records (iterable, optional): The records (or strings) to index. Defaults to none.
+            key (callable, optional): A function to extract a string key from each record,
+                                     e.g. lambda album: album.album_name.casefold().
+                                     Defaults to None (the records are the keys).
+
+        Raises:
+            TypeError: If key is not callable or a key is not a string.
+        """
+        if key is not None and not callable(key):
+            raise TypeError("key must be a callable function")
+        self.key = key
+
+        pairs = [(key(r) if key else r, r) for r in records]
+        if not all(isinstance(k, str) for k, _ in pairs):
+            raise TypeError("RadixTree keys must be strings")
+        pairs.sort(key=lambda pair: pair[0])
+
+        # Distinct keys in sorted order, each with the records that share it
+        self._keys, self._values = [], []
+        for k, record in pairs:
+            if self._keys and self._keys[-1] == k:
+                self._values[-1].append(record)
+            else:
+                self._keys.append(k)
+                self._values.append([record])
+        self._size = len(pairs)
+
+        # Node arrays: node i covers _keys[_lo[i]:_hi[i]] and was reached by the edge
+        # _label[i]. Its children are the consecutive nodes _base[i], _base[i] + 1, ..., one
+        # per character of _first[i] (the first characters of their edge labels)
+        self._lo, self._hi, self._base = array("I", [0]), array("I", [len(self._keys)]), array("I", [0])
+        self._label, self._first = [""], [""]
+        self._build()
+
+    def _build(self):
+        """Creates the nodes top-down: each node's keys share their first `depth` characters."""
+        keys = self._keys
+        stack = [(0, 0, len(keys), 0)]
+        while stack:
+            node, lo, hi, depth = stack.pop()
+            a = lo
+            if a < hi and len(keys[a]) == depth:
+                a += 1  # The key ending at this node sorts first
+            cut = lambda s: s[:depth + 1]
+            self._base[node] = len(self._lo)
+            first = []
+            while a < hi:
+                # Keys sharing the next character form one child
+                if a + 1 == hi or not keys[a + 1].startswith(keys[a][:depth + 1]):
+                    b, end = a + 1, len(keys[a])  # A single key: a leaf
+                else:
+                    b = bisect_right(keys, keys[a][:depth + 1], a, hi, key=cut)
+                    end = _common_prefix_length(keys[a], keys[b - 1], depth + 1)
+                    stack.append((len(self._lo), a, b, end))
+                self._lo.append(a)
+                self._hi.append(b)
+                self._base.append(0)
+                self._label.append(keys[a][depth:end])
+                self._first.append("")
+                first.append(keys[a][depth])
+                a = b
+            self._first[node] = "".join(first)
+
+    def _span(self, prefix):
+        """Returns the (lo, hi) span of the sorted keys starting with prefix."""
+        node, i = 0, 0
+        while i < len(prefix):
+            j = self._first[node].find(prefix[i])
+            if j < 0:
+                return 0, 0
+            node = self._base[node] + j
+            label = self._label[node]
+            if not label.startswith(prefix[i:i + len(label)]):
+                return 0, 0
+            i += len(label)  # Past the end of prefix if it stops inside this edge
+        return self._lo[node], self._hi[node]
+
+    def complete(self, prefix, k=10):
+        """
+        Returns the first k distinct keys (in sorted order) that start with a prefix.
+
+        Args:
+            prefix (str): The prefix to complete (in the same form as the keys).
+            k (int, optional): Maximum number of completions. Defaults to 10.
+
+        Returns:
+            list: Up to k keys.
+        """
+        lo, hi = self._span(prefix)
+        return self._keys[lo:min(hi, lo + k)]
+
+    def items(self, prefix, k=None):
+        """
+        Returns the records whose keys start with a prefix, in key order.
+
+        Args:
+            prefix (str): The prefix to look up.
+            k (int, optional): Maximum number of records. Defaults to None (all of them).
+
+        Returns:
+            list: The matching records.
+        """
+        lo, hi = self._span(prefix)
+        found = []
+        for i in range(lo, hi):
+            found.extend(self._values[i])
+            if k is not None and len(found) >= k:
+                return found[:k]
+        return found
+
+    def count(self, prefix):
+        """Number of distinct keys that start with a prefix."""
+        lo, hi = self._span(prefix)
+        return hi - lo
+
+    def __contains__(self, key):
+        lo, hi = self._span(key)
+        return hi > lo and self._keys[lo] == key
+
+    def __len__(self):
+        """Number of records in the tree."""
+        return self._size
+
+    def __repr__(self):
+        return f"RadixTree({len(self._keys)} keys, {len(self._lo)} nodes)"
+
+# Example usage and testing
+if __name__ == "__main__":
+    import random
+    import string
+    import time
+
+    words = ["dune", "dune messiah", "children of dune", "emma", "emily", "ember", "em"]
+    tree = RadixTree(words)
+    print(f"Tree: {tree}")
+    for prefix in ("dune", "em", "emi", "x", ""):
+        print(f"complete({prefix!r}): {tree.complete(prefix)}")
+
+    # Sorted-list mode over the same words
+    titles = sorted(words)
+    print(f"prefix_range(titles, 'em'): {prefix_range(titles, 'em')} -> {complete(titles, 'em', k=2)}")
+
+    # A million titles: both modes agree, and queries take microseconds
+    random.seed(42)
+    million = [" ".join("".join(random.choices(string.ascii_lowercase, k=random.randint(2, 8)))
+                        for _ in range(random.randint(1, 4))) for _ in range(1_000_000)]
+    start = time.perf_counter()
+    big = RadixTree(million)
+    print(f"Built {big} in {time.perf_counter() - start:.1f}s")
+    ordered = SortedSequence(sorted(set(million)), trusted=True)
+
+    prefixes = [title[:random.randint(1, 6)] for title in random.sample(million, 1000)]
+    timings = {}
+    for _ in range(2):  # The first pass warms up; report the second
+        for name, query in (("RadixTree", lambda p: big.complete(p, k=10)),
+                            ("sorted list", lambda p: complete(ordered, p, k=10))):
+            start = time.perf_counter()
+            results = [query(p) for p in prefixes]
+            timings[name] = ((time.perf_counter() - start) / len(prefixes), results)
+    print(", ".join(f"{name} {elapsed * 1e6:.1f} µs" for name, (elapsed, _) in timings.items())
+          + f" per top-10 query, same results: {timings['RadixTree'][1] == timings['sorted list'][1]}")
+
+    try:
+        prefix_range(["b", "a"], "a")
+    except ValueError as e:
+        print(f"Error: {e}")
@@ -0,0 +1,162 @@
+"""
+Versioned Result Cache (Memoised Searches)
+=========================================
+This module provides ResultCache, a memoisation layer for search and sort results over a
+collection that changes now and then. Dashboards ask the same questions (albums of a genre,
+albums sorted by song count, titles starting with "the") many times between changes;
+with a cache each repeat costs one dictionary lookup instead of a scan or a sort.
+
+Results are keyed by (collection version, query, key function). The collection increments
+its version on every mutation, so a result computed before a change can never be returned
+after it. When a newer version is seen, every older entry is dropped at once, so stale
+results do not linger until they are evicted. Key functions are part of the key by identity,
+so two different lambdas never share a result.
+
+- Hit: O(1) (one dict lookup and an LRU reorder)
+- Miss: the cost of the computation, plus O(1) to store it
+- Eviction: least recently used first once maxsize entries are held; entries older than ttl
+  seconds (if given) are treated as misses
+
+Mutations to the records themselves (changing an album's genre in place) are not seen by
+the collection's version; collections bump it in their own update methods.
+
+Example:
+    cache = ResultCache(maxsize=64)
+    cache.get(collection.version, ("genre", "ROCK"), lambda: scan_for("ROCK"))
+"""
+
+import time
+from collections import OrderedDict, namedtuple
+
+CacheInfo = namedtuple("CacheInfo", "hits misses evictions expirations invalidations maxsize currsize")
+
+
+class ResultCache:
+    """
+    A size- and age-bounded LRU cache of results for one versioned collection.
+
+    Attributes:
+        maxsize (int): The largest number of results held.
+        ttl (float or None): Seconds a result stays valid, or None for no limit.
+    """
+    def __init__(self, maxsize=128, ttl=None, clock=time.monotonic):
+        """
+        Create an empty cache.
+
+        Args:
+            maxsize (int, optional): The largest number of results held. Defaults to 128.
+            ttl (float, optional): Seconds after which a result expires. Defaults to None.
+            clock (callable, optional): Returns the current time in seconds.
+                                       Defaults to time.monotonic.
+
+        Raises:
+            ValueError: If maxsize is not positive or ttl is not positive.
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be positive")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be positive")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._entries = OrderedDict()  # (version, query, key) -> (result, expiry time)
+        self._version = None
+        self.hits = self.misses = 0
+        self.evictions = self.expirations = self.invalidations = 0
+
+    def get(self, version, query, compute, key=None):
+        """
+        Returns the cached result of a query, computing and storing it on a miss.
+
+        Args:
+            version (int): The collection's current version.
+            query (hashable): Identifies the query and its arguments, e.g. ("genre", genre).
+            compute (callable): Called with no arguments to produce the result on a miss.
+            key (callable, optional): The key function the query uses, if any.
+
+        Returns:
+            The (possibly cached) result. Callers should not mutate it.
+
+        Raises:
+            TypeError: If query is not hashable.
+        """
+        if version != self._version:
+            # The collection changed: nothing cached for an earlier version can be used again
+            self.invalidations += len(self._entries)
+            self._entries.clear()
+            self._version = version
+
+        cache_key = (version, query, key)
+        entry = self._entries.get(cache_key)
+        if entry is not None:
+            result, expires = entry
+            if expires is None or self._clock() < expires:
+                self._entries.move_to_end(cache_key)
+                self.hits += 1
+                return result
+            del self._entries[cache_key]
+            self.expirations += 1
+
+        self.misses += 1
+        result = compute()
+        expires = None if self.ttl is None else self._clock() + self.ttl
+        self._entries[cache_key] = (result, expires)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return result
+
+    def info(self):
+        """Returns the hit, miss, eviction, expiry and invalidation counts and the size."""
+        return CacheInfo(self.hits, self.misses, self.evictions, self.expirations,
+                         self.invalidations, self.maxsize, len(self._entries))
+
+    def clear(self):
+        """Drops every cached result (the statistics are kept)."""
+        self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+# Example usage and testing
+if __name__ == "__main__":
+    import random
+
+    # A collection that bumps its version on every change
+    random.seed(42)
+    data = [random.randint(0, 1000) for _ in range(200_000)]
+    version = 0
+    cache = ResultCache(maxsize=4, ttl=60)
+
+    def top_ten():
+        return sorted(data, reverse=True)[:10]
+
+    start = time.perf_counter()
+    first = cache.get(version, "top ten", top_ten)
+    miss_time = time.perf_counter() - start
+    start = time.perf_counter()
+    again = cache.get(version, "top ten", top_ten)
+    hit_time = time.perf_counter() - start
+    print(f"Miss: {miss_time * 1e3:.1f} ms, hit: {hit_time * 1e6:.1f} µs, same result: {first is again}")
+
+    data.append(5000)
+    version += 1
+    print(f"After a change: {cache.get(version, 'top ten', top_ten)[:3]}")
+
+    # Different key functions never share a result
+    by_mod = lambda x: x % 7
+    cache.get(version, "min", lambda: min(data, key=by_mod), key=by_mod)
+    cache.get(version, "min", lambda: min(data), key=None)
+    print(f"Stats: {cache.info()}")
+
+    # Expiry with a fake clock
+    now = [0.0]
+    timed = ResultCache(maxsize=8, ttl=5, clock=lambda: now[0])
+    timed.get(0, "q", lambda: "old")
+    now[0] = 10.0
+    print(f"After ttl: {timed.get(0, 'q', lambda: 'new')}, {timed.info()}")
+
+    try:
+        ResultCache(maxsize=0)
+    except ValueError as e:
+        print(f"Error: {e}")
@@ -0,0 +1,275 @@
+"""
+Snapshot Sequence (Copy-on-Write Sorted Container)
+=================================================
+This module provides SnapshotSequence, a sorted container for services where many reader
+threads run binary searches while a writer inserts. Readers never take a lock: snapshot()
+returns the current version, an immutable Snapshot (a validated SortedSequence over a tuple)
+that every search function in this package accepts and that no later write can change.
+Writers build the next version off to the side (copy-on-write) and publish it with a single
+reference assignment, so a reader sees either the old version or the new one, never a
+half-sorted list. This is the read-copy-update pattern; old versions are freed by the garbage
+collector once the last reader lets go of them.
+
+- snapshot(): O(1), no lock
+- Searches on a snapshot: O(log n), no validation scan (snapshots are stamped as sorted)
+- Publishing a batch of b inserts and r removals: O(n + b log b + r log n), one copy
+- Memory: one copy per published version, plus any versions readers still hold
+
+Each publish copies the whole sequence, so writers should batch: insert() and remove() on
+their own publish one version each, while update() and the batch() context manager apply
+many changes and publish once. Writers are serialized by a lock that readers never touch.
+
+Under the GIL, pure-Python reads run one at a time whatever the locking, so removing the
+reader lock mainly stops readers from queueing behind a writer that holds it; on a
+free-threaded build (Python 3.13t and later) lock-free reads also run in parallel.
+
+Example:
+    catalog = SnapshotSequence([101, 205, 333])
+    with catalog.batch():                 # Readers keep seeing [101, 205, 333]
+        catalog.insert(150)
+        catalog.insert(290)
+    view = catalog.snapshot()             # Version 1, published at the end of the block
+    binary_search_iterative(view, 290)
+    # Result: 3
+"""
+
+import threading
+from bisect import bisect_left
+from contextlib import contextmanager
+from heapq import merge
+
+from searching_algorithms.sorted_sequence import SortedSequence
+
+
+class Snapshot(SortedSequence):
+    """
+    One published version of a SnapshotSequence: read-only, stamped as sorted.
+
+    Attributes:
+        key (callable or None): The key the snapshot is ordered by.
+        version (int): The version of the container it was published as.
+    """
+    def __init__(self, data, key, version):
+        """
+        Wrap a sorted tuple as a read-only, validated sequence.
+
+        Args:
+            data (tuple): The items, already sorted by key.
+            key (callable or None): The key the items are ordered by.
+            version (int): The version number of this snapshot.
+        """
+        super().__init__(data, key=key, trusted=True)
+        self.version = self._validated_version = version
+
+    def _read_only(self, *args):
+        raise TypeError("Snapshots are read-only; change the SnapshotSequence instead")
+
+    insert = remove = pop = append = extend = __setitem__ = __delitem__ = _read_only
+
+    def __repr__(self):
+        return f"Snapshot({list(self._data)!r}, version={self.version})"
+
+
+class SnapshotSequence:
+    """
+    A sorted container with lock-free, snapshot-isolated reads and batched writes.
+
+    Attributes:
+        key (callable or None): The key the items are ordered by.
+    """
+    def __init__(self, data=(), key=None):
+        """
+        Create the container, sorting the initial items once.
+
+        Args:
+            data (iterable, optional): The initial items, in any order. Defaults to none.
+            key (callable, optional): A function to extract a comparison key from each item.
+                                     Defaults to None (direct comparison).
+
+        Raises:
+            TypeError: If key is not callable or items are not comparable.
+        """
+        if key is not None and not callable(key):
+            raise TypeError("key must be a callable function")
+        self.key = key
+        try:
+            items = tuple(sorted(data, key=key))
+        except TypeError as e:
+            raise TypeError(f"Elements are not comparable: {e}")
+        self._current = Snapshot(items, key, 0)
+        self._write_lock = threading.RLock()
+        self._pending = None  # (inserts, removals) while a batch is open
+
+    # Reads: one attribute load, no lock
+    def snapshot(self):
+        """
+        Returns the current version. It never changes, however long it is held.
+
+        Returns:
+            Snapshot: A read-only, validated sequence for the package's search functions.
+        """
+        return self._current
+
+    @property
+    def version(self):
+        """The number of the latest published version."""
+        return self._current.version
+
+    def __len__(self):
+        return len(self._current)
+
+    def __iter__(self):
+        return iter(self._current)
+
+    def __contains__(self, item):
+        view = self._current  # One snapshot for the whole check
+        return self._locate(view.data, item) is not None
+
+    # Writes: serialized, published atomically
+    def insert(self, item):
+        """Inserts an item (after any equal keys), publishing a new version unless batching."""
+        self._write([item], [])
+
+    def remove(self, item):
+        """
+        Removes one occurrence of an item, publishing a new version unless batching.
+
+        Raises:
+            ValueError: If the item is not present (at publish time, for a batch).
+        """
+        self._write([], [item])
+
+    def update(self, items):
+        """Inserts many items and publishes them as one version."""
+        self._write(list(items), [])
+
+    @contextmanager
+    def batch(self):
+        """
+        Groups inserts and removals into one published version.
+
+        Inside the block, insert(), remove() and update() are buffered; readers keep seeing
+        the previous version until the block ends. Inserts are applied before removals. If
+        the block raises, nothing is published. Other writers wait until the block ends.
+
+        Raises:
+            RuntimeError: If a batch is already open on this thread.
+            ValueError: If a buffered removal matches no item (nothing is published).
+        """
+        with self._write_lock:
+            if self._pending is not None:
+                raise RuntimeError("A batch is already open")
+            self._pending = ([], [])
+            try:
+                yield self
+                inserts, removals = self._pending
+            finally:
+                self._pending = None
+            if inserts or removals:
+                self._publish(inserts, removals)
+
+    def _write(self, inserts, removals):
+        with self._write_lock:
+            if self._pending is not None:
+                self._pending[0].extend(inserts)
+                self._pending[1].extend(removals)
+            else:
+                self._publish(inserts, removals)
+
+    def _locate(self, data, item, skip=()):
+        """Returns the index of an item equal to item (not in skip), or None."""
+        key = self.key
+        target = key(item) if key else item
+        try:
+            i = bisect_left(data, target, key=key)
+            while i < len(data) and (key(data[i]) if key else data[i]) == target:
+                if data[i] == item and i not in skip:
+                    return i
+                i += 1
+        except TypeError as e:
+            raise TypeError(f"Elements are not comparable with target: {e}")
+        return None
+
+    def _publish(self, inserts, removals):
+        """Builds the next version from the current one and swaps it in (write lock held)."""
+        current = self._current
+        try:
+            # merge() is stable, so new items land after existing equal keys, as with insort_right
+            items = list(merge(current.data, sorted(inserts, key=self.key), key=self.key))
+        except TypeError as e:
+            raise TypeError(f"Elements are not comparable: {e}")
+        if removals:
+            dropped = set()
+            for item in removals:
+                i = self._locate(items, item, dropped)
+                if i is None:
+                    raise ValueError(f"{item!r} is not in the sequence")
+                dropped.add(i)
+            items = [item for i, item in enumerate(items) if i not in dropped]
+        # A single reference assignment: readers see the old version or the new one
+        self._current = Snapshot(tuple(items), self.key, current.version + 1)
+
+    def __repr__(self):
+        return f"SnapshotSequence(version={self.version}, size={len(self)})"
+
+# Example usage and testing
+if __name__ == "__main__":
+    import random
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+
+    from searching_algorithms.binary_search import binary_search_iterative, search_range
+
+    catalog = SnapshotSequence([101, 205, 333])
+    before = catalog.snapshot()
+    with catalog.batch():
+        catalog.insert(150)
+        catalog.insert(290)
+        catalog.remove(205)
+        print(f"Inside the batch readers see: {list(catalog.snapshot())}")
+    print(f"Published: {catalog.snapshot()}, the old snapshot is unchanged: {before}")
+    print(f"binary_search_iterative(snapshot, 290) = {binary_search_iterative(catalog.snapshot(), 290)}")
+
+    try:
+        catalog.snapshot().insert(1)
+    except TypeError as e:
+        print(f"Error: {e}")
+    try:
+        catalog.remove(999)
+    except ValueError as e:
+        print(f"Error: {e}")
+
+    # Readers search and check their snapshots while a writer publishes batches
+    random.seed(42)
+    books = SnapshotSequence(({"isbn": random.randrange(10 ** 9)} for _ in range(50_000)),
+                             key=lambda book: book["isbn"])
+    stop = threading.Event()
+
+    def writer():
+        batches = 0
+        while not stop.is_set():
+            books.update({"isbn": random.randrange(10 ** 9)} for _ in range(500))
+            batches += 1
+            time.sleep(0.001)
+        return batches
+
+    def reader(lookups):
+        rng = random.Random()
+        for _ in range(lookups):
+            view = books.snapshot()
+            lo = rng.randrange(10 ** 9)
+            found = search_range(view, lo, lo + 10 ** 6)
+            isbns = [view[i]["isbn"] for i in found]
+            if isbns != sorted(isbns) or len(view) % 500 != 0:
+                raise AssertionError("Reader saw a partially applied write")
+        return lookups
+
+    with ThreadPoolExecutor(max_workers=5) as pool:
+        writing = pool.submit(writer)
+        start = time.perf_counter()
+        reads = sum(pool.map(reader, [20_000] * 4))
+        elapsed = time.perf_counter() - start
+        stop.set()
+        print(f"{reads} consistent range searches in {elapsed:.2f}s on 4 threads while "
+              f"{writing.result()} batches were published (now version {books.version}, "
+              f"{len(books)} books)")
@@ -0,0 +1,207 @@
+"""
+Sorted Index (Precomputed Key Column)
+====================================
+This module provides SortedIndex, a secondary index over a list of records. Searching
+records directly with binary_search_iterative(books, isbn, key=lambda b: b["isbn"]) calls the
+key function on every probe, on top of the O(n) sortedness scan. A SortedIndex calls key()
+once per record when it is built, keeps the extracted keys in sorted order in a compact
+column (an array.array for int or float keys), and keeps a parallel column of row ids
+pointing back into the record list. Every query then bisects the key column directly.
+
+- Build: O(n log n) once, n key() calls
+- find / floor / ceiling: O(log n), no key() calls
+- range: O(log n + k) for k matching records
+- append / refresh: O(1) per record while new keys arrive in order (timestamps, IDs),
+  otherwise O(n + m log m) to merge a batch of m new records
+
+The records themselves are never copied or reordered: the index reads them through their row
+ids, so records may be appended to the underlying list and picked up later with refresh().
+Records with equal keys are kept in their original (row id) order.
+
+Example:
+    books = [{"isbn": "456", "title": "Book B"}, {"isbn": "123", "title": "Book A"}]
+    index = SortedIndex(books, key=lambda b: b["isbn"])
+    index.find("123")
+    # Result: {"isbn": "123", "title": "Book A"}
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from heapq import merge
+
+from searching_algorithms.sorted_sequence import compact_keys
+
+
+class SortedIndex:
+    """
+    A sorted key column with row ids, built once over a list of records.
+
+    Attributes:
+        records (list): The indexed records (not copied; positions are the row ids).
+        key (callable): The function that extracts each record's key.
+    """
+    def __init__(self, records, key):
+        """
+        Build the index, calling key() once per record.
+
+        Args:
+            records (list): The records to index (need not be sorted).
+            key (callable): A function to extract a comparison key from each record.
+
+        Raises:
+            TypeError: If key is not callable or keys are not comparable.
+        """
+        if not callable(key):
+            raise TypeError("key must be a callable function")
+        self.records = records
+        self.key = key
+        self._keys = array("q")  # Key column, compacted by compact_keys() as keys arrive
+        self._rows = array("q")
+        self._indexed = 0  # Number of records (from the front) already in the index
+        self.refresh()
+
+    def refresh(self):
+        """
+        Index records appended to the underlying list since the last build.
+
+        Returns:
+            int: The number of records added to the index.
+
+        Raises:
+            TypeError: If keys are not comparable.
+        """
+        start, end = self._indexed, len(self.records)
+        if start == end:
+            return 0
+
+        try:
+            new = sorted((self.key(self.records[row]), row) for row in range(start, end))
+            if not self._keys or not new[0][0] < self._keys[-1]:
+                # Keys arrived in order: extend the columns in place
+                new_keys = compact_keys([k for k, _ in new])
+                if isinstance(self._keys, list) and self._keys or \
+                        isinstance(new_keys, array) and new_keys.typecode == self._keys.typecode:
+                    self._keys.extend(new_keys)
+                else:
+                    # The column cannot hold the new keys (e.g. floats or wide ints arriving
+                    # in an int column): rebuild it once with the narrowest type that fits
+                    self._keys = compact_keys(list(self._keys) + list(new_keys))
+                self._rows.extend(row for _, row in new)
+            else:
+                # Merge the new batch into the existing columns; on equal keys the existing
+                # (lower) row ids come first, so original order is preserved
+                merged = list(merge(zip(self._keys, self._rows), new))
+                self._keys = compact_keys([k for k, _ in merged])
+                self._rows = array("q", (row for _, row in merged))
+        except TypeError as e:
+            raise TypeError(f"Keys are not comparable: {e}")
+
+        self._indexed = end
+        return end - start
+
+    def append(self, record):
+        """Append a record to the underlying list and index it."""
+        self.records.append(record)
+        self.refresh()
+
+    def _bisect(self, bisect_fn, target):
+        """Bisects the key column, reporting incomparable targets consistently."""
+        try:
+            return bisect_fn(self._keys, target)
+        except TypeError as e:
+            raise TypeError(f"Keys are not comparable with target: {e}")
+
+    def find(self, target, default=None):
+        """
+        Returns the first record (in original order) whose key equals the target.
+
+        Args:
+            target: The key to look up.
+            default (optional): Returned when no record matches. Defaults to None.
+        """
+        i = self._bisect(bisect_left, target)
+        if i < len(self._keys) and self._keys[i] == target:
+            return self.records[self._rows[i]]
+        return default
+
+    def find_all(self, target):
+        """Returns every record whose key equals the target, in original order."""
+        return list(self.range(target, target, inclusive=(True, True)))
+
+    def range(self, lo=None, hi=None, inclusive=(True, False)):
+        """
+        Iterates over the records with keys between lo and hi, in key order.
+
+        Args:
+            lo (optional): Lower key bound, or None for no lower bound. Defaults to None.
+            hi (optional): Upper key bound, or None for no upper bound. Defaults to None.
+            inclusive (tuple, optional): Whether (lo, hi) themselves are included.
+                                         Defaults to (True, False), i.e. lo <= key < hi.
+
+        Returns:
+            iterator: The matching records.
+        """
+        start = 0 if lo is None else self._bisect(bisect_left if inclusive[0] else bisect_right, lo)
+        stop = len(self._keys) if hi is None else self._bisect(bisect_right if inclusive[1] else bisect_left, hi)
+        records, rows = self.records, self._rows
+        return (records[rows[i]] for i in range(start, max(start, stop)))
+
+    def floor(self, target, default=None):
+        """Returns the last record whose key is less than or equal to the target."""
+        i = self._bisect(bisect_right, target)
+        return self.records[self._rows[i - 1]] if i else default
+
+    def ceiling(self, target, default=None):
+        """Returns the first record whose key is greater than or equal to the target."""
+        i = self._bisect(bisect_left, target)
+        return self.records[self._rows[i]] if i < len(self._keys) else default
+
+    def __iter__(self):
+        """Iterates over all indexed records in key order."""
+        records = self.records
+        return (records[row] for row in self._rows)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __repr__(self):
+        return f"SortedIndex({len(self)} records, key={self.key})"
+
+# Example usage and testing
+if __name__ == "__main__":
+    albums = [
+        {"title": "Thriller", "year": 1982},
+        {"title": "Nevermind", "year": 1991},
+        {"title": "Back in Black", "year": 1980},
+        {"title": "The Joshua Tree", "year": 1987},
+        {"title": "Ten", "year": 1991},
+    ]
+    by_year = SortedIndex(albums, key=lambda a: a["year"])
+
+    print(f"Index: {by_year}")
+    print(f"find(1991): {by_year.find(1991)}")
+    print(f"find_all(1991): {[a['title'] for a in by_year.find_all(1991)]}")
+    print(f"range(1980, 1990): {[a['title'] for a in by_year.range(1980, 1990)]}")
+    print(f"floor(1985): {by_year.floor(1985)}, ceiling(1985): {by_year.ceiling(1985)}")
+    print(f"ceiling(2000): {by_year.ceiling(2000)}")
+
+    by_year.append({"title": "OK Computer", "year": 1997})   # In order: extends the columns
+    by_year.append({"title": "Rumours", "year": 1977})       # Out of order: merged in
+    print(f"In year order: {[a['title'] for a in by_year]}")
+
+    # Batches the key column's type cannot hold are rebuilt into a wider column
+    numbers = [5, 1]
+    mixed = SortedIndex(numbers, key=lambda x: x)
+    numbers.extend([3])
+    mixed.refresh()
+    numbers.extend([6, 7.5])
+    mixed.refresh()
+    numbers.append(2 ** 64)
+    mixed.refresh()
+    print(f"Mixed and wide keys: {list(mixed)}, find(7.5): {mixed.find(7.5)}, "
+          f"find(2 ** 64): {mixed.find(2 ** 64)}")
+
+    try:
+        SortedIndex([{"v": 1}, {"v": "a"}], key=lambda r: r["v"])
+    except TypeError as e:
+        print(f"Error: {e}")
@@ -0,0 +1,238 @@
+"""
+Sorted Sequence (Pre-Validated Search Handle)
+============================================
+This module provides SortedSequence, a thin wrapper around a list that remembers it has
+been checked for sorted order. The search functions in this package normally scan the whole
+list on every call to confirm it is sorted, which turns each O(log n) lookup into O(n). A
+SortedSequence is validated once (or trusted on the caller's word) and stamped with its
+current version; searches against it then skip validation entirely.
+
+- Validation: O(n) once per version, O(1) afterwards
+- insert(): O(n) list insertion, keeps the stamp (order is preserved by construction)
+- Other mutations: bump the version, so the next search validates again
+
+Every change made through the wrapper bumps its version. Changes that cannot break the order
+(insort-style insert, deletions) re-stamp the new version straight away; changes that might
+(item assignment, append, extend) leave it unstamped until the next validation. Changes made
+to the underlying list behind the wrapper's back are not tracked.
+
+Example:
+    # Validate once, then search many times
+    books = SortedSequence([{"isbn": "123"}, {"isbn": "456"}], key=lambda x: x["isbn"])
+    index = binary_search_iterative(books, "456")
+    # Result: 1
+"""
+
+from array import array
+from bisect import insort_right
+
+
+def check_sorted(arr, key=None):
+    """
+    Scans a list once to confirm it is in ascending order.
+
+    Args:
+        arr (list): The list to check.
+        key (callable, optional): A function to extract a comparison key from each element.
+                                 Defaults to None (direct comparison).
+
+    Raises:
+        TypeError: If elements are not comparable.
+        ValueError: If the list is not sorted in ascending order.
+    """
+    try:
+        for i in range(1, len(arr)):
+            val_prev = key(arr[i - 1]) if key else arr[i - 1]
+            val_curr = key(arr[i]) if key else arr[i]
+            if val_prev > val_curr:
+                raise ValueError("Input list must be sorted in ascending order")
+    except TypeError as e:
+        raise TypeError(f"Elements are not comparable: {e}")
+
+
+def compact_keys(keys):
+    """
+    Stores keys in an array.array when they are all ints or all floats, else a list.
+
+    Ints go in a 64-bit "q" array and floats in a "d" array, so a column of plain numbers
+    takes 8 bytes per key instead of a pointer to a boxed object. Mixed ints and floats, and
+    ints that do not fit in 64 bits, stay in a list so that no key is converted or rounded.
+
+    Args:
+        keys (sequence): The keys to store.
+
+    Returns:
+        array.array or list: The keys, in the same order.
+    """
+    if keys and all(type(k) is int for k in keys):
+        try:
+            return array("q", keys)
+        except OverflowError:
+            return list(keys)  # Larger than 64 bits
+    if keys and all(type(k) is float for k in keys):
+        return array("d", keys)
+    return list(keys)
+
+
+def ensure_sorted(arr, key=None):
+    """
+    Returns the list and key a search should use, validating only when necessary.
+
+    A plain list is scanned every time. A SortedSequence is scanned only if it has not been
+    validated at its current version; if no key is given, the sequence's own key is used.
+
+    Args:
+        arr (list or SortedSequence): The data to be searched.
+        key (callable, optional): The caller's key function. Defaults to None.
+
+    Returns:
+        tuple: (list, key) to search over.
+
+    Raises:
+        TypeError: If elements are not comparable.
+        ValueError: If the data is not sorted in ascending order.
+    """
+    if isinstance(arr, SortedSequence):
+        if key is None or key is arr.key:
+            arr.ensure_validated()
+            return arr.data, arr.key
+        # A different key implies a different order, which the stamp says nothing about
+        check_sorted(arr.data, key)
+        return arr.data, key
+
+    check_sorted(arr, key)
+    return arr, key
+
+
+class SortedSequence:
+    """
+    A list wrapper that records when it was last validated as sorted.
+
+    Attributes:
+        key (callable or None): The key the sequence is ordered by.
+        version (int): Incremented by every mutation made through the wrapper.
+    """
+    def __init__(self, data=None, key=None, trusted=False):
+        """
+        Wrap a list, validating it unless the caller vouches for its order.
+
+        Args:
+            data (list, optional): The list to wrap (not copied). Defaults to a new empty list.
+            key (callable, optional): The key the list is ordered by. Defaults to None.
+            trusted (bool, optional): If True, skip validation and stamp immediately.
+                                      Defaults to False.
+
+        Raises:
+            TypeError: If key is not callable or elements are not comparable.
+            ValueError: If the list is not sorted (when not trusted).
+        """
+        if key is not None and not callable(key):
+            raise TypeError("key must be a callable function")
+        self._data = data if data is not None else []
+        self.key = key
+        self.version = 0
+        self._validated_version = None
+        if trusted:
+            self._validated_version = self.version
+        else:
+            self.validate()
+
+    @property
+    def data(self):
+        """The underlying list (mutate it through the wrapper to keep the stamp honest)."""
+        return self._data
+
+    @property
+    def is_validated(self):
+        """True if the current version has been validated (or trusted) as sorted."""
+        return self._validated_version == self.version
+
+    def validate(self):
+        """Scan the list once and stamp the current version as sorted."""
+        check_sorted(self._data, self.key)
+        self._validated_version = self.version
+
+    def ensure_validated(self):
+        """Validate only if the current version has not been stamped yet."""
+        if not self.is_validated:
+            self.validate()
+
+    def _changed(self, order_preserved):
+        """Record a mutation, re-stamping if it could not have broken the order."""
+        was_validated = self.is_validated
+        self.version += 1
+        if was_validated and order_preserved:
+            self._validated_version = self.version
+
+    # Order-preserving mutations
+    def insert(self, item):
+        """Insert an item at its sorted position (after any equal keys)."""
+        insort_right(self._data, item, key=self.key)
+        self._changed(order_preserved=True)
+
+    def remove(self, item):
+        """Remove the first occurrence of an item."""
+        self._data.remove(item)
+        self._changed(order_preserved=True)
+
+    def pop(self, index=-1):
+        """Remove and return the item at the given index."""
+        item = self._data.pop(index)
+        self._changed(order_preserved=True)
+        return item
+
+    def __delitem__(self, index):
+        del self._data[index]
+        self._changed(order_preserved=True)
+
+    # Mutations that may break the order
+    def append(self, item):
+        """Append an item to the end (invalidates the stamp)."""
+        self._data.append(item)
+        self._changed(order_preserved=False)
+
+    def extend(self, items):
+        """Append several items to the end (invalidates the stamp)."""
+        self._data.extend(items)
+        self._changed(order_preserved=False)
+
+    def __setitem__(self, index, item):
+        self._data[index] = item
+        self._changed(order_preserved=False)
+
+    # Read access
+    def __getitem__(self, index):
+        return self._data[index]
+
+    def __len__(self):
+        return len(self._data)
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __repr__(self):
+        state = "validated" if self.is_validated else "unvalidated"
+        return f"SortedSequence({self._data!r}, version={self.version}, {state})"
+
+# Example usage and testing
+if __name__ == "__main__":
+    numbers = SortedSequence([1, 3, 5, 7])
+    print(f"Created: {numbers}")
+
+    numbers.insert(4)        # Keeps order, stays validated
+    print(f"After insert(4): {numbers}")
+
+    numbers.append(2)        # May break order, stamp is dropped
+    print(f"After append(2): {numbers}")
+
+    try:
+        numbers.ensure_validated()
+    except ValueError as e:
+        print(f"Validation failed: {e}")
+
+    del numbers[-1]          # Deleting keeps order, but the version was never re-validated
+    numbers.ensure_validated()
+    print(f"After del and revalidation: {numbers}")
+
+    trusted = SortedSequence(list(range(10)), trusted=True)
+    print(f"Trusted: {trusted}")
@@ -0,0 +1,235 @@
+"""
+Streaming Linear Search (Iterables and Files)
+============================================
+This module extends Linear Search to any iterable: generators, file readers, sockets wrapped
+with makefile('rb'), or lists. Nothing is materialised: elements are tested as they arrive,
+and reading stops as soon as the request is satisfied, so a match near the start of a
+multi-GB file costs only the bytes before it.
+
+- find_first: the first match, then stop
+- find_all: a lazy generator over every match
+- find_n: the first n matches, then stop
+
+Each match is reported as an (index, element) pair, where index is the element's position in
+the stream (as linear_search would report it). Elements are matched either against a target
+(with an optional 'key', as in linear_search) or by a predicate function.
+
+read_jsonl() and read_lines() read files through large binary chunks (1 MiB by default)
+rather than line by line, split the lines themselves, and close the file as soon as the
+consumer stops iterating.
+
+- Time Complexity: O(i) for a match at position i (O(n) to rule a match out)
+- Space Complexity: O(1) plus one read chunk
+
+Example:
+    # First order over 100 in a huge log, without loading the file
+    find_first(read_jsonl("orders.jsonl"), predicate=lambda o: o["total"] > 100)
+"""
+
+import json
+from inspect import isgenerator
+
+CHUNK_SIZE = 1 << 20  # Bytes per read from a file or stream
+
+_NO_TARGET = object()  # Distinguishes "no target given" from searching for None
+
+
+def _matcher(target, key, predicate):
+    """Builds the element test for a target/key or a predicate, validating the arguments."""
+    if key is not None and not callable(key):
+        raise TypeError("key must be a callable function")
+    if predicate is not None and not callable(predicate):
+        raise TypeError("predicate must be a callable function")
+    if (predicate is None) == (target is _NO_TARGET):
+        raise ValueError("Give either a target or a predicate")
+
+    if predicate is not None:
+        return (lambda item: predicate(key(item))) if key else predicate
+    return (lambda item: key(item) == target) if key else (lambda item: item == target)
+
+
+def find_all(iterable, target=_NO_TARGET, key=None, predicate=None):
+    """
+    Lazily yields every match in an iterable.
+
+    Args:
+        iterable (iterable): The elements to search (consumed only as far as iterated).
+        target (optional): The value to search for. Required unless a predicate is given.
+        key (callable, optional): A function to extract a comparison key from each element.
+                                 Defaults to None (direct comparison).
+        predicate (callable, optional): A function (key value) -> bool to use instead of
+                                       equality with a target. Defaults to None.
+
+    Returns:
+        generator: (index, element) pairs for each match, in stream order. When it finishes or
+                   is closed, a source generator is closed too (releasing its file).
+
+    Raises:
+        TypeError: If key or predicate is not callable, or elements are not comparable.
+        ValueError: If neither or both of target and predicate are given.
+    """
+    matches = _matcher(target, key, predicate)  # Validate now, not on first next()
+
+    def generate():
+        iterator = iter(iterable)
+        try:
+            for index, item in enumerate(iterator):
+                try:
+                    found = matches(item)
+                except TypeError as e:
+                    raise TypeError(f"Elements are not comparable with target: {e}")
+                if found:
+                    yield index, item
+        finally:
+            # Stop a source generator (e.g. read_lines(), closing its file) as soon as the
+            # consumer stops; other iterators, such as a caller's open file, are left open
+            if isgenerator(iterator):
+                iterator.close()
+
+    return generate()
+
+
+def find_n(iterable, n, target=_NO_TARGET, key=None, predicate=None):
+    """
+    Returns the first n matches, reading no further than the n-th.
+
+    Args:
+        iterable (iterable): The elements to search.
+        n (int): Maximum number of matches to return.
+        target, key, predicate: As for find_all().
+
+    Returns:
+        list: Up to n (index, element) pairs, in stream order.
+
+    Raises:
+        TypeError: If key or predicate is not callable, or elements are not comparable.
+        ValueError: If n is negative, or neither or both of target and predicate are given.
+    """
+    if n < 0:
+        raise ValueError("n must not be negative")
+    results = []
+    if n == 0:
+        return results
+    matches = find_all(iterable, target, key=key, predicate=predicate)
+    try:
+        for match in matches:
+            results.append(match)
+            if len(results) == n:
+                break
+    finally:
+        matches.close()
+    return results
+
+
+def find_first(iterable, target=_NO_TARGET, key=None, predicate=None):
+    """
+    Returns the first match, reading no further than it.
+
+    Args:
+        iterable (iterable): The elements to search.
+        target, key, predicate: As for find_all().
+
+    Returns:
+        tuple or None: The (index, element) pair of the first match, or None if none matches.
+
+    Raises:
+        TypeError: If key or predicate is not callable, or elements are not comparable.
+        ValueError: If neither or both of target and predicate are given.
+    """
+    results = find_n(iterable, 1, target, key=key, predicate=predicate)
+    return results[0] if results else None
+
+
+def read_lines(source, chunk_size=CHUNK_SIZE, encoding="utf-8"):
+    """
+    Yields the lines of a file or binary stream, reading it in large chunks.
+
+    Args:
+        source (str or file object): A path, or a file/stream opened in binary mode.
+        chunk_size (int, optional): Bytes per read. Defaults to CHUNK_SIZE (1 MiB).
+        encoding (str, optional): Text encoding of the lines. Defaults to "utf-8".
+
+    Returns:
+        generator: Decoded lines without their line endings. A path is opened on the first
+                   next() and closed when the generator finishes or is closed.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive")
+
+    def generate():
+        stream = open(source, "rb") if isinstance(source, str) else source
+        try:
+            remainder = b""
+            while True:
+                chunk = stream.read(chunk_size)
+                if not chunk:
+                    break
+                lines = (remainder + chunk).split(b"\n")
+                remainder = lines.pop()  # Possibly incomplete: wait for the next chunk
+                for line in lines:
+                    yield line.rstrip(b"\r").decode(encoding)
+            if remainder:
+                yield remainder.rstrip(b"\r").decode(encoding)
+        finally:
+            if isinstance(source, str):
+                stream.close()
+
+    return generate()
+
+
+def read_jsonl(source, chunk_size=CHUNK_SIZE, encoding="utf-8"):
+    """
+    Yields the records of a JSON Lines file or stream, reading it in large chunks.
+
+    Args:
+        source (str or file object): A path, or a file/stream opened in binary mode.
+        chunk_size (int, optional): Bytes per read. Defaults to CHUNK_SIZE (1 MiB).
+        encoding (str, optional): Text encoding of the file. Defaults to "utf-8".
+
+    Returns:
+        generator: One parsed record per non-blank line.
+
+    Raises:
+        ValueError: If a line is not valid JSON (raised when that line is reached).
+    """
+    lines = read_lines(source, chunk_size, encoding)
+
+    def generate():
+        try:
+            for line in lines:
+                if line.strip():
+                    yield json.loads(line)
+        finally:
+            lines.close()
+
+    return generate()
+
+# Example usage and testing
+if __name__ == "__main__":
+    import itertools
+    import os
+    import tempfile
+
+    # Test cases on in-memory iterables
+    print(f"find_first in list: {find_first([64, 34, 25, 12], 25)}")
+    print(f"find_n in range: {find_n(range(100), 3, predicate=lambda x: x % 7 == 0)}")
+    print(f"find_all lazily: {list(itertools.islice(find_all(itertools.count(), predicate=lambda x: x % 1000 == 999), 2))}")
+    print(f"No match: {find_first(iter([1, 2, 3]), 9)}")
+
+    # A JSONL file: only the chunks up to the first match are read
+    with tempfile.NamedTemporaryFile("w", suffix=".jsonl", delete=False) as f:
+        for i in range(100_000):
+            f.write(json.dumps({"order": i, "total": (i * 37) % 250}) + "\n")
+        path = f.name
+    try:
+        first = find_first(read_jsonl(path), predicate=lambda o: o["total"] > 240)
+        print(f"First order over 240: {first}")
+        big = find_n(read_jsonl(path), 2, 249, key=lambda o: o["total"])
+        print(f"First two orders totalling 249: {big}")
+    finally:
+        os.unlink(path)
+
+    try:
+        find_first([1, 2], 1, predicate=bool)
+    except ValueError as e:
+        print(f"Error: {e}")
@@ -0,0 +1,257 @@
+"""
+Suffix Array Index (Substring Search)
+====================================
+This module provides SuffixArrayIndex, which finds the records whose text contains a given
+substring ("ockingbi" in "To Kill a Mockingbird") without scanning them. The texts are joined
+into one corpus, separated by a character that cannot occur in them, and the suffix array
+lists the starting positions of all suffixes of the corpus in sorted order. Every occurrence
+of a pattern is the start of a suffix beginning with it, and those suffixes are adjacent in
+the suffix array, so two binary searches find them all.
+
+- Build: prefix doubling, O(log L) sorts of n integer keys for a corpus of n characters whose
+  longest repeated substring has length L, using a sort from this package
+- LCP array: Kasai's algorithm, O(n)
+- Query: O(m log n) for a pattern of length m, plus O(k) for k occurrences
+- Space Complexity: O(n) (array('I') for the suffix and LCP arrays)
+
+Prefix doubling: after round r, each suffix has a rank that orders it by its first 2^r
+characters. The next round sorts suffixes by the pair (rank of i, rank of i + 2^r), which
+orders them by their first 2^(r + 1) characters, encoded as one integer so the package's
+type-specialised integer sorts apply. It stops once all ranks are distinct.
+
+Queries reuse binary_search.equal_range: cutting every suffix to the pattern's length keeps
+the suffix array sorted, so it is wrapped in a trusted SortedSequence with that cut as key.
+
+The LCP array gives, for each adjacent pair in the suffix array, the length of their common
+prefix; its maximum is the longest substring that occurs twice.
+
+Example:
+    index = SuffixArrayIndex(["To Kill a Mockingbird", "The Mockingjay"])
+    index.search("ocking")
+    # Result: ["To Kill a Mockingbird", "The Mockingjay"]
+"""
+
+from array import array
+from bisect import bisect_right
+
+from searching_algorithms.binary_search import equal_range
+from searching_algorithms.sorted_sequence import SortedSequence
+from sorting_algorithms.merge_sort import merge_sort
+
+SEPARATOR = "\x00"  # Joins the texts; sorts before every other character
+
+
+def build_suffix_array(text, sort=merge_sort):
+    """
+    Builds the suffix array of a string by prefix doubling.
+
+    Args:
+        text (str): The string to index.
+        sort (callable, optional): A sort from this package (or any function sorting a list
+                                   in place with a key argument). Defaults to merge_sort.
+
+    Returns:
+        array: Starting positions of the suffixes of text, in sorted order.
+    """
+    n = len(text)
+    if n == 0:
+        return array("I")
+    rank = [ord(c) for c in text]
+    suffixes = list(range(n))
+    k = 1
+    while True:
+        # Order by (rank[i], rank[i + k]), with a missing second half sorting first
+        base = max(rank) + 2
+        keys = [rank[i] * base + (rank[i + k] + 1 if i + k < n else 0) for i in range(n)]
+        sort(suffixes, key=keys.__getitem__)
+
+        new_rank = [0] * n
+        r = 0
+        for j in range(1, n):
+            if keys[suffixes[j]] != keys[suffixes[j - 1]]:
+                r += 1
+            new_rank[suffixes[j]] = r
+        rank = new_rank
+        if r == n - 1 or k >= n:
+            return array("I", suffixes)
+        k *= 2
+
+
+def build_lcp_array(text, suffix_array):
+    """
+    Builds the LCP array with Kasai's algorithm.
+
+    Args:
+        text (str): The indexed string.
+        suffix_array (array): Its suffix array.
+
+    Returns:
+        array: lcp[j] is the length of the common prefix of the suffixes at suffix_array[j - 1]
+               and suffix_array[j] (lcp[0] is 0).
+    """
+    n = len(text)
+    rank = [0] * n
+    for j, i in enumerate(suffix_array):
+        rank[i] = j
+    lcp = array("I", bytes(4 * n))
+    h = 0
+    for i in range(n):
+        # The suffix after i shares at least h - 1 characters with its predecessor
+        if rank[i] > 0:
+            previous = suffix_array[rank[i] - 1]
+            while i + h < n and previous + h < n and text[i + h] == text[previous + h]:
+                h += 1
+            lcp[rank[i]] = h
+            if h:
+                h -= 1
+        else:
+            h = 0
+    return lcp
+
+
+class SuffixArrayIndex:
+    """
+    A substring index over the texts of a set of records.
+
+    Attributes:
+        key (callable or None): The function that extracts each record's text.
+        text (str): The corpus: every record's text, each followed by SEPARATOR.
+    """
+    def __init__(self, records, key=None, sort=merge_sort):
+        """
+        Build the index.
+
+        Args:
+            records (iterable): The records (or strings) to index.
+            key (callable, optional): A function to extract the text of each record, e.g.
+                                     lambda book: book.title.casefold().
+                                     Defaults to None (the records are the text).
+            sort (callable, optional): The sort used by build_suffix_array. Defaults to merge_sort.
+
+        Raises:
+            TypeError: If key is not callable or a text is not a string.
+            ValueError: If a text contains SEPARATOR.
+        """
+        if key is not None and not callable(key):
+            raise TypeError("key must be a callable function")
+        self.key = key
+        self._records = list(records)
+        texts = [key(r) if key else r for r in self._records]
+        if not all(isinstance(t, str) for t in texts):
+            raise TypeError("SuffixArrayIndex texts must be strings")
+        if any(SEPARATOR in t for t in texts):
+            raise ValueError("Texts must not contain the separator character")
+
+        # _starts[r] is where record r's text begins in the corpus
+        self._starts = array("I")
+        position = 0
+        for t in texts:
+            self._starts.append(position)
+            position += len(t) + 1
+        self.text = "".join(t + SEPARATOR for t in texts)
+        self.suffix_array = build_suffix_array(self.text, sort)
+        self._lcp = None
+
+    @property
+    def lcp(self):
+        """The LCP array (built on first use)."""
+        if self._lcp is None:
+            self._lcp = build_lcp_array(self.text, self.suffix_array)
+        return self._lcp
+
+    def _suffix_range(self, pattern):
+        """Returns the range of suffix array entries whose suffix starts with pattern."""
+        m = len(pattern)
+        text = self.text
+        suffixes = SortedSequence(self.suffix_array, key=lambda i: text[i:i + m], trusted=True)
+        return equal_range(suffixes, pattern)
+
+    def occurrences(self, pattern):
+        """
+        Finds every occurrence of a substring.
+
+        Args:
+            pattern (str): The substring to look for (in the same form as the indexed texts).
+
+        Returns:
+            list: (record position, offset in its text) pairs, in record order.
+        """
+        if not pattern or SEPARATOR in pattern:
+            return []
+        found = []
+        for j in self._suffix_range(pattern):
+            i = self.suffix_array[j]
+            r = bisect_right(self._starts, i) - 1
+            found.append((r, i - self._starts[r]))
+        found.sort()
+        return found
+
+    def search(self, pattern):
+        """
+        Finds the records whose text contains a substring.
+
+        Args:
+            pattern (str): The substring to look for.
+
+        Returns:
+            list: The matching records, each once, in the order they were given.
+        """
+        found = dict.fromkeys(r for r, _ in self.occurrences(pattern))
+        return [self._records[r] for r in found]
+
+    def count(self, pattern):
+        """Number of occurrences of a substring (counting repeats within a record)."""
+        if not pattern or SEPARATOR in pattern:
+            return 0
+        return len(self._suffix_range(pattern))
+
+    def longest_repeated(self):
+        """Returns the longest substring that occurs at least twice (possibly within one text)."""
+        if not self.text:
+            return ""
+        lcp = self.lcp
+        j = max(range(len(lcp)), key=lcp.__getitem__)
+        i = self.suffix_array[j]
+        return self.text[i:i + lcp[j]]
+
+    def __len__(self):
+        """Number of records indexed."""
+        return len(self._records)
+
+    def __repr__(self):
+        return f"SuffixArrayIndex({len(self._records)} records, {len(self.text)} characters)"
+
+# Example usage and testing
+if __name__ == "__main__":
+    import random
+    import time
+
+    titles = ["To Kill a Mockingbird", "The Mockingjay", "Moby Dick", "Mock Turtle Soup"]
+    index = SuffixArrayIndex(titles, key=str.casefold)
+    print(f"Index: {index}")
+    for pattern in ("ocking", "mock", "ck", "dick", "kill a m", "zebra"):
+        print(f"'{pattern}': {index.search(pattern)}, count={index.count(pattern)}")
+    print(f"Occurrences of 'ck': {index.occurrences('ck')}")
+    print(f"Longest repeated substring: {index.longest_repeated()!r}")
+
+    # 5,000 synthetic titles: queries versus a substring scan
+    random.seed(42)
+    words = ["the", "kill", "mocking", "bird", "sea", "old", "man", "war", "peace", "night"]
+    corpus = [" ".join(random.choices(words, k=random.randint(2, 5))) + f" {i}" for i in range(5_000)]
+    start = time.perf_counter()
+    big = SuffixArrayIndex(corpus)
+    print(f"Built {big} in {time.perf_counter() - start:.1f}s")
+    for pattern in ("ing bi", "war pea", "d 1999"):
+        start = time.perf_counter()
+        found = big.search(pattern)
+        indexed = time.perf_counter() - start
+        start = time.perf_counter()
+        scanned = [t for t in corpus if pattern in t]
+        scan = time.perf_counter() - start
+        print(f"'{pattern}': {len(found)} titles in {indexed * 1e3:.2f} ms "
+              f"(scan {scan * 1e3:.2f} ms), same results: {found == scanned}")
+
+    try:
+        SuffixArrayIndex(["bad\x00title"])
+    except ValueError as e:
+        print(f"Error: {e}")
@@ -0,0 +1,154 @@
+"""
+Batched Sorting Networks
+=======================
+This module sorts many small, independent lists at once. Each row of a 2D array is treated
+as its own list, and every row is sorted by the same sorting network. Rows of up to 16
+elements use the small optimal-size networks from sorting_networks.py; longer rows use
+odd-even transposition sort, a network of alternating rounds that compare-and-swap the pairs
+(0, 1), (2, 3), ... and then (1, 2), (3, 4), ... (the parallel generalisation of Bubble
+Sort's adjacent swap). Every row runs the same comparators, so with NumPy each
+compare-exchange is applied to all rows at once using vectorised minimum/maximum calls
+instead of one Python call per row.
+
+- Time Complexity: O(n log² n) compare-exchanges per row for n <= 16, O(n²) beyond that
+- Per-Row Overhead: O(1) Python calls per comparator for the whole batch (NumPy path)
+- Space Complexity: O(rows × n) for a column-major working copy (NumPy path), O(n) otherwise
+- Stability: No (sorting networks move equal values independently)
+- NaN: Sorted above every number on the NumPy path (last ascending, first descending)
+
+NumPy is optional. Without it, or when the rows are not a rectangular numeric batch, each
+row is sorted in pure Python: short rows by the generated unrolled network, longer rows by
+odd-even transposition with Bubble Sort's early exit when a full pair of rounds makes no swaps.
+"""
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; fall back to per-row pure Python
+    np = None
+
+from sorting_algorithms.sorting_networks import NETWORKS, compile_network
+
+
+def _network_sort_rows(batch, reverse):
+    """Applies a sorting network to every row of a 2D NumPy array in place."""
+    n = batch.shape[1]
+    if n < 2:
+        return  # Nothing to compare
+    if n in NETWORKS:
+        comparators = [pair for layer in NETWORKS[n] for pair in layer]
+    else:
+        # Too long for a stored network: odd-even transposition rounds
+        comparators = [(j, j + 1) for r in range(n) for j in range(r % 2, n - 1, 2)]
+
+    # Work column-major so each comparator reads and writes two contiguous vectors
+    columns = np.ascontiguousarray(batch.T)
+    # minimum/maximum would copy a NaN into both slots, so NaN batches use an explicit
+    # exchange that orders NaN above every number (last ascending, first descending)
+    has_nan = columns.dtype.kind == "f" and bool(np.isnan(columns).any())
+    low = np.empty_like(columns[0])
+    for i, j in comparators:
+        if reverse:
+            i, j = j, i
+        if has_nan:
+            a, b = columns[i], columns[j]
+            swap = (b < a) | (np.isnan(a) & ~np.isnan(b))
+            low = np.where(swap, b, a)
+            columns[j] = np.where(swap, a, b)
+        else:
+            np.minimum(columns[i], columns[j], out=low)
+            np.maximum(columns[i], columns[j], out=columns[j])
+        columns[i] = low
+    batch[...] = columns.T
+
+
+def _network_sort_row(row, reverse):
+    """Sorts one list in place with a network, stopping early on odd-even transposition."""
+    n = len(row)
+    if n in NETWORKS:
+        row[:] = compile_network(n, reverse, keyed=False)(row)
+        return
+
+    quiet_rounds = 0
+    round_number = 0
+    while quiet_rounds < 2 and round_number < n:
+        swapped = False
+        for j in range(round_number % 2, n - 1, 2):
+            if (row[j] < row[j + 1]) if reverse else (row[j + 1] < row[j]):
+                row[j], row[j + 1] = row[j + 1], row[j]
+                swapped = True
+        # One quiet round only proves half the pairs are ordered; two prove all of them
+        quiet_rounds = 0 if swapped else quiet_rounds + 1
+        round_number += 1
+
+
+def batch_sort(rows, reverse=False):
+    """
+    Sorts every row of a 2D batch independently, in ascending or descending order.
+
+    Args:
+        rows (numpy.ndarray or list of lists): The batch to sort (modified in-place). A 2D
+                                               NumPy array is sorted with vectorised layers;
+                                               a list of lists may have rows of any length.
+        reverse (bool, optional): If True, sort each row in descending order. Defaults to False.
+
+    Returns:
+        numpy.ndarray or list: The sorted batch (same as input for convenience).
+
+    Raises:
+        TypeError: If row elements are not comparable.
+        ValueError: If a NumPy batch is not two-dimensional.
+    """
+    if np is not None and isinstance(rows, np.ndarray):
+        if rows.ndim != 2:
+            raise ValueError("batch_sort expects a 2D array (one row per list)")
+        _network_sort_rows(rows, reverse)
+        return rows
+
+    if not rows:
+        return rows  # Early return for empty batches
+
+    # Rectangular batches of all ints or all floats still benefit from the vectorised path.
+    # Mixed batches stay in Python: NumPy would turn every value into a float, which changes
+    # the caller's ints and loses precision above 2**53
+    if np is not None and len({len(row) for row in rows}) == 1 and \
+            {type(value) for row in rows for value in row} in ({int}, {float}):
+        batch = np.asarray(rows)
+        if batch.ndim == 2 and batch.dtype.kind in "iuf":  # Not object (ints wider than 64 bits)
+            _network_sort_rows(batch, reverse)
+            for row, sorted_row in zip(rows, batch.tolist()):
+                row[:] = sorted_row
+            return rows
+
+    try:
+        for row in rows:
+            _network_sort_row(row, reverse)
+    except TypeError as e:
+        raise TypeError(f"Elements are not comparable: {e}")
+    return rows
+
+# Example usage and testing
+if __name__ == "__main__":
+    # Test cases to demonstrate batched sorting behavior
+    test_cases = [
+        ([[5, 1, 4, 2, 3], [9, 8, 7, 6, 5], [1, 2, 3, 4, 5]], False),  # Rectangular batch
+        ([[3.5, -1.0, 2.25], [0.0, 0.0, -0.5]], True),                  # Floats, descending
+        ([[3.0, float("nan"), 1.0], [2.0, 0.5, 1.5]], False),           # NaN sorts last
+        ([[2 ** 60 + 1, 1], [0.5, 0.25]], False),                        # Mixed: ints kept exact
+        ([[4, 3, 2, 1], [2, 1], [], [7]], False),                        # Ragged rows
+        ([["pear", "apple"], ["fig", "date"]], False),                   # Strings (pure Python)
+        ([], False),                                                     # Empty batch
+        ([[1, "a", 2]], False),                                          # Not comparable
+    ]
+
+    # Run and display results for each test case
+    for test, rev in test_cases:
+        original = [list(row) for row in test]  # Preserve original for display
+        try:
+            sorted_batch = batch_sort(test, reverse=rev)
+            print(f"Input: {original} -> Sorted: {sorted_batch} (reverse={rev})")
+        except TypeError as e:
+            print(f"Error for input {original}: {e}")
+
+    if np is not None:
+        features = np.random.default_rng(0).integers(0, 100, size=(4, 8))
+        print(f"NumPy batch:\n{batch_sort(features)}")
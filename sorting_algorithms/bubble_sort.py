@@ -12,9 +12,31 @@ an optimization to exit early if no swaps are needed.
 - Stability: Yes (preserves relative order of equal elements)
 
 The implementation supports custom comparators via 'key' and 'reverse' parameters, similar
-to Python's sorted() function, for flexible sorting.
+to Python's sorted() function, for flexible sorting. When every key is an int, float, str or
+tuple of those, a specialised loop over precomputed keys is used (see type_specialization.py).
 """
 
+from sorting_algorithms.type_specialization import sort_specialized
+
+def _bubble_sort_keys(keys, values):
+    """Ascending Bubble Sort of values (or of keys alone if values is None) by precomputed keys."""
+    n = len(keys)
+    for i in range(n):
+        swapped = False
+        if values is None:
+            for j in range(n - i - 1):
+                if keys[j + 1] < keys[j]:
+                    keys[j], keys[j + 1] = keys[j + 1], keys[j]
+                    swapped = True
+        else:
+            for j in range(n - i - 1):
+                if keys[j + 1] < keys[j]:
+                    keys[j], keys[j + 1] = keys[j + 1], keys[j]
+                    values[j], values[j + 1] = values[j + 1], values[j]
+                    swapped = True
+        if not swapped:
+            break
+
 def bubble_sort(arr, key=None, reverse=False):
     """
     Sorts the input list in ascending or descending order using Bubble Sort.
@@ -38,6 +60,10 @@ def bubble_sort(arr, key=None, reverse=False):
     if key is not None and not callable(key):
         raise TypeError("key must be a callable function")
 
+    # Fast path: homogeneous keys need no key calls, try/except or reverse checks per step
+    if sort_specialized(arr, key, reverse, True, _bubble_sort_keys, share_keys=True):
+        return arr
+
     n = len(arr)
     
     # Traverse through all array elements
@@ -11,9 +11,35 @@ or nearly sorted datasets but inefficient for large datasets due to its O(n²) t
 - Stability: Yes (preserves relative order of equal elements)
 
 The implementation supports custom comparators via 'key' and 'reverse' parameters, similar
-to Python's sorted() function, for flexible sorting.
+to Python's sorted() function, for flexible sorting. When every key is an int, float, str or
+tuple of those, a specialised loop over precomputed keys is used (see type_specialization.py).
 """
 
+from sorting_algorithms.type_specialization import sort_specialized
+
+def _insertion_sort_keys(keys, values):
+    """Ascending Insertion Sort of values (or of keys alone if values is None) by precomputed keys."""
+    if values is None:
+        for i in range(1, len(keys)):
+            current_key = keys[i]
+            j = i - 1
+            while j >= 0 and current_key < keys[j]:
+                keys[j + 1] = keys[j]
+                j -= 1
+            keys[j + 1] = current_key
+        return
+
+    for i in range(1, len(keys)):
+        current_key = keys[i]
+        current_value = values[i]
+        j = i - 1
+        while j >= 0 and current_key < keys[j]:
+            keys[j + 1] = keys[j]
+            values[j + 1] = values[j]
+            j -= 1
+        keys[j + 1] = current_key
+        values[j + 1] = current_value
+
 def insertion_sort(arr, key=None, reverse=False):
     """
     Sorts the input list in ascending or descending order using Insertion Sort.
@@ -37,6 +63,10 @@ def insertion_sort(arr, key=None, reverse=False):
     if key is not None and not callable(key):
         raise TypeError("key must be a callable function")
 
+    # Fast path: homogeneous keys need no key calls, try/except or reverse checks per step
+    if sort_specialized(arr, key, reverse, True, _insertion_sort_keys, share_keys=True):
+        return arr
+
     # Traverse through elements starting from the second element
     for i in range(1, len(arr)):
         # The element to be inserted
@@ -51,10 +81,10 @@ def insertion_sort(arr, key=None, reverse=False):
             while j >= 0:
                 current_value = key(arr[j]) if key else arr[j]
                 if reverse:
-                    if current_value < key_value:
+                    if current_value >= key_value:
                         break
                 else:
-                    if current_value > key_value:
+                    if current_value <= key_value:
                         break
                 arr[j + 1] = arr[j]  # Shift element to the right
                 j -= 1
@@ -86,5 +116,3 @@ if __name__ == "__main__":
             print(f"Input: {original} -> Sorted: {sorted_list} (key={key_func}, reverse={rev})")
         except TypeError as e:
             print(f"Error for input {original}: {e}")
-        sorted_list = insertion_sort(test)
-        print(f"Input: {original} -> Sorted: {sorted_list}")
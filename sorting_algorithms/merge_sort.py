@@ -11,10 +11,51 @@ but requires O(n) extra space.
 - Stability: Yes (preserves relative order of equal elements)
 
 The implementation supports custom comparators via 'key' and 'reverse' parameters, similar
-to Python's sorted() function, for flexible sorting.
+to Python's sorted() function, for flexible sorting. Sublists of up to NETWORK_CUTOFF
+elements are sorted with a stable, unrolled sorting network instead of being split further
+(see sorting_networks.py). When every key is an int, float, str or tuple of those, a
+specialised loop over precomputed keys is used (see type_specialization.py).
 """
 
-def merge_sort(arr, key=None, reverse=False):
+from sorting_algorithms.sorting_networks import MAX_NETWORK_SIZE, compile_network, network_sort
+from sorting_algorithms.type_specialization import sort_specialized
+
+NETWORK_CUTOFF = 16  # Sublists this small are sorted by a network (0 disables)
+
+def _merge_sort_keys(keys, values, network_cutoff):
+    """Ascending, stable Merge Sort of values by precomputed, mutually comparable keys."""
+    def merge_sort_helper(keys, values):
+        n = len(keys)
+        if n <= 1:
+            return keys, values
+        if n <= network_cutoff:
+            return compile_network(n, stable=True)(keys, values)
+
+        mid = n // 2
+        left_keys, left_values = merge_sort_helper(keys[:mid], values[:mid])
+        right_keys, right_values = merge_sort_helper(keys[mid:], values[mid:])
+
+        merged_keys, merged_values = [], []
+        i = j = 0
+        left_len, right_len = len(left_keys), len(right_keys)
+        while i < left_len and j < right_len:
+            # Taking from the right only when strictly smaller keeps the merge stable
+            if right_keys[j] < left_keys[i]:
+                merged_keys.append(right_keys[j])
+                merged_values.append(right_values[j])
+                j += 1
+            else:
+                merged_keys.append(left_keys[i])
+                merged_values.append(left_values[i])
+                i += 1
+        merged_keys += left_keys[i:] + right_keys[j:]
+        merged_values += left_values[i:] + right_values[j:]
+        return merged_keys, merged_values
+
+    sorted_values = merge_sort_helper(keys, values)[1]
+    values[:] = sorted_values
+
+def merge_sort(arr, key=None, reverse=False, network_cutoff=NETWORK_CUTOFF):
     """
     Sorts the input list in ascending or descending order using Merge Sort.
 
@@ -23,12 +64,15 @@ def merge_sort(arr, key=None, reverse=False):
         key (callable, optional): A function to extract a comparison key from each element.
                                  Defaults to None (direct comparison).
         reverse (bool, optional): If True, sort in descending order. Defaults to False.
+        network_cutoff (int, optional): Largest sublist sorted by a sorting network, up to
+                                        MAX_NETWORK_SIZE. Defaults to NETWORK_CUTOFF.
 
     Returns:
         list: The sorted list (same as input for convenience).
 
     Raises:
         TypeError: If elements are not comparable or key function is invalid.
+        ValueError: If network_cutoff is larger than MAX_NETWORK_SIZE.
     """
     if not arr:
         return arr  # Early return for empty lists
@@ -36,6 +80,15 @@ def merge_sort(arr, key=None, reverse=False):
     # Validate input types
     if key is not None and not callable(key):
         raise TypeError("key must be a callable function")
+    if network_cutoff > MAX_NETWORK_SIZE:
+        raise ValueError(f"network_cutoff must be at most {MAX_NETWORK_SIZE}")
+
+    # Fast path: homogeneous keys need no key calls, try/except or reverse checks per step
+    def sort_keys(keys, values):
+        _merge_sort_keys(keys, values, network_cutoff)
+
+    if sort_specialized(arr, key, reverse, True, sort_keys):
+        return arr
 
     def merge(left, right):
         """Merges two sorted arrays into a single sorted array."""
@@ -75,6 +128,12 @@ def merge_sort(arr, key=None, reverse=False):
         """Recursively divides and sorts the array."""
         if len(arr) <= 1:
             return arr
+        if len(arr) <= network_cutoff:
+            # Small sublist: sort it with a stable network instead of splitting further
+            try:
+                return network_sort(arr, key=key, reverse=reverse, stable=True)
+            except TypeError as e:
+                raise TypeError(f"Elements are not comparable: {e}")
 
         # Split array into two halves
         mid = len(arr) // 2
@@ -13,9 +13,55 @@ O(n²) worst-case time complexity.
 
 The implementation supports custom comparators via 'key' and 'reverse' parameters, similar
 to Python's sorted() function, and uses the last element as the pivot for simplicity.
+Partitions of up to NETWORK_CUTOFF elements are finished with an unrolled sorting network
+instead of recursing further (see sorting_networks.py). When every key is an int, float,
+str or tuple of those, a specialised loop over precomputed keys is used
+(see type_specialization.py).
 """
 
-def quick_sort(arr, key=None, reverse=False):
+from sorting_algorithms.sorting_networks import MAX_NETWORK_SIZE, compile_network, network_sort
+from sorting_algorithms.type_specialization import sort_specialized
+
+NETWORK_CUTOFF = 12  # Partitions this small are sorted by a network (0 disables)
+
+def _quick_sort_keys(keys, values, network_cutoff):
+    """Ascending QuickSort of values (or of keys alone if values is None) by precomputed keys."""
+    def quick_sort_helper(low, high):
+        if high - low < network_cutoff:
+            n = high - low + 1
+            if values is None:
+                keys[low:high + 1] = compile_network(n, keyed=False)(keys[low:high + 1])
+            else:
+                keys[low:high + 1], values[low:high + 1] = compile_network(n)(
+                    keys[low:high + 1], values[low:high + 1])
+            return
+        if low >= high:
+            return
+
+        pivot = keys[high]
+        i = low - 1
+        if values is None:
+            for j in range(low, high):
+                if keys[j] <= pivot:
+                    i += 1
+                    keys[i], keys[j] = keys[j], keys[i]
+        else:
+            for j in range(low, high):
+                if keys[j] <= pivot:
+                    i += 1
+                    keys[i], keys[j] = keys[j], keys[i]
+                    values[i], values[j] = values[j], values[i]
+        i += 1
+        keys[i], keys[high] = keys[high], keys[i]
+        if values is not None:
+            values[i], values[high] = values[high], values[i]
+
+        quick_sort_helper(low, i - 1)
+        quick_sort_helper(i + 1, high)
+
+    quick_sort_helper(0, len(keys) - 1)
+
+def quick_sort(arr, key=None, reverse=False, network_cutoff=NETWORK_CUTOFF):
     """
     Sorts the input list in ascending or descending order using QuickSort.
 
@@ -24,12 +70,15 @@ def quick_sort(arr, key=None, reverse=False):
         key (callable, optional): A function to extract a comparison key from each element.
                                  Defaults to None (direct comparison).
         reverse (bool, optional): If True, sort in descending order. Defaults to False.
+        network_cutoff (int, optional): Largest partition finished by a sorting network,
+                                        up to MAX_NETWORK_SIZE. Defaults to NETWORK_CUTOFF.
 
     Returns:
         list: The sorted list (same as input for convenience).
 
     Raises:
         TypeError: If elements are not comparable or key function is invalid.
+        ValueError: If network_cutoff is larger than MAX_NETWORK_SIZE.
     """
     if not arr:
         return arr  # Early return for empty lists
@@ -37,6 +86,15 @@ def quick_sort(arr, key=None, reverse=False):
     # Validate input types
     if key is not None and not callable(key):
         raise TypeError("key must be a callable function")
+    if network_cutoff > MAX_NETWORK_SIZE:
+        raise ValueError(f"network_cutoff must be at most {MAX_NETWORK_SIZE}")
+
+    # Fast path: homogeneous keys need no key calls, try/except or reverse checks per step
+    def sort_keys(keys, values):
+        _quick_sort_keys(keys, values, network_cutoff)
+
+    if sort_specialized(arr, key, reverse, False, sort_keys, share_keys=True):
+        return arr
 
     def partition(low, high):
         """Partitions the array around a pivot (last element) and returns the pivot index."""
@@ -65,7 +123,13 @@ def quick_sort(arr, key=None, reverse=False):
 
     def quick_sort_helper(low, high):
         """Recursively sorts the array by partitioning and sorting subarrays."""
-        if low < high:
+        if high - low < network_cutoff:
+            # Small partition: finish it with a sorting network instead of recursing
+            try:
+                network_sort(arr, low, high + 1, key=key, reverse=reverse)
+            except TypeError as e:
+                raise TypeError(f"Elements are not comparable: {e}")
+        elif low < high:
             # Find pivot index
             pi = partition(low, high)
             # Recursively sort elements before and after pivot
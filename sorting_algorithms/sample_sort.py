@@ -0,0 +1,233 @@
+"""
+Parallel Sample Sort Algorithm
+=============================
+This module implements a parallel Sample Sort for numeric data held in a
+multiprocessing.shared_memory block. Sample Sort generalises Quick Sort to many pivots: it
+draws a random sample, picks evenly spaced splitters from it, routes every element to the
+bucket between two splitters, and then sorts the buckets independently. Because the buckets
+do not overlap, the sorted buckets laid end to end form the sorted output.
+
+Each worker process attaches to the shared block by name, so only block names, offsets and
+bucket counts cross process boundaries. The data itself is never pickled.
+
+- Phase 1: each worker groups its slice of the buffer by bucket (in place) and counts sizes
+- Phase 2: each worker gathers one bucket from every slice into the output block and sorts it
+- Average Case: O(n log n / p) per worker for p workers on well-spread data
+- Space Complexity: O(n) for the shared output block
+- Stability: Not applicable (numeric values of one type are indistinguishable)
+
+Only plain numbers are supported: an array.array, or a list of all-int or all-float values.
+Small inputs, and lists that mix ints and floats, are sorted in-process instead.
+"""
+
+import os
+import random
+from array import array
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+SEQUENTIAL_CUTOFF = 100_000  # Below this many elements, process start-up costs more than it saves
+OVERSAMPLING = 32            # Sample elements drawn per bucket when choosing splitters
+
+
+def _attach(name, typecode, length):
+    """Attaches to a shared block and returns it with a typed view of its first `length` items."""
+    shm = shared_memory.SharedMemory(name=name)
+    itemsize = array(typecode).itemsize
+    # The block may be larger than requested (page rounding), so cut the view to size
+    view = shm.buf[:length * itemsize].cast(typecode)
+    return shm, view
+
+
+def _partition_slice(name, typecode, length, start, stop, splitters):
+    """Groups buffer[start:stop] by bucket in place and returns the size of each bucket."""
+    shm, view = _attach(name, typecode, length)
+    try:
+        buckets = [array(typecode) for _ in range(len(splitters) + 1)]
+        for value in view[start:stop]:
+            buckets[bisect_right(splitters, value)].append(value)
+
+        position = start
+        for bucket in buckets:
+            view[position:position + len(bucket)] = bucket
+            position += len(bucket)
+        return [len(bucket) for bucket in buckets]
+    finally:
+        view.release()
+        shm.close()
+
+
+def _sort_bucket(name, out_name, typecode, length, pieces, out_start):
+    """Copies one bucket's pieces into the output block and sorts them there."""
+    shm, view = _attach(name, typecode, length)
+    out_shm, out_view = _attach(out_name, typecode, length)
+    try:
+        position = out_start
+        for start, size in pieces:
+            out_view[position:position + size] = view[start:start + size]
+            position += size
+        out_view[out_start:position] = array(typecode, sorted(out_view[out_start:position]))
+    finally:
+        view.release()
+        out_view.release()
+        shm.close()
+        out_shm.close()
+
+
+def sample_sort_shared(name, typecode, length, workers=None, reverse=False):
+    """
+    Sorts the first `length` numbers of an existing shared memory block in place.
+
+    This is the zero-copy entry point for callers that already keep their data in
+    shared memory; parallel_sample_sort() wraps it for lists and arrays.
+
+    Args:
+        name (str): Name of the multiprocessing.shared_memory block holding the data.
+        typecode (str): array module typecode of the stored values (e.g. 'd' or 'q').
+        length (int): Number of values stored at the start of the block.
+        workers (int, optional): Number of worker processes. Defaults to os.cpu_count().
+        reverse (bool, optional): If True, sort in descending order. Defaults to False.
+
+    Raises:
+        ValueError: If workers is not a positive integer.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    elif workers < 1:
+        raise ValueError("workers must be a positive integer")
+
+    shm, view = _attach(name, typecode, length)
+    try:
+        if workers == 1 or length < SEQUENTIAL_CUTOFF:
+            view[:] = array(typecode, sorted(view, reverse=reverse))
+            return
+
+        # Step 1: Choose workers - 1 splitters from a random sample of the buffer
+        sample = sorted(view[random.randrange(length)] for _ in range(workers * OVERSAMPLING))
+        splitters = sample[OVERSAMPLING::OVERSAMPLING][:workers - 1]
+    finally:
+        view.release()
+        shm.close()
+
+    bounds = [length * w // workers for w in range(workers + 1)]
+    out_shm = shared_memory.SharedMemory(create=True, size=max(1, length * array(typecode).itemsize))
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            # Step 2: Each worker buckets its own slice and reports bucket sizes
+            counts = list(pool.map(
+                _partition_slice,
+                [name] * workers, [typecode] * workers, [length] * workers,
+                bounds[:-1], bounds[1:], [splitters] * workers,
+            ))
+
+            # Step 3: Work out where each bucket's pieces live and where the bucket lands
+            jobs = []
+            out_start = 0
+            for b in range(len(splitters) + 1):
+                pieces = []
+                for w in range(workers):
+                    offset = bounds[w] + sum(counts[w][:b])
+                    pieces.append((offset, counts[w][b]))
+                jobs.append((pieces, out_start))
+                out_start += sum(size for _, size in pieces)
+
+            # Step 4: Sort every bucket in parallel, straight into the output block
+            list(pool.map(
+                _sort_bucket,
+                [name] * len(jobs), [out_shm.name] * len(jobs), [typecode] * len(jobs),
+                [length] * len(jobs), [pieces for pieces, _ in jobs], [start for _, start in jobs],
+            ))
+
+        # Write the result back into the caller's block
+        nbytes = length * array(typecode).itemsize
+        shm = shared_memory.SharedMemory(name=name)
+        try:
+            shm.buf[:nbytes] = out_shm.buf[:nbytes]
+            if reverse:
+                view = shm.buf[:nbytes].cast(typecode)
+                view[:] = array(typecode, reversed(view))
+                view.release()
+        finally:
+            shm.close()
+    finally:
+        out_shm.close()
+        out_shm.unlink()
+
+
+def parallel_sample_sort(arr, reverse=False, workers=None):
+    """
+    Sorts a list or array.array of numbers in ascending or descending order using a
+    parallel Sample Sort over shared memory.
+
+    Args:
+        arr (list or array.array): The numbers to be sorted (modified in-place).
+        reverse (bool, optional): If True, sort in descending order. Defaults to False.
+        workers (int, optional): Number of worker processes. Defaults to os.cpu_count().
+
+    Returns:
+        list or array.array: The sorted sequence (same as input for convenience).
+
+    Raises:
+        TypeError: If the elements are not plain numbers.
+        ValueError: If workers is not a positive integer.
+    """
+    if workers is not None and workers < 1:
+        raise ValueError("workers must be a positive integer")  # Even where no pool is started
+    if not arr:
+        return arr  # Early return for empty lists
+
+    if isinstance(arr, array):
+        typecode = arr.typecode
+        if typecode == "u":
+            raise TypeError("parallel_sample_sort only supports numeric arrays")
+    elif all(type(x) is int for x in arr):
+        typecode = "q"
+    elif all(type(x) is float for x in arr):
+        typecode = "d"
+    elif all(type(x) in (int, float) for x in arr):
+        arr.sort(reverse=reverse)  # Mixed ints and floats cannot share one typed buffer
+        return arr
+    else:
+        raise TypeError("parallel_sample_sort only supports int or float elements")
+
+    try:
+        data = array(typecode, arr)
+    except OverflowError:
+        arr.sort(reverse=reverse)  # Integers too wide for a 64-bit buffer
+        return arr
+
+    shm = shared_memory.SharedMemory(create=True, size=len(data) * data.itemsize)
+    try:
+        shm.buf[:len(data) * data.itemsize] = data.tobytes()
+        sample_sort_shared(shm.name, typecode, len(data), workers=workers, reverse=reverse)
+        data = array(typecode, shm.buf[:len(data) * data.itemsize].tobytes())
+    finally:
+        shm.close()
+        shm.unlink()
+
+    arr[:] = data if isinstance(arr, array) else data.tolist()
+    return arr
+
+# Example usage and testing
+if __name__ == "__main__":
+    # Test cases to demonstrate Parallel Sample Sort behavior
+    random.seed(42)
+    test_cases = [
+        ([64, 34, 25, 12, 22, 11, 90], False, 2),                      # Small list, in-process
+        ([5.5, 4.4, 3.3, 2.2, 1.1], True, 2),                          # Floats, descending
+        ([], False, 2),                                                # Empty list
+        ([random.randint(-10**6, 10**6) for _ in range(200_000)], False, 4),  # Parallel path
+        (array("d", (random.random() for _ in range(200_000))), True, 4),     # Shared array
+    ]
+
+    # Run and display results for each test case
+    for test, rev, workers in test_cases:
+        original = list(test)
+        try:
+            sorted_list = parallel_sample_sort(test, reverse=rev, workers=workers)
+            ok = list(sorted_list) == sorted(original, reverse=rev)
+            shown = original if len(original) <= 10 else f"<{len(original)} numbers>"
+            print(f"Input: {shown} -> Correct: {ok} (reverse={rev}, workers={workers})")
+        except TypeError as e:
+            print(f"Error for input {original}: {e}")
@@ -11,9 +11,27 @@ beginning. It is not stable and inefficient for large datasets due to its O(n²)
 - Stability: No (swaps may disrupt relative order of equal elements)
 
 The implementation supports custom comparators via 'key' and 'reverse' parameters, similar
-to Python's sorted() function, for flexible sorting.
+to Python's sorted() function, for flexible sorting. When every key is an int, float, str or
+tuple of those, a specialised loop over precomputed keys is used (see type_specialization.py).
 """
 
+from sorting_algorithms.type_specialization import sort_specialized
+
+def _selection_sort_keys(keys, values):
+    """Ascending Selection Sort of values (or of keys alone if values is None) by precomputed keys."""
+    n = len(keys)
+    for i in range(n):
+        min_index = i
+        min_key = keys[i]
+        for j in range(i + 1, n):
+            if keys[j] < min_key:
+                min_index = j
+                min_key = keys[j]
+        if min_index != i:
+            keys[i], keys[min_index] = min_key, keys[i]
+            if values is not None:
+                values[i], values[min_index] = values[min_index], values[i]
+
 def selection_sort(arr, key=None, reverse=False):
     """
     Sorts the input list in ascending or descending order using Selection Sort.
@@ -37,6 +55,10 @@ def selection_sort(arr, key=None, reverse=False):
     if key is not None and not callable(key):
         raise TypeError("key must be a callable function")
 
+    # Fast path: homogeneous keys need no key calls, try/except or reverse checks per step
+    if sort_specialized(arr, key, reverse, False, _selection_sort_keys, share_keys=True):
+        return arr
+
     n = len(arr)
     
     # Traverse through all elements
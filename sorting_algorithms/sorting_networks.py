@@ -0,0 +1,195 @@
+"""
+Sorting Networks (Small-Range Base Case)
+=======================================
+This module provides fixed sorting networks for up to 16 elements. A sorting network is a
+predetermined sequence of compare-exchange steps: compare positions i and j, and swap them if
+they are out of order. Because the sequence never depends on the data, it can be generated
+once per size as straight-line ("unrolled") Python code over local variables, which avoids the
+loop counters, index arithmetic and branches of Insertion Sort at the leaves of the hybrid
+sorts.
+
+- Time Complexity: O(1) per call for a fixed n (e.g. 19 compare-exchanges for n = 8, 60 for n = 16)
+- Space Complexity: O(n) for the precomputed keys
+- Stability: Optional (stable=True breaks ties on original position)
+
+Networks are layered: comparators within a layer touch disjoint positions, so they can also be
+applied to many rows at once (see batch_sort.py). The tables for n <= 12 and n = 16 are the
+smallest known networks for those sizes; n = 13..15 are derived from the 16-element network by
+dropping its top channels (46, 51 and 56 comparators).
+
+Keys are computed once per element before the network runs, so a 'key' function costs n calls
+rather than two calls per comparison.
+"""
+
+# Layered comparator tables: NETWORKS[n] is a list of layers of (i, j) pairs with i < j
+NETWORKS = {
+    0: [],
+    1: [],
+    2: [[(0, 1)]],
+    3: [[(0, 2)], [(0, 1)], [(1, 2)]],
+    4: [[(0, 2), (1, 3)], [(0, 1), (2, 3)], [(1, 2)]],
+    5: [[(0, 3), (1, 4)], [(0, 2), (1, 3)], [(0, 1), (2, 4)], [(1, 2), (3, 4)], [(2, 3)]],
+    6: [[(0, 5), (1, 3), (2, 4)], [(1, 2), (3, 4)], [(0, 3), (2, 5)], [(0, 1), (2, 3), (4, 5)],
+        [(1, 2), (3, 4)]],
+    7: [[(0, 6), (2, 3), (4, 5)], [(0, 2), (1, 4), (3, 6)], [(0, 1), (2, 5), (3, 4)],
+        [(1, 2), (4, 6)], [(2, 3), (4, 5)], [(1, 2), (3, 4), (5, 6)]],
+    8: [[(0, 2), (1, 3), (4, 6), (5, 7)], [(0, 4), (1, 5), (2, 6), (3, 7)],
+        [(0, 1), (2, 3), (4, 5), (6, 7)], [(2, 4), (3, 5)], [(1, 4), (3, 6)],
+        [(1, 2), (3, 4), (5, 6)]],
+    9: [[(0, 3), (1, 7), (2, 5), (4, 8)], [(0, 7), (2, 4), (3, 8), (5, 6)],
+        [(0, 2), (1, 3), (4, 5), (7, 8)], [(1, 4), (3, 6), (5, 7)],
+        [(0, 1), (2, 4), (3, 5), (6, 8)], [(2, 3), (4, 5), (6, 7)], [(1, 2), (3, 4), (5, 6)]],
+    10: [[(0, 8), (1, 9), (2, 7), (3, 5), (4, 6)], [(0, 2), (1, 4), (5, 8), (7, 9)],
+         [(0, 3), (2, 4), (5, 7), (6, 9)], [(0, 1), (3, 6), (8, 9)],
+         [(1, 5), (2, 3), (4, 8), (6, 7)], [(1, 2), (3, 5), (4, 6), (7, 8)],
+         [(2, 3), (4, 5), (6, 7)], [(3, 4), (5, 6)]],
+    11: [[(0, 9), (1, 6), (2, 4), (3, 7), (5, 8)], [(0, 1), (3, 5), (4, 10), (6, 9), (7, 8)],
+         [(1, 3), (2, 5), (4, 7), (8, 10)], [(0, 4), (1, 2), (3, 7), (5, 9), (6, 8)],
+         [(0, 1), (2, 6), (4, 5), (7, 8), (9, 10)], [(2, 4), (3, 6), (5, 7), (8, 9)],
+         [(1, 2), (3, 4), (5, 6), (7, 8)], [(2, 3), (4, 5), (6, 7)]],
+    12: [[(0, 8), (1, 7), (2, 6), (3, 11), (4, 10), (5, 9)],
+         [(0, 1), (2, 5), (3, 4), (6, 9), (7, 8), (10, 11)], [(0, 2), (1, 6), (5, 10), (9, 11)],
+         [(0, 3), (1, 2), (4, 6), (5, 7), (8, 11), (9, 10)], [(1, 4), (3, 5), (6, 8), (7, 10)],
+         [(1, 3), (2, 5), (6, 9), (8, 10)], [(2, 3), (4, 5), (6, 7), (8, 9)], [(4, 6), (5, 7)],
+         [(3, 4), (5, 6), (7, 8)]],
+    16: [[(0, 13), (1, 12), (2, 15), (3, 14), (4, 8), (5, 6), (7, 11), (9, 10)],
+         [(0, 5), (1, 7), (2, 9), (3, 4), (6, 13), (8, 14), (10, 15), (11, 12)],
+         [(0, 1), (2, 3), (4, 5), (6, 8), (7, 9), (10, 11), (12, 13), (14, 15)],
+         [(0, 2), (1, 3), (4, 10), (5, 11), (6, 7), (8, 9), (12, 14), (13, 15)],
+         [(1, 2), (3, 12), (4, 6), (5, 7), (8, 10), (9, 11), (13, 14)],
+         [(1, 4), (2, 6), (5, 8), (7, 10), (9, 13), (11, 14)],
+         [(2, 4), (3, 6), (9, 12), (11, 13)], [(3, 5), (6, 8), (7, 9), (10, 12)],
+         [(3, 4), (5, 6), (7, 8), (9, 10), (11, 12)], [(6, 7), (8, 9)]],
+}
+
+# Fixing the top channels of the 16-element network to +infinity means no comparator on them
+# ever swaps, so dropping those comparators leaves a valid network for fewer elements
+for _n in (13, 14, 15):
+    NETWORKS[_n] = []
+    for _layer in NETWORKS[16]:
+        _kept = [(i, j) for i, j in _layer if j < _n]
+        if _kept:
+            NETWORKS[_n].append(_kept)
+del _n, _layer, _kept
+
+MAX_NETWORK_SIZE = max(NETWORKS)
+
+_compiled = {}  # (n, reverse, stable, keyed) -> generated function
+
+
+def compile_network(n, reverse=False, stable=False, keyed=True):
+    """
+    Returns an unrolled sorting function for exactly n elements.
+
+    The generated function takes (keys, values) when keyed, or just (values) otherwise, and
+    returns new sorted lists in the same shape: (keys, values) or values.
+
+    Args:
+        n (int): Number of elements the function sorts (0 to MAX_NETWORK_SIZE).
+        reverse (bool, optional): If True, sort in descending order. Defaults to False.
+        stable (bool, optional): If True, equal keys keep their original order. Defaults to False.
+        keyed (bool, optional): If True, sort values by a separate list of keys. Defaults to True.
+
+    Returns:
+        callable: The generated sorting function (cached per argument combination).
+
+    Raises:
+        ValueError: If there is no network for n elements.
+    """
+    signature = (n, reverse, stable, keyed)
+    if signature in _compiled:
+        return _compiled[signature]
+    if n not in NETWORKS:
+        raise ValueError(f"No sorting network for {n} elements (maximum is {MAX_NETWORK_SIZE})")
+
+    k = [f"k{i}" for i in range(n)]
+    v = [f"v{i}" for i in range(n)] if keyed else k
+    lines = ["def network(keys, values):" if keyed else "def network(values):"]
+    if n:
+        lines.append(f"    {', '.join(k)}, = keys" if keyed else f"    {', '.join(k)}, = values")
+        if keyed:
+            lines.append(f"    {', '.join(v)}, = values")
+        if stable:
+            lines.append(f"    {', '.join(f'i{i}' for i in range(n))}, = range({n})")
+
+    for layer in NETWORKS[n]:
+        for i, j in layer:
+            # "Position j must come before position i" for the requested order
+            first, second = (f"k{i}", f"k{j}") if reverse else (f"k{j}", f"k{i}")
+            condition = f"{first} < {second}"
+            if stable:
+                condition += f" or (not {second} < {first} and i{j} < i{i})"
+            names = [f"k{i}", f"k{j}"]
+            if keyed:
+                names += [f"v{i}", f"v{j}"]
+            if stable:
+                names += [f"i{i}", f"i{j}"]
+            swapped = [names[x + 1] if x % 2 == 0 else names[x - 1] for x in range(len(names))]
+            lines.append(f"    if {condition}:")
+            lines.append(f"        {', '.join(names)} = {', '.join(swapped)}")
+
+    if keyed:
+        lines.append(f"    return [{', '.join(k)}], [{', '.join(v)}]")
+    else:
+        lines.append(f"    return [{', '.join(k)}]")
+
+    namespace = {}
+    exec("\n".join(lines), namespace)
+    _compiled[signature] = namespace["network"]
+    return namespace["network"]
+
+
+def network_sort(arr, lo=0, hi=None, key=None, reverse=False, stable=False):
+    """
+    Sorts arr[lo:hi] in place with a sorting network.
+
+    Args:
+        arr (list): The list containing the range to be sorted (modified in-place).
+        lo (int, optional): Start of the range. Defaults to 0.
+        hi (int, optional): End of the range (exclusive). Defaults to len(arr).
+        key (callable, optional): A function to extract a comparison key from each element.
+                                 Defaults to None (direct comparison).
+        reverse (bool, optional): If True, sort in descending order. Defaults to False.
+        stable (bool, optional): If True, equal keys keep their original order. Defaults to False.
+
+    Returns:
+        list: The list with the range sorted (same as input for convenience).
+
+    Raises:
+        TypeError: If elements are not comparable.
+        ValueError: If the range is longer than MAX_NETWORK_SIZE.
+    """
+    if hi is None:
+        hi = len(arr)
+    if key is None:
+        arr[lo:hi] = compile_network(hi - lo, reverse, stable, keyed=False)(arr[lo:hi])
+    else:
+        values = arr[lo:hi]
+        arr[lo:hi] = compile_network(hi - lo, reverse, stable)([key(x) for x in values], values)[1]
+    return arr
+
+# Example usage and testing
+if __name__ == "__main__":
+    # Test cases to demonstrate sorting network behavior
+    test_cases = [
+        ([64, 34, 25, 12, 22, 11, 90], None, False, False),  # Random list, default sorting
+        ([1, 2, 3, 4, 5], None, False, False),               # Already sorted
+        ([5, 4, 3, 2, 1], None, True, False),                # Reverse sorted, descending
+        ([], None, False, False),                            # Empty list
+        ([1], None, False, False),                           # Single element
+        ([{"val": 3}, {"val": 1}, {"val": 2}], lambda x: x["val"], False, False),  # Custom key
+        ([(2, "a"), (1, "b"), (2, "c"), (1, "d")], lambda x: x[0], True, True),    # Stable, descending
+        (list(range(16, 0, -1)), None, False, False),        # Largest network
+    ]
+
+    # Run and display results for each test case
+    for test, key_func, rev, stab in test_cases:
+        original = test.copy()  # Preserve original for display
+        try:
+            sorted_list = network_sort(test, key=key_func, reverse=rev, stable=stab)
+            print(f"Input: {original} -> Sorted: {sorted_list} (key={key_func}, reverse={rev}, stable={stab})")
+        except (TypeError, ValueError) as e:
+            print(f"Error for input {original}: {e}")
+
+    sizes = {n: sum(len(layer) for layer in NETWORKS[n]) for n in sorted(NETWORKS)}
+    print(f"Comparators per network size: {sizes}")
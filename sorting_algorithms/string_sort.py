@@ -0,0 +1,143 @@
+"""
+MSD Radix Sort Algorithm (String Sort)
+=====================================
+This module implements most-significant-digit (MSD) radix sort, a sorting algorithm
+specialised for strings. Instead of comparing whole strings, it distributes a partition into
+one bucket per character at position d, then sorts each bucket on position d + 1. Before
+distributing, it skips the prefix shared by the whole partition in one step, so a long
+common prefix (think "The ...") is examined once per partition rather than once per
+comparison, and characters are only inspected past that prefix.
+
+- Time Complexity: O(D + n) character inspections, where D is the total length of the
+  distinguishing prefixes, plus sorting the few distinct characters of each partition
+- Worst Case: Same as average (there are no pivots, so there is no quadratic case)
+- Space Complexity: O(n) for the precomputed keys, index permutation and buckets
+- Stability: Yes (strings that compare equal keep their original order)
+
+The implementation supports 'key' and 'reverse' parameters, similar to Python's sorted()
+function. Keys are computed exactly once per element, so an expensive collation key such as
+locale.strxfrm or the 'casefold' option costs n calls rather than one call per comparison.
+"""
+
+from os.path import commonprefix
+
+SMALL_PARTITION = 12  # Partitions at or below this size finish with Insertion Sort
+
+
+def msd_radix_sort(arr, key=None, reverse=False, casefold=False):
+    """
+    Sorts a list by string keys in ascending or descending order using MSD radix sort.
+
+    Args:
+        arr (list): The list to be sorted (modified in-place).
+        key (callable, optional): A function to extract a string key from each element.
+                                 Defaults to None (elements are the strings).
+        reverse (bool, optional): If True, sort in descending order. Defaults to False.
+        casefold (bool, optional): If True, compare keys case-insensitively using
+                                  str.casefold(), computed once per element. Defaults to False.
+
+    Returns:
+        list: The sorted list (same as input for convenience).
+
+    Raises:
+        TypeError: If a key is not a string or the key function is invalid.
+    """
+    if not arr:
+        return arr  # Early return for empty lists
+
+    # Validate input types
+    if key is not None and not callable(key):
+        raise TypeError("key must be a callable function")
+
+    # Compute every key once, up front
+    keys = [key(x) for x in arr] if key else list(arr)
+    for k in keys:
+        if not isinstance(k, str):
+            raise TypeError(f"msd_radix_sort requires string keys, got {type(k).__name__}")
+    if casefold:
+        keys = [k.casefold() for k in keys]
+
+    def insertion_sort(order, lo, hi):
+        """Sorts a small partition by full key, breaking ties by original position."""
+        for i in range(lo + 1, hi):
+            current = order[i]
+            current_key = keys[current]
+            j = i - 1
+            while j >= lo:
+                prev = order[j]
+                prev_key = keys[prev]
+                # Equal keys are ordered by index (descending when reversing, see below)
+                if prev_key < current_key or (prev_key == current_key and (prev > current) == reverse):
+                    break
+                order[j + 1] = prev
+                j -= 1
+            order[j + 1] = current
+
+    order = list(range(len(arr)))
+    if reverse:
+        order.reverse()
+    stack = [(0, len(arr), 0)]  # Explicit stack of (lo, hi, depth) keeps recursion bounded
+
+    while stack:
+        lo, hi, d = stack.pop()
+        if hi - lo <= SMALL_PARTITION:
+            insertion_sort(order, lo, hi)
+            continue
+
+        # Skip the prefix shared by the whole partition in one step: every key lies
+        # between the smallest and largest, so their common prefix is everyone's
+        group = order[lo:hi]
+        group_keys = [keys[i] for i in group]
+        d = max(d, len(commonprefix([min(group_keys), max(group_keys)])))
+
+        # Character at depth d for each key ("" once a key is exhausted, which sorts first)
+        chars = [k[d:d + 1] for k in group_keys]
+
+        # Distribute the partition into one bucket per distinct character, in a single
+        # pass that keeps each bucket in its original relative order (so it stays stable)
+        buckets = {}
+        for i, ch in zip(group, chars):
+            bucket = buckets.get(ch)
+            if bucket is None:
+                buckets[ch] = [i]
+            else:
+                bucket.append(i)
+
+        position = lo
+        for ch in sorted(buckets):
+            bucket = buckets[ch]
+            end = position + len(bucket)
+            order[position:end] = bucket
+            if ch and end - position > 1:
+                stack.append((position, end, d + 1))  # Exhausted keys ("") are identical
+            position = end
+
+    # Equal keys were kept in descending index order for reverse, so flipping the
+    # whole permutation yields a stable descending sort
+    if reverse:
+        order.reverse()
+    arr[:] = [arr[i] for i in order]
+    return arr
+
+# Example usage and testing
+if __name__ == "__main__":
+    # Test cases to demonstrate MSD Radix Sort behavior
+    test_cases = [
+        (["banana", "apple", "cherry", "apple pie", "app"], None, False, False),  # Shared prefixes
+        (["The Wall", "the Joshua Tree", "The Wall", "Thriller"], None, True, False),  # Descending
+        (["b", "B", "a", "A"], None, False, True),                                # Casefold
+        ([], None, False, False),                                                 # Empty list
+        (["solo"], None, False, False),                                           # Single element
+        ([{"isbn": "978-0-06"}, {"isbn": "978-0-00"}, {"isbn": "0-14"}],
+         lambda x: x["isbn"], False, False),                                      # Custom key
+        ([3, 1, 2], None, False, False),                                          # Not strings
+    ]
+
+    # Run and display results for each test case
+    for test, key_func, rev, fold in test_cases:
+        original = test.copy()  # Preserve original for display
+        try:
+            sorted_list = msd_radix_sort(test, key=key_func, reverse=rev, casefold=fold)
+            print(f"Input: {original} -> Sorted: {sorted_list} (key={key_func}, reverse={rev}, casefold={fold})")
+        except TypeError as e:
+            print(f"Error for input {original}: {e}")
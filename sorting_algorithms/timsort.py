@@ -14,9 +14,66 @@ stable and adaptive, powering Python's built-in sort() and sorted() functions.
 This implementation simplifies Timsort by using a fixed run size and basic merging, omitting
 advanced optimizations like galloping or dynamic run sizing for clarity. It supports custom
 comparators via 'key' and 'reverse' parameters, similar to Python's sorted() function.
+When network_cutoff is non-zero, runs of that many elements are sorted with a stable,
+unrolled sorting network (see sorting_networks.py) instead of Insertion Sort. When every
+key is an int, float, str or tuple of those, a specialised loop over precomputed keys is
+used (see type_specialization.py).
 """
 
-def timsort(arr, key=None, reverse=False):
+from sorting_algorithms.sorting_networks import MAX_NETWORK_SIZE, compile_network, network_sort
+from sorting_algorithms.type_specialization import sort_specialized
+
+NETWORK_CUTOFF = 16  # Run length sorted by a network (0 restores Insertion Sort runs)
+
+def _timsort_keys(keys, values, run_size, use_network):
+    """Ascending, stable simplified Timsort of values by precomputed, mutually comparable keys."""
+    n = len(keys)
+
+    # Step 1: Sort fixed-size runs with a network or Insertion Sort
+    for start in range(0, n, run_size):
+        end = min(start + run_size, n)
+        if use_network:
+            keys[start:end], values[start:end] = compile_network(end - start, stable=True)(
+                keys[start:end], values[start:end])
+            continue
+        for i in range(start + 1, end):
+            current_key = keys[i]
+            current_value = values[i]
+            j = i - 1
+            while j >= start and current_key < keys[j]:
+                keys[j + 1] = keys[j]
+                values[j + 1] = values[j]
+                j -= 1
+            keys[j + 1] = current_key
+            values[j + 1] = current_value
+
+    # Step 2: Merge neighbouring runs, doubling the run size each pass
+    size = run_size
+    while size < n:
+        for left in range(0, n, size * 2):
+            mid = min(left + size, n)
+            right = min(left + 2 * size, n)
+            if mid >= right:
+                continue
+            merged_keys, merged_values = [], []
+            i, j = left, mid
+            while i < mid and j < right:
+                # Taking from the right only when strictly smaller keeps the merge stable
+                if keys[j] < keys[i]:
+                    merged_keys.append(keys[j])
+                    merged_values.append(values[j])
+                    j += 1
+                else:
+                    merged_keys.append(keys[i])
+                    merged_values.append(values[i])
+                    i += 1
+            merged_keys += keys[i:mid] + keys[j:right]
+            merged_values += values[i:mid] + values[j:right]
+            keys[left:right] = merged_keys
+            values[left:right] = merged_values
+        size *= 2
+
+def timsort(arr, key=None, reverse=False, network_cutoff=NETWORK_CUTOFF):
     """
     Sorts the input list in ascending or descending order using a simplified Timsort.
 
@@ -25,12 +82,16 @@ def timsort(arr, key=None, reverse=False):
         key (callable, optional): A function to extract a comparison key from each element.
                                  Defaults to None (direct comparison).
         reverse (bool, optional): If True, sort in descending order. Defaults to False.
+        network_cutoff (int, optional): Run length sorted by a sorting network, up to
+                                        MAX_NETWORK_SIZE; 0 sorts runs of MIN_RUN with
+                                        Insertion Sort. Defaults to NETWORK_CUTOFF.
 
     Returns:
         list: The sorted list (same as input for convenience).
 
     Raises:
         TypeError: If elements are not comparable or key function is invalid.
+        ValueError: If network_cutoff is larger than MAX_NETWORK_SIZE.
     """
     if not arr:
         return arr  # Early return for empty lists
@@ -38,8 +99,18 @@ def timsort(arr, key=None, reverse=False):
     # Validate input types
     if key is not None and not callable(key):
         raise TypeError("key must be a callable function")
+    if network_cutoff > MAX_NETWORK_SIZE:
+        raise ValueError(f"network_cutoff must be at most {MAX_NETWORK_SIZE}")
 
     MIN_RUN = 32  # Minimum run size for Insertion Sort (typical range: 32–64)
+    run_size = network_cutoff if network_cutoff > 1 else MIN_RUN
+
+    # Fast path: homogeneous keys need no key calls, try/except or reverse checks per step
+    def sort_keys(keys, values):
+        _timsort_keys(keys, values, run_size, run_size == network_cutoff)
+
+    if sort_specialized(arr, key, reverse, True, sort_keys):
+        return arr
 
     def insertion_sort(start, end):
         """Sorts a small segment of the array using Insertion Sort."""
@@ -52,10 +123,10 @@ def timsort(arr, key=None, reverse=False):
                 while j >= start:
                     current_value = key(arr[j]) if key else arr[j]
                     if reverse:
-                        if current_value < key_value:
+                        if current_value >= key_value:
                             break
                     else:
-                        if current_value > key_value:
+                        if current_value <= key_value:
                             break
                     arr[j + 1] = arr[j]
                     j -= 1
@@ -96,14 +167,17 @@ def timsort(arr, key=None, reverse=False):
         return result
 
     try:
-        # Step 1: Divide array into runs and sort with Insertion Sort
+        # Step 1: Divide array into runs and sort with a network or Insertion Sort
         n = len(arr)
-        for start in range(0, n, MIN_RUN):
-            end = min(start + MIN_RUN - 1, n - 1)
-            insertion_sort(start, end)
+        for start in range(0, n, run_size):
+            end = min(start + run_size - 1, n - 1)
+            if run_size == network_cutoff:
+                network_sort(arr, start, end + 1, key=key, reverse=reverse, stable=True)
+            else:
+                insertion_sort(start, end)
 
         # Step 2: Merge runs using Merge Sort
-        size = MIN_RUN
+        size = run_size
         while size < n:
             for left in range(0, n, size * 2):
                 mid = min(left + size - 1, n - 1)
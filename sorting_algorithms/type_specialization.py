@@ -0,0 +1,146 @@
+"""
+Type-Specialised Sorting Fast Paths
+==================================
+This module lets the pure-Python sorts skip their generic comparison machinery when every
+key has the same simple type. The generic loops pay, on every comparison, for a key() call
+(or an "if key" test), a try/except TypeError wrapper and an "if reverse" branch. When a
+single pre-scan shows the keys are all int, all float (without NaN), all str, or all tuples
+of those, none of that is needed: keys are computed once, comparisons cannot raise, and the
+direction can be fixed before the loop starts. This mirrors the pre-scan CPython's list.sort
+does before choosing its unsafe_*_compare functions.
+
+- Pre-scan: O(n) type checks plus n key() calls, done once per sort
+- Fast path: the algorithm's own ascending loop over precomputed keys (same complexity)
+- Reverse: resolved outside the loop, preserving stability for the stable algorithms
+
+Each algorithm module supplies its ascending loop as a function of (keys, values), where
+values is the list being sorted. Both lists must be permuted identically; values is None
+when the elements are their own keys.
+"""
+
+def _key_kind(value):
+    """Returns 'int', 'float', 'str' or 'tuple' for a value the fast paths handle, else None."""
+    value_type = type(value)
+    if value_type is int:
+        return "int"
+    if value_type is float:
+        return None if value != value else "float"  # NaN breaks ordering
+    if value_type is str:
+        return "str"
+    if value_type is tuple:
+        return "tuple"
+    return None
+
+
+def homogeneous_kind(keys):
+    """
+    Scans the keys once and reports the single type they share.
+
+    Ints and floats may be mixed (the kind is then 'float'). Tuples must hold numbers or
+    strings, with the same category at each position across all tuples.
+
+    Args:
+        keys (list): The precomputed comparison keys.
+
+    Returns:
+        str or None: 'int', 'float', 'str' or 'tuple', or None if the keys are mixed,
+                     contain NaN, or have any other type.
+    """
+    if not keys:
+        return None
+
+    kind = _key_kind(keys[0])
+    if kind in ("int", "float"):
+        for k in keys:
+            k_type = type(k)
+            if k_type is float:
+                if k != k:
+                    return None
+                kind = "float"
+            elif k_type is not int:
+                return None
+        return kind
+
+    if kind == "str":
+        for k in keys:
+            if type(k) is not str:
+                return None
+        return kind
+
+    if kind == "tuple":
+        positions = []  # Per position: True for numbers, False for strings
+        for k in keys:
+            if type(k) is not tuple:
+                return None
+            for p, item in enumerate(k):
+                item_kind = _key_kind(item)
+                if item_kind not in ("int", "float", "str"):
+                    return None
+                is_number = item_kind != "str"
+                if p == len(positions):
+                    positions.append(is_number)
+                elif positions[p] != is_number:
+                    return None
+        return kind
+
+    return None
+
+
+def sort_specialized(arr, key, reverse, stable, ascending_sort, share_keys=False):
+    """
+    Runs an algorithm's ascending fast-path loop if the keys are homogeneous.
+
+    Args:
+        arr (list): The list to be sorted (modified in-place).
+        key (callable or None): The caller's key function.
+        reverse (bool): If True, the result is arranged in descending order.
+        stable (bool): Whether the algorithm is stable; a stable descending sort is done as
+                       reverse, sort ascending, reverse, so equal keys keep their order.
+        ascending_sort (callable): Function (keys, values) that sorts values in place by keys.
+        share_keys (bool, optional): If True and there is no key function, int and str
+                                     elements are sorted as their own keys (equal elements
+                                     are indistinguishable): ascending_sort receives
+                                     (arr, None) and only has to move the keys.
+                                     Defaults to False.
+
+    Returns:
+        bool: True if the fast path sorted arr, False if the caller must use its generic loop.
+    """
+    keys = [key(x) for x in arr] if key else arr
+    kind = homogeneous_kind(keys)
+    if kind is None:
+        return False
+
+    if keys is arr and share_keys and kind in ("int", "str"):
+        values = None  # The elements are their own keys
+    else:
+        if keys is arr:
+            keys = list(arr)  # 1 and 1.0, or equal tuples, can still be told apart
+        values = arr
+
+    if reverse and stable:
+        keys.reverse()
+        if values is not None:
+            values.reverse()
+    ascending_sort(keys, values)
+    if reverse:
+        arr.reverse()
+    return True
+
+# Example usage and testing
+if __name__ == "__main__":
+    # Test cases to demonstrate the homogeneity pre-scan
+    test_cases = [
+        [3, 1, 2],                      # All int
+        [3, 1.5, 2],                    # Mixed int/float
+        [1.0, float("nan")],            # NaN present
+        ["pear", "apple"],              # All str
+        [(1, "a"), (0, "b", 2.5)],      # Tuples with consistent positions
+        [(1, "a"), ("b", 1)],           # Tuples with clashing positions
+        [1, "a"],                       # Mixed types
+        [],                             # Empty list
+    ]
+
+    # Run and display results for each test case
+    for keys in test_cases:
+        print(f"Keys: {keys} -> Kind: {homogeneous_kind(keys)}")